@@ -0,0 +1,88 @@
+"""
+Environment file pentru Behave - setup și teardown
+"""
+
+from utils.driver_factory import WebDriverFactory, profile_from_tags
+from utils.startup_profiler import current_run_id, load_records, print_summary
+from utils.fixture_server import start_fixture_server, stop_fixture_server, uses_fixture_server
+from utils.har_archive import network_mode, replay_misses, save_recording
+from utils.network_events import network_events, network_events_requested
+from utils.wait_conditions import get_budget, print_budget_report
+from utils.request_blocker import get_size_cache, request_blocker, rulesets_from_tags
+from utils.resource_waterfall import ResourceWaterfall, save_waterfall, waterfall_enabled
+
+
+def before_all(context):
+    """Se execută înainte de toate testele"""
+    print("\n" + "="*60)
+    print("INÍCIO - Testare BDD cu Behave și Selenium")
+    print("="*60 + "\n")
+    # Rețea: live, record (arhivă HAR) sau replay (răspunsuri din arhivă)
+    if network_mode() != "live":
+        print(f"Network mode: {network_mode()}")
+    # Site-ul servit local din page.html / website_mens.html
+    if uses_fixture_server():
+        print(f"Fixture server: {start_fixture_server().base_url}")
+
+
+def before_scenario(context, scenario):
+    """Se execută înainte de fiecare scenariu"""
+    print(f"\n▶ Scenariul: {scenario.name}")
+    print("-" * 60)
+    # Profilul de browser: tag @profile-<nume> sau variabila BROWSER_PROFILE
+    context.browser_profile = profile_from_tags(scenario.effective_tags)
+    WebDriverFactory.use_profile(context.browser_profile.name)
+    # Blocarea cererilor: tag @block-<set> (pe feature sau scenariu) sau REQUEST_BLOCKING
+    context.block_rulesets = rulesets_from_tags(scenario.effective_tags)
+    WebDriverFactory.use_request_blocking(context.block_rulesets)
+    # Log-ul 'performance' doar pentru statusuri (@network-events), blocare sau waterfall
+    WebDriverFactory.use_network_events(
+        network_events_requested(scenario.effective_tags, context.block_rulesets) or waterfall_enabled()
+    )
+    session = WebDriverFactory.get_session()
+    if session is not None:
+        network_events(session.driver).reset()
+
+
+def after_scenario(context, scenario):
+    """Se execută după fiecare scenariu"""
+    session = WebDriverFactory.get_session()
+    if session is not None:
+        try:
+            block_report = request_blocker(session.driver).report()
+            if block_report.requests or context.block_rulesets:
+                print(f"Cereri blocate: {block_report}")
+        except Exception as e:
+            print(f"Warning: could not collect blocked requests: {e}")
+        # Resursele scenariului (durată, mărime, eșuate, blocante) - atașate apoi în raportul JSON
+        try:
+            waterfall = ResourceWaterfall.capture(session.driver)
+            if waterfall.entries:
+                save_waterfall(waterfall.to_record(scenario.name, str(scenario.location)))
+                print(f"Resurse: {waterfall.summary()}")
+        except Exception as e:
+            print(f"Warning: could not collect resource waterfall: {e}")
+    if scenario.status == "passed":
+        print("✓ Scenariul a trecut cu succes")
+    elif scenario.status == "failed":
+        print("✗ Scenariul a eșuat")
+    else:
+        print(f"? Status: {scenario.status}")
+
+
+def after_all(context):
+    """Se execută după toate testele"""
+    get_size_cache().save()
+    save_recording()
+    missing = replay_misses()
+    if missing:
+        print(f"Warning: {len(missing)} request(s) were not in the HAR archive, e.g. {missing[0]}")
+    WebDriverFactory.close_all_sessions()
+    stop_fixture_server()
+    # Durata fazelor de pornire Chrome (p50/p95) în această rulare
+    print_summary(load_records(run_id=current_run_id()))
+    # Timpul petrecut în pauze fixe vs. așteptări pe condiții
+    print_budget_report([get_budget().save()])
+    print("\n" + "="*60)
+    print("FINAL - Testare completată")
+    print("="*60 + "\n")
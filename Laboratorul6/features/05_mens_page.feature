@@ -3,11 +3,17 @@ Feature: Test Mens Page
   Background:
     Given I navigate to the Mens page
 
-  @smoke @normal
+  @smoke @normal @network-events
   Scenario: TC1 - Test page loads correctly
     Given the Mens page is loaded completely
     When I wait for page to load
     Then the page should load within 3 seconds
+    And the page timing should be within budget:
+      | metric                 | budget_ms |
+      | ttfb                   | 800       |
+      | first_contentful_paint | 1800      |
+      | dom_content_loaded     | 2500      |
+      | load                   | 3000      |
     And all main elements should be visible:
       | element    |
       | title      |
@@ -17,7 +23,7 @@ Feature: Test Mens Page
     And product images should be loaded
     And CSS and JS resources should be available
 
-  @high
+  @high @network-events
   Scenario: TC2 - Test navigation menu functionality
     Given the navigation menu is visible
     When I hover over each menu item
@@ -43,7 +49,7 @@ Feature: Test Mens Page
     And product data should be correctly fetched from database
     And product graphic consistency should be maintained
 
-  @low @failed
+  @low @failed @network-events
   Scenario: TC4 - Test Contact link in footer
     Given the footer is visible
     When I scroll to footer section
@@ -67,7 +73,7 @@ Feature: Test Mens Page
     And touch interactions should be accessible
     And buttons should be properly sized for touch
 
-  @high @failed
+  @high @failed @network-events
   Scenario: TC6 - Test search functionality
     Given the search bar is visible and active
     When I enter "shirt" in search field
@@ -5,99 +5,199 @@ Conține metode comune pentru interacțiune cu elementele web
 
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-import time
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from utils.browser_wait import browser_wait
+from utils.layout_audit import LayoutAudit
+from utils.network_events import network_events
+from utils.page_timing import PageTiming
+from utils.page_state import PageState, mark_dom_changed, page_generation
+from utils.wait_conditions import Condition, document_ready, scroll_settled, url_changed, wait_until
+
+
+# De câte ori se rezolvă din nou un element devenit stale înainte de a renunța
+STALE_RETRIES = 2
 
 
 class BasePage:
     """Clasa de bază pentru toate paginile"""
     
+    # Locatorii citiți de page_state() (paginile își declară elementele verificate în Then)
+    PAGE_STATE_LOCATORS = ()
+    
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
         self.actions = ActionChains(driver)
+        # Handle-urile găsite pe pagina curentă, per locator (golite la navigare)
+        self._element_cache = {}
+        self._page_state = None
+        self._layout_audit = None
     
     def log_step(self, message):
         """Logs a test step"""
         print(f"[STEP] {message}")
     
     def find_element(self, locator):
-        """Găsește un element folosind CSS selector"""
-        return self.driver.find_element("css selector", locator)
+        """Găsește un element folosind CSS selector (așteaptă explicit să apară)"""
+        # Cu implicit wait 0 (SYNC_MODE=explicit) așteptarea se face aici, nu în driver
+        element = self._wait_in_page("present", locator)
+        self._element_cache[locator] = element
+        return element
+    
+    def invalidate_elements(self):
+        """Golește cache-ul de elemente (după navigare)"""
+        self._element_cache.clear()
+        self.invalidate_state()
+    
+    def invalidate_state(self):
+        """Marchează DOM-ul ca modificat - următorul page_state() recitește pagina"""
+        self._page_state = None
+        self._layout_audit = None
+        mark_dom_changed(self.driver)
+    
+    def page_state(self, locators=None):
+        """Snapshot-ul paginii (PageState), refolosit până la navigare, o acțiune sau o mutație a DOM-ului"""
+        locators = tuple(locators) if locators is not None else self.PAGE_STATE_LOCATORS
+        state = self._page_state
+        current = state is not None and state.is_current(self.driver)
+        if not current or not state.covers(locators):
+            # Recitește și locatorii snapshot-ului anterior, ca pașii următori să rămână în memorie
+            known = tuple(state.elements) if current else ()
+            wanted = tuple(dict.fromkeys(self.PAGE_STATE_LOCATORS + known + locators))
+            state = PageState.capture(self.driver, wanted)
+            self._page_state = state
+        return state
+    
+    def _wait_in_page(self, kind, locator, timeout=10):
+        """Așteptare în pagină (browser_wait); ridică TimeoutException ca WebDriverWait"""
+        element = browser_wait(self.driver, kind, locator, timeout)
+        if not element:
+            raise TimeoutException(f"Element {locator} not {kind} after {timeout} seconds")
+        return element
+    
+    def _cached_element(self, locator, kind):
+        """Handle-ul din cache sau cel întors de așteptare (o singură căutare)"""
+        element = self._element_cache.get(locator)
+        if element is None:
+            element = self._wait_in_page(kind, locator)
+            self._element_cache[locator] = element
+        return element
+    
+    def _with_element(self, locator, action, kind="present"):
+        """Rulează action(element); un handle stale este eliminat și rezolvat din nou"""
+        for attempt in range(STALE_RETRIES + 1):
+            element = self._cached_element(locator, kind)
+            try:
+                return action(element)
+            except StaleElementReferenceException:
+                self._element_cache.pop(locator, None)
+                if attempt == STALE_RETRIES:
+                    raise
+    
+    def probe(self, locator):
+        """Primul element găsit imediat, fără așteptare (None dacă lipsește)"""
+        elements = self.find_elements(locator)
+        return elements[0] if elements else None
     
     def find_elements(self, locator):
         """Găsește mai multe elemente folosind CSS selector"""
         return self.driver.find_elements("css selector", locator)
     
+    def layout_audit(self):
+        """Auditul de layout (LayoutAudit) al viewport-ului curent, refolosit până la următoarea modificare a DOM-ului"""
+        generation = page_generation(self.driver)
+        if self._layout_audit is None or self._layout_audit[0] != generation:
+            self._layout_audit = (generation, LayoutAudit.capture(self.driver))
+        return self._layout_audit[1]
+    
     def click(self, locator):
         """Face click pe un element"""
-        self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, locator)))
-        element = self.find_element(locator)
-        element.click()
-        return True
+        self.invalidate_state()
+        def click_element(element):
+            try:
+                element.click()
+            except (ElementNotInteractableException, ElementClickInterceptedException):
+                # Handle-ul din cache poate fi încă ascuns (ex: modal în animație)
+                self.wait.until(EC.element_to_be_clickable(element)).click()
+            return True
+        return self._with_element(locator, click_element, "clickable")
     
     def type_text(self, locator, text):
         """Scrie text într-un câmp"""
-        self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, locator)))
-        element = self.find_element(locator)
-        element.clear()
-        element.send_keys(text)
-        return True
+        self.invalidate_state()
+        def type_into(element):
+            element.clear()
+            element.send_keys(text)
+            return True
+        return self._with_element(locator, type_into)
     
     def get_text(self, locator):
         """Obține textul dintr-un element"""
-        self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, locator)))
-        element = self.find_element(locator)
-        return element.text.strip()
+        return self._with_element(locator, lambda element: element.text.strip())
     
     def is_displayed(self, locator):
         """Verifică dacă un element este vizibil"""
         try:
-            element = self.find_element(locator)
-            return element.is_displayed()
+            element = self.probe(locator)
+            return element is not None and element.is_displayed()
         except:
             return False
     
     def is_enabled(self, locator):
         """Verifică dacă un element este activ"""
         try:
-            element = self.find_element(locator)
-            return element.is_enabled()
+            element = self.probe(locator)
+            return element is not None and element.is_enabled()
         except:
             return False
     
     def wait_for_element(self, locator, timeout=10):
         """Așteptă ca un element să apară"""
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, locator))
-            )
-            return True
-        except:
-            return False
+        return bool(browser_wait(self.driver, "present", locator, timeout))
+    
+    def wait_for_visible(self, locator, timeout=10):
+        """Așteaptă ca un element să fie vizibil"""
+        return bool(browser_wait(self.driver, "visible", locator, timeout))
+    
+    def wait_for_text(self, locator, text, timeout=10):
+        """Așteaptă ca un text să apară într-un element"""
+        return bool(browser_wait(self.driver, "text", locator, timeout, text=text))
+    
+    def wait_for_element_to_disappear(self, locator, timeout=10):
+        """Așteaptă ca un element să fie ascuns sau eliminat"""
+        return bool(browser_wait(self.driver, "invisible", locator, timeout))
+    
+    def wait_for_url_contains(self, fragment, timeout=10):
+        """Așteaptă ca URL-ul să conțină un fragment"""
+        return bool(browser_wait(self.driver, "url_contains", timeout=timeout, text=fragment))
     
     def clear_field(self, locator):
         """Șterge conținutul unui câmp"""
-        element = self.find_element(locator)
-        element.clear()
-        return True
+        self.invalidate_state()
+        return self._with_element(locator, lambda element: element.clear() or True)
     
     def submit_form(self, locator):
         """Trimite un formular"""
-        element = self.find_element(locator)
-        element.submit()
-        return True
+        self.invalidate_state()
+        return self._with_element(locator, lambda element: element.submit() or True)
     
     def switch_to_modal(self, modal_locator):
         """Comută pe o modalitate"""
-        self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, modal_locator)))
+        self._wait_in_page("present", modal_locator)
         return True
     
-    def close_modal(self, close_button_locator):
-        """Închide o modalitate"""
+    def close_modal(self, close_button_locator, modal_locator=None):
+        """Închide o modalitate (și așteaptă să dispară, dacă se dă modal_locator)"""
         self.click(close_button_locator)
+        if modal_locator:
+            self.wait_for_element_to_disappear(modal_locator)
         return True
     
     def scroll_to_element(self, element_or_locator):
@@ -109,31 +209,70 @@ class BasePage:
             element = element_or_locator
         
         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(0.5)
+        wait_until(self.driver, scroll_settled(element), timeout=2)
         return True
+
+    def get_page_timing(self, timeout=10):
+        """Metricile de încărcare (PageTiming: TTFB, DOMContentLoaded, load, FCP) după terminarea evenimentului load"""
+        timing = PageTiming.capture(self.driver)
+        if not timing.complete:
+            def load_finished(driver):
+                current = PageTiming.capture(driver)
+                return current if current.complete else False
+            timing = wait_until(self.driver, Condition("load_timing", load_finished), timeout) or timing
+        return timing
+    
+    @property
+    def last_response_status(self):
+        """Statusul HTTP al ultimului document principal (None fără evenimente de rețea)"""
+        events = network_events(self.driver)
+        events.drain()
+        response = events.main_document_response()
+        return int(response['status']) if response and response.get('status') is not None else None
+    
+    @property
+    def failed_requests(self):
+        """Cererile eșuate ale paginii curente (FailedRequest: status >= 400 sau eroare de rețea)"""
+        events = network_events(self.driver)
+        events.drain()
+        # Doar navigarea documentului principal curent - erorile paginilor anterioare nu contează
+        return events.failed_requests(events.main_document_loader())
+    
+    def wait_for_navigation(self, old_url, timeout=2):
+        """Așteaptă schimbarea URL-ului și încărcarea completă a paginii noi"""
+        self.invalidate_elements()
+        # Un link către pagina curentă nu schimbă URL-ul - se oprește la timeout
+        if not wait_until(self.driver, url_changed(old_url), timeout):
+            return False
+        return bool(wait_until(self.driver, document_ready(), 10))
     
     def get_attribute(self, locator, attribute):
         """Obține valoarea unui atribut"""
-        element = self.find_element(locator)
-        return element.get_attribute(attribute)
+        return self._with_element(locator, lambda element: element.get_attribute(attribute))
     
     def select_checkbox(self, locator):
         """Selectează un checkbox"""
-        element = self.find_element(locator)
-        if not element.is_selected():
-            element.click()
-        return True
+        self.invalidate_state()
+        def select(element):
+            if not element.is_selected():
+                element.click()
+            return True
+        return self._with_element(locator, select)
     
     def deselect_checkbox(self, locator):
         """Deselectează un checkbox"""
-        element = self.find_element(locator)
-        if element.is_selected():
-            element.click()
-        return True
+        self.invalidate_state()
+        def deselect(element):
+            if element.is_selected():
+                element.click()
+            return True
+        return self._with_element(locator, deselect)
     
     def select_radio_button(self, locator):
         """Selectează un radio button"""
-        element = self.find_element(locator)
-        if not element.is_selected():
-            element.click()
-        return True
+        self.invalidate_state()
+        def select(element):
+            if not element.is_selected():
+                element.click()
+            return True
+        return self._with_element(locator, select)
@@ -4,6 +4,7 @@ Home Page - pagina principală cu butoane Sign In și Sign Up
 
 from pages.base_page import BasePage
 from utils.locators import Locators
+from utils.fixture_server import page_url
 
 
 class HomePage(BasePage):
@@ -13,9 +14,10 @@ class HomePage(BasePage):
         super().__init__(driver)
         self.page_title = "Elite Shoppy"
     
-    def open(self, url):
-        """Deschide pagina principală"""
-        self.driver.get(url)
+    def open(self, url=None):
+        """Deschide pagina principală (implicit cea de la ELITE_SHOPPY_BASE_URL)"""
+        self.invalidate_elements()
+        self.driver.get(url or page_url("/"))
         self.wait_for_element(Locators.SIGN_IN_BUTTON)
         return True
     
@@ -72,4 +74,4 @@ class HomePage(BasePage):
     
     def sort_products(self, sort_value):
         """Sortează produsele"""
-        return self.driver.find_element("css selector", Locators.SORT_DROPDOWN).send_keys(sort_value)
+        return self.find_element(Locators.SORT_DROPDOWN).send_keys(sort_value)
@@ -46,7 +46,7 @@ class LoginPage(BasePage):
     
     def close_login_modal(self):
         """Închide modalul de login"""
-        return self.close_modal(Locators.LOGIN_MODAL_CLOSE)
+        return self.close_modal(Locators.LOGIN_MODAL_CLOSE, Locators.LOGIN_MODAL)
     
     def login(self, username, email):
         """Efectuează login cu datele furnizate"""
@@ -3,22 +3,81 @@ Page Object Model pentru pagina Mens
 """
 from pages.base_page import BasePage
 from utils.locators import Locators
+from utils.element_batch import inspect_elements
+from utils.fixture_server import page_url
+from utils.resource_waterfall import ResourceWaterfall
+from utils.viewport_matrix import MIN_TOUCH_SIZE, TOUCH_TARGETS, run_viewport_matrix
+from utils.wait_conditions import document_ready, viewport_resized, wait_until
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+
+
+# Toate cardurile de produs într-un singur apel (în loc de câte un find_element per câmp)
+PRODUCT_RECORDS_SCRIPT = """
+function text(card, selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var el = card.querySelector(selectors[i]);
+        if (el) return (el.innerText || el.textContent || '').trim();
+    }
+    return null;
+}
+return Array.from(document.querySelectorAll(arguments[0])).map(function (card) {
+    var img = card.querySelector('img');
+    return {
+        title: text(card, ['h4', 'h5']),
+        price: text(card, ['.item_price', '.price']),
+        image_src: img ? img.src : null,
+        image_loaded: !!img && img.complete && img.naturalWidth > 0,
+        has_submit: !!card.querySelector('input[type="submit"]')
+    };
+});
+"""
+
+
+def has_image(record):
+    """Produsul are o imagine cu src"""
+    return bool((record.get('image_src') or '').strip())
+
+
+def is_image_loaded(info):
+    """Imaginea din inspect_elements este vizibilă și încărcată (complete, naturalWidth > 0)"""
+    if not info or not info['displayed']:
+        return False
+    attributes = info['attributes']
+    return (bool((attributes.get('src') or '').strip()) and attributes.get('complete') is True
+            and (attributes.get('naturalWidth') or 0) > 0)
+
+
+PRODUCT_FIELD_CHECKS = {
+    'image': has_image,
+    'title': lambda record: record.get('title') is not None,
+    'price': lambda record: record.get('price') is not None,
+    'action_button': lambda record: bool(record.get('has_submit')),
+}
 
 
 class MensPage(BasePage):
     """Page Object pentru pagina Mens a site-ului Elite Shoppy"""
     
+    # Elementele verificate de pașii Then (citite toate într-un singur snapshot)
+    PAGE_STATE_LOCATORS = (
+        Locators.HEADER,
+        Locators.NAVIGATION_MENU,
+        Locators.PRODUCT_ITEMS,
+        Locators.SEARCH_BAR,
+        Locators.FOOTER,
+        TOUCH_TARGETS,
+    )
+    
     def __init__(self, driver):
         super().__init__(driver)
-        self.mens_url = "https://adoring-pasteur-3ae17d.netlify.app/mens"
+        self.mens_url = page_url("/mens")
         
     def open(self):
         """Deschide pagina Mens"""
+        self.invalidate_elements()
         self.driver.get(self.mens_url)
         self.log_step(f"Navigated to Mens page: {self.mens_url}")
         return self
@@ -36,11 +95,12 @@ class MensPage(BasePage):
             return False
     
     def get_page_load_time(self):
-        """Obține timpul de încărcare a paginii"""
-        start_time = time.time()
-        self.is_mens_page_loaded()
-        load_time = time.time() - start_time
-        return load_time
+        """Obține timpul de încărcare a paginii (secunde, loadEventEnd din Navigation Timing)"""
+        timing = self.get_page_timing()
+        self.log_step(f"Page timing: {timing}")
+        if timing.metrics['load'] is None:
+            return float('inf')
+        return timing.metrics['load'] / 1000
     
     def are_all_elements_visible(self):
         """Verifică dacă toate elementele majore sunt vizibile"""
@@ -50,33 +110,38 @@ class MensPage(BasePage):
             'footer': Locators.FOOTER
         }
         
+        state = self.page_state()
         for element_name, locator in elements_to_check.items():
-            try:
-                element = self.find_element(locator)
-                # For footer, we only check if it exists on the page, not if it's visible on screen
-                if element_name == 'footer':
-                    # Footer exists, that's good enough
-                    continue
-                elif not self.is_displayed(locator):
-                    self.log_step(f"Element {element_name} not visible")
-                    return False
-            except:
+            if not state.is_present(locator):
                 self.log_step(f"Element {element_name} not found")
                 return False
+            # For footer, we only check if it exists on the page, not if it's visible on screen
+            if element_name == 'footer':
+                # Footer exists, that's good enough
+                continue
+            elif not state.is_displayed(locator):
+                self.log_step(f"Element {element_name} not visible")
+                return False
         
         self.log_step("All main elements are visible")
         return True
     
     def are_product_images_loaded(self):
-        """Verifică dacă imaginile produselor sunt încărcate"""
+        """Verifică dacă imaginile produselor sunt încărcate și vizibile (o imagine ruptă / 404 nu trece)"""
         try:
-            images = self.find_elements(Locators.PRODUCT_IMAGE)
+            # Cu page_load_strategy 'eager' imaginile se pot încărca încă - evenimentul load le așteaptă
+            wait_until(self.driver, document_ready(), timeout=10)
+            images = inspect_elements(self.driver, Locators.PRODUCT_IMAGE,
+                                      attributes=('src', 'complete', 'naturalWidth'))
             if not images:
                 return False
             
-            for img in images:
-                if not img.get_attribute('src') or img.get_attribute('src').strip() == '':
-                    return False
+            broken = [image for image in images if not is_image_loaded(image)]
+            for image in broken[:5]:
+                src = image['attributes'].get('src') if image else None
+                self.log_step(f"Product image not loaded or not visible: {src}")
+            if broken:
+                return False
             
             self.log_step(f"All {len(images)} product images loaded successfully")
             return True
@@ -85,19 +150,23 @@ class MensPage(BasePage):
             return False
     
     def are_resources_available(self):
-        """Verifică disponibilitatea resurselor externe (CSS, JS)"""
+        """Verifică disponibilitatea resurselor externe (CSS, JS) din waterfall-ul de resurse"""
         try:
-            # Verificare CSS
-            css_elements = self.driver.execute_script(
+            waterfall = ResourceWaterfall.capture(self.driver)
+            failed = [entry for entry in waterfall.failed if entry.kind in ("css", "js")]
+            if failed:
+                self.log_step(f"Failed resources: {', '.join(f'{e.url} ({e.status or e.error})' for e in failed)}")
+                return False
+            # Stilurile / scripturile inline nu apar în waterfall
+            css_elements = bool(waterfall.of_kind("css")) or self.driver.execute_script(
                 "return document.styleSheets.length > 0"
             )
-            # Verificare JS
-            js_loaded = self.driver.execute_script(
+            js_loaded = bool(waterfall.of_kind("js")) or self.driver.execute_script(
                 "return typeof jQuery !== 'undefined' || document.querySelector('script')"
             )
             
-            self.log_step("External resources (CSS, JS) are available")
-            return css_elements and js_loaded
+            self.log_step(f"External resources (CSS, JS) are available: {len(waterfall.entries)} resource(s)")
+            return bool(css_elements and js_loaded)
         except Exception as e:
             self.log_step(f"Error checking resources: {str(e)}")
             return False
@@ -110,7 +179,7 @@ class MensPage(BasePage):
     
     def is_navigation_menu_visible(self):
         """Verifică dacă meniul de navigare este vizibil"""
-        return self.is_displayed(Locators.NAVIGATION_MENU)
+        return self.page_state().is_displayed(Locators.NAVIGATION_MENU)
     
     def hover_over_menu_item(self, menu_item_name):
         """Face hover pe un element din meniu"""
@@ -122,6 +191,8 @@ class MensPage(BasePage):
         );
         """)
         if element:
+            # Hover-ul deschide dropdown-uri - snapshot-ul nu mai este valabil
+            self.invalidate_state()
             ActionChains(self.driver).move_to_element(element).perform()
             self.log_step(f"Hovered over {menu_item_name}")
             return True
@@ -137,9 +208,10 @@ class MensPage(BasePage):
         );
         """)
         if element:
+            old_url = self.get_current_url()
             element.click()
             self.log_step(f"Clicked on {link_name} link")
-            time.sleep(2)  # Așteptare redirecționare
+            self.wait_for_navigation(old_url)
             return True
         return False
     
@@ -161,14 +233,16 @@ class MensPage(BasePage):
         return 'index' in current_url or current_url.endswith('.html') is False
     
     def no_error_status_codes(self):
-        """Verifică dacă nu sunt erori 404 sau 500"""
-        try:
-            # În Selenium, nu putem verifica HTTP status codes direct
-            # Verificăm dacă pagina nu conține mesaje de eroare
-            page_source = self.driver.page_source.lower()
-            return '404' not in page_source and '500' not in page_source
-        except:
+        """Verifică dacă nu sunt erori 404 sau 500 (statusurile reale din evenimentele de rețea)"""
+        status = self.last_response_status
+        if status is None:
+            self.log_step("No network events captured - status codes unknown")
             return True
+        errors = [request for request in self.failed_requests
+                  if request.status is not None and (request.status == 404 or request.status >= 500)]
+        for request in errors[:5]:
+            self.log_step(f"HTTP {request.status}: {request.url}")
+        return status < 400 and not errors
     
     # ===== PRODUCTS =====
     
@@ -176,6 +250,17 @@ class MensPage(BasePage):
         """Obține toate produsele din pagină"""
         return self.find_elements(Locators.PRODUCT_ITEMS)
     
+    def get_product_records(self):
+        """Toate produsele ca dicționare (title, price, image_src, image_loaded, has_submit), dintr-un singur script"""
+        records = self.driver.execute_script(PRODUCT_RECORDS_SCRIPT, Locators.PRODUCT_ITEMS) or []
+        self.log_step(f"Read {len(records)} product records")
+        return records
+    
+    def get_product_record(self, index):
+        """Înregistrarea unui produs (None dacă index-ul nu există)"""
+        records = self.get_product_records()
+        return records[index] if index < len(records) else None
+    
     def get_product_count(self):
         """Obține numărul total de produse"""
         products = self.get_all_products()
@@ -193,38 +278,18 @@ class MensPage(BasePage):
     
     def get_product_title(self, index):
         """Obține titlul unui produs"""
-        products = self.get_all_products()
-        if index < len(products):
-            try:
-                # Try h4 first (actual structure), then h5
-                try:
-                    return products[index].find_element(By.TAG_NAME, 'h4').text
-                except:
-                    return products[index].find_element(By.TAG_NAME, 'h5').text
-            except:
-                return None
-        return None
+        record = self.get_product_record(index)
+        return record['title'] if record else None
     
     def get_product_price(self, index):
         """Obține prețul unui produs"""
-        products = self.get_all_products()
-        if index < len(products):
-            try:
-                # Try item_price first (actual structure), then .price
-                try:
-                    price_element = products[index].find_element(By.CLASS_NAME, 'item_price')
-                    return price_element.text
-                except:
-                    price_element = products[index].find_element(By.CLASS_NAME, 'price')
-                    return price_element.text
-            except:
-                return None
-        return None
+        record = self.get_product_record(index)
+        return record['price'] if record else None
     
     def does_product_have_image(self, index):
         """Verifică dacă un produs are imagine"""
-        img = self.get_product_image(index)
-        return img is not None and img.get_attribute('src') != ''
+        record = self.get_product_record(index)
+        return has_image(record) if record else False
     
     def does_product_have_title(self, index):
         """Verifică dacă un produs are titlu"""
@@ -236,26 +301,26 @@ class MensPage(BasePage):
     
     def does_product_have_action_button(self, index):
         """Verifică dacă un produs are buton de acțiune (Add to Cart)"""
-        products = self.get_all_products()
-        if index < len(products):
-            try:
-                # Look for input type=submit in the product
-                buttons = products[index].find_elements(By.CSS_SELECTOR, 'input[type="submit"]')
-                return len(buttons) > 0
-            except:
-                return False
-        return False
+        record = self.get_product_record(index)
+        return record['has_submit'] if record else False
+    
+    def products_missing_fields(self, records=None, fields=('image', 'title', 'price')):
+        """Lista (index, câmp) pentru produsele cărora le lipsește un câmp obligatoriu"""
+        records = self.get_product_records() if records is None else records
+        missing = []
+        for i, record in enumerate(records):
+            for field in fields:
+                if not PRODUCT_FIELD_CHECKS[field](record):
+                    missing.append((i, field))
+        return missing
     
     def all_products_have_required_fields(self):
         """Verifică dacă toate produsele au câmpurile obligatorii"""
-        product_count = self.get_product_count()
-        for i in range(product_count):
-            if not (self.does_product_have_image(i) and 
-                    self.does_product_have_title(i) and
-                    self.does_product_have_price(i)):
-                return False
+        records = self.get_product_records()
+        if self.products_missing_fields(records):
+            return False
         
-        self.log_step(f"All {product_count} products have required fields")
+        self.log_step(f"All {len(records)} products have required fields")
         return True
     
     def scroll_to_products(self):
@@ -268,7 +333,7 @@ class MensPage(BasePage):
     
     def is_search_bar_visible(self):
         """Verifică dacă bara de căutare este vizibilă"""
-        return self.is_displayed(Locators.SEARCH_BAR)
+        return self.page_state().is_displayed(Locators.SEARCH_BAR)
     
     def is_search_bar_active(self):
         """Verifică dacă bara de căutare este activă"""
@@ -277,6 +342,7 @@ class MensPage(BasePage):
     
     def enter_search_term(self, search_term):
         """Introdu un termen în bara de căutare"""
+        self.invalidate_state()
         search_bar = self.find_element(Locators.SEARCH_BAR)
         search_bar.clear()
         search_bar.send_keys(search_term)
@@ -284,6 +350,7 @@ class MensPage(BasePage):
     
     def submit_search(self):
         """Submitează căutarea"""
+        old_url = self.get_current_url()
         try:
             # Încearcă buton search
             self.click(Locators.SEARCH_BUTTON)
@@ -294,7 +361,7 @@ class MensPage(BasePage):
             search_bar.submit()
             self.log_step("Submitted search via Enter key")
         
-        time.sleep(2)  # Așteptare rezultate
+        self.wait_for_navigation(old_url)
     
     def are_search_results_displayed(self):
         """Verifică dacă rezultatele de căutare sunt afișate"""
@@ -306,20 +373,25 @@ class MensPage(BasePage):
     
     def is_page_not_found_displayed(self):
         """Verifică dacă este afișat mesaj "Page not Found" """
+        status = self.last_response_status
+        if status is not None:
+            return status in (404, 410)
+        # Fără evenimente de rețea: doar titlul paginii, nu tot page_source
         try:
-            page_source = self.driver.page_source.lower()
-            return 'not found' in page_source or '404' in page_source
+            title = self.driver.execute_script("return document.title || ''").lower()
+            return 'not found' in title or '404' in title
         except:
             return False
     
     def search_returns_relevant_products(self, search_term):
         """Verifică dacă căutarea returnează produse relevante"""
         products = self.get_all_products()
-        page_source = self.driver.page_source.lower()
-        search_term_lower = search_term.lower()
         
-        # Verificare dacă search_term apare pe pagină
-        return search_term_lower in page_source and len(products) > 0
+        # Verificare dacă search_term apare pe pagină (căutat în browser, fără transferul page_source)
+        found = self.driver.execute_script(
+            "return (document.body.innerText + ' ' + document.title).toLowerCase().indexOf(arguments[0]) !== -1;",
+            search_term.lower())
+        return bool(found) and len(products) > 0
     
     # ===== FOOTER =====
     
@@ -331,13 +403,14 @@ class MensPage(BasePage):
     
     def is_footer_visible(self):
         """Verifică dacă footer-ul este vizibil"""
-        return self.is_displayed(Locators.FOOTER)
+        return self.page_state().is_displayed(Locators.FOOTER)
     
     def click_contact_link(self):
         """Face click pe linkul Contact din footer"""
+        old_url = self.get_current_url()
         self.click(Locators.FOOTER_CONTACT_LINK)
         self.log_step("Clicked on Contact link in footer")
-        time.sleep(1)
+        self.wait_for_navigation(old_url, timeout=1)
     
     def is_on_contact_page(self):
         """Verifică dacă suntem pe pagina de Contact"""
@@ -348,8 +421,11 @@ class MensPage(BasePage):
     
     def resize_window(self, width, height):
         """Redimensionează fereastra la rezoluția specificată"""
-        self.driver.set_window_size(width, height)
-        time.sleep(1)
+        if self.driver.get_window_size() != {"width": width, "height": height}:
+            previous_size = self.driver.execute_script("return [window.innerWidth, window.innerHeight];")
+            self.invalidate_state()
+            self.driver.set_window_size(width, height)
+            wait_until(self.driver, viewport_resized(previous_size), timeout=1)
         self.log_step(f"Resized window to {width}x{height}")
     
     def set_desktop_resolution(self):
@@ -364,38 +440,36 @@ class MensPage(BasePage):
         """Setează rezoluție mobil (375x667)"""
         self.resize_window(375, 667)
     
+    def check_viewport_matrix(self, viewports=None):
+        """Verificările de layout pentru toate rezoluțiile odată (tab-uri cu emulare CDP, încărcate în paralel)"""
+        matrix = run_viewport_matrix(self.driver, self.get_current_url(), viewports,
+                                     locators=self.PAGE_STATE_LOCATORS)
+        self.log_step(f"Viewport matrix:\n{matrix.summary()}")
+        return matrix
+    
     def has_horizontal_scroll(self):
         """Verifică dacă pagina are scroll orizontal"""
-        page_width = self.driver.execute_script(
-            "return Math.max(document.body.scrollWidth, document.documentElement.scrollWidth)"
-        )
-        window_width = self.driver.execute_script(
-            "return window.innerWidth"
-        )
-        return page_width > window_width
+        return self.page_state().has_horizontal_scroll()
     
     def has_overlapping_elements(self):
         """Verifică dacă sunt elemente suprapuse"""
-        try:
-            # Verificare simplă: elemente importante nu trebuie ascunse
-            main_elements = [
-                Locators.HEADER,
-                Locators.NAVIGATION_MENU,
-                Locators.PRODUCT_ITEMS,
-                Locators.FOOTER
-            ]
-            
-            for element_locator in main_elements:
-                try:
-                    element = self.find_element(element_locator)
-                    if not element.is_displayed():
-                        return True
-                except:
-                    pass
-            
-            return False
-        except:
-            return False
+        # Verificare simplă: elemente importante nu trebuie ascunse
+        main_elements = [
+            Locators.HEADER,
+            Locators.NAVIGATION_MENU,
+            Locators.PRODUCT_ITEMS,
+            Locators.FOOTER
+        ]
+        state = self.page_state()
+        if any(state.is_present(locator) and not state.is_displayed(locator) for locator in main_elements):
+            return True
+        
+        # Link-uri, butoane și câmpuri care se acoperă între ele în viewport-ul curent
+        audit = self.layout_audit()
+        if audit.overlaps:
+            self.log_step(f"{len(audit.overlaps)} overlapping interactive element(s): {audit.describe_overlaps()}")
+            return True
+        return False
     
     def is_layout_correct(self):
         """Verifică dacă layout-ul este corect"""
@@ -403,29 +477,14 @@ class MensPage(BasePage):
     
     def can_scroll_vertically(self):
         """Verifică dacă se poate face scroll vertical"""
-        page_height = self.driver.execute_script(
-            "return Math.max(document.body.scrollHeight, document.documentElement.scrollHeight)"
-        )
-        window_height = self.driver.execute_script(
-            "return window.innerHeight"
-        )
-        return page_height > window_height
+        return self.page_state().has_vertical_scroll()
     
     def are_buttons_touch_accessible(self):
         """Verifică dacă butoanele sunt accesibile la touch"""
-        buttons = self.find_elements('button, input[type="button"], input[type="submit"], a.button')
-        
-        MIN_TOUCH_SIZE = 44  # pixels - recomandare pentru touch targets
-        
-        for button in buttons:
-            try:
-                width = button.rect['width']
-                height = button.rect['height']
-                
-                if width < MIN_TOUCH_SIZE or height < MIN_TOUCH_SIZE:
-                    return False
-            except:
-                pass
+        # Doar țintele vizibile (butoanele din modale închise nu pot fi atinse)
+        for rect in self.page_state().rects(TOUCH_TARGETS, displayed_only=True):
+            if rect['width'] < MIN_TOUCH_SIZE or rect['height'] < MIN_TOUCH_SIZE:
+                return False
         
         self.log_step("All buttons have adequate size for touch interaction")
         return True
@@ -62,7 +62,7 @@ class SignUpPage(BasePage):
     
     def close_signup_modal(self):
         """Închide modalul de Sign Up"""
-        return self.close_modal(Locators.LOGIN_MODAL_CLOSE)
+        return self.close_modal(Locators.LOGIN_MODAL_CLOSE, Locators.SIGNUP_MODAL)
     
     def signup(self, name, email, password, confirm_password):
         """Efectuează înregistrarea cu datele furnizate"""
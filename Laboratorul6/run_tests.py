@@ -16,21 +16,35 @@ print("="*70)
 print("Testele se vor executa secvential pe website-ul real.")
 print("Deschide browserul Chrome si urmareste executia!\n")
 
-# Get arguments
-test_type = sys.argv[1] if len(sys.argv) > 1 else '--mens'
+# Get arguments: --workers N (rulare paralela) si --by feature|scenario
+args = sys.argv[1:]
+workers = 1
+granularity = 'feature'
+if '--workers' in args:
+    index = args.index('--workers')
+    workers = int(args[index + 1])
+    del args[index:index + 2]
+if '--by' in args:
+    index = args.index('--by')
+    granularity = args[index + 1]
+    del args[index:index + 2]
+
+test_type = args[0] if args else '--mens'
 
 if test_type == '--mens':
     print(">> Ruleaza: TESTELE PAGINII MENS (TC1-TC6)\n")
-    cmd = [sys.executable, '-m', 'behave', 'features/05_mens_page.feature', '--no-capture', '--format=json', '--outfile=test_results.json']
+    feature_path, tag_args = 'features/05_mens_page.feature', []
 elif test_type == '--passed':
     print(">> Ruleaza: TESTELE REUSUITE (TC1, TC2, TC3, TC5)\n")
-    cmd = [sys.executable, '-m', 'behave', 'features/05_mens_page.feature', '--no-capture', '--tags', '~@failed', '--format=json', '--outfile=test_results.json']
+    feature_path, tag_args = 'features/05_mens_page.feature', ['--tags', '~@failed']
 elif test_type == '--failed':
     print(">> Ruleaza: TESTELE ESUITE (TC4, TC6)\n")
-    cmd = [sys.executable, '-m', 'behave', 'features/05_mens_page.feature', '--no-capture', '--tags', '@failed', '--format=json', '--outfile=test_results.json']
+    feature_path, tag_args = 'features/05_mens_page.feature', ['--tags', '@failed']
 else:
     print(">> Ruleaza: TESTE CUSTOM\n")
-    cmd = [sys.executable, '-m', 'behave', 'features', '--no-capture', '--format=json', '--outfile=test_results.json']
+    feature_path, tag_args = 'features', []
+
+cmd = [sys.executable, '-m', 'behave', feature_path, '--no-capture'] + tag_args + ['--format=json', '--outfile=test_results.json']
 
 # Set environment for UTF-8
 env = os.environ.copy()
@@ -39,9 +53,28 @@ env['PYTHONIOENCODING'] = 'utf-8'
 # Change to project directory
 project_root = Path(__file__).parent
 os.chdir(project_root)
+sys.path.insert(0, str(project_root))
+
+from utils.resource_waterfall import attach_waterfalls, load_waterfalls
+from utils.startup_profiler import current_run_id
+
+# Procesul behave / workerii mostenesc STARTUP_RUN_ID - waterfall-urile sunt filtrate dupa el
+env['STARTUP_RUN_ID'] = current_run_id()
 
 # Run behave
-result = subprocess.run(cmd, env=env, capture_output=True, text=True)
+if workers > 1:
+    from utils.parallel_runner import run_parallel
+    print(f">> {workers} workeri paraleli (Chrome headless), impartire pe {granularity}\n")
+    result = subprocess.CompletedProcess(cmd, run_parallel(
+        workers, 'test_results.json', paths=feature_path,
+        granularity=granularity, extra_args=tag_args,
+        history_files=['test_results.json', 'test_output.json']
+    ))
+else:
+    result = subprocess.run(cmd, env=env, capture_output=True, text=True)
+
+# Resursele fiecarui scenariu in raportul JSON (cheia 'resource_waterfall')
+attach_waterfalls('test_results.json', load_waterfalls(run_id=current_run_id()))
 
 # Don't print behave output - only show results table
 # (result.stdout and result.stderr are suppressed)
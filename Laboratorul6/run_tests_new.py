@@ -24,6 +24,10 @@ sys.path.insert(0, str(project_root / 'utils'))
 sys.path.insert(0, str(project_root / 'steps'))
 
 from behave.__main__ import main as behave_main
+from utils.parallel_runner import run_parallel
+from utils.resource_waterfall import attach_waterfalls, load_waterfalls
+from utils.startup_profiler import current_run_id, load_records, print_summary
+from utils.wait_conditions import load_budgets, print_budget_report
 
 
 def run_behave_with_json(feature_file=None, tags=None, output_file='test_output.json'):
@@ -45,7 +49,31 @@ def run_behave_with_json(feature_file=None, tags=None, output_file='test_output.
     if tags:
         argv.extend(['--tags', tags])
     
-    return behave_main(argv)
+    current_run_id()
+    result = behave_main(argv)
+    # Resursele fiecarui scenariu (cele mai lente / mari, esuate, blocante) in raportul JSON
+    attach_waterfalls(output_file, load_waterfalls(run_id=current_run_id()))
+    return result
+
+
+def run_parallel_tests(workers, feature_file=None, tags=None, granularity='feature',
+                       output_file='test_output.json'):
+    """Run behave on several headless workers and merge their JSON outputs"""
+    print("\n" + "="*70)
+    print(f"EXECUTA TESTELE PE {workers} WORKERI PARALELI ({granularity})")
+    print("="*70 + "\n")
+    
+    tag_args = ['--tags', tags] if tags else []
+    current_run_id()  # workerii mostenesc STARTUP_RUN_ID
+    # Duratele din rularile anterioare (ambele rapoarte) echilibreaza workerii
+    result = run_parallel(workers, output_file, paths=str(feature_file or 'features'),
+                          granularity=granularity, extra_args=tag_args,
+                          history_files=['test_output.json', 'test_results.json'])
+    attach_waterfalls(output_file, load_waterfalls(run_id=current_run_id()))
+    display_json_results(output_file)
+    print_summary(load_records(run_id=current_run_id()), title="BROWSER STARTUP PROFILE - ALL WORKERS")
+    print_budget_report(load_budgets(run_id=current_run_id()), title="WAIT BUDGET - ALL WORKERS")
+    return result
 
 
 def display_json_results(json_file='test_output.json'):
@@ -186,7 +214,15 @@ def run_mens_page_tests():
 
 
 if __name__ == '__main__':
-    if len(sys.argv) > 1:
+    if '--workers' in sys.argv:
+        # python run_tests_new.py --workers N [--by scenario] [--feature name] [--tags expr]
+        args = sys.argv[1:]
+        workers = int(args[args.index('--workers') + 1])
+        granularity = args[args.index('--by') + 1] if '--by' in args else 'feature'
+        feature = f"features/{args[args.index('--feature') + 1]}.feature" if '--feature' in args else None
+        tags = args[args.index('--tags') + 1] if '--tags' in args else None
+        result = run_parallel_tests(workers, feature, tags, granularity)
+    elif len(sys.argv) > 1:
         if sys.argv[1] == '--feature' and len(sys.argv) > 2:
             result = run_specific_feature(sys.argv[2])
         elif sys.argv[1] == '--tags' and len(sys.argv) > 2:
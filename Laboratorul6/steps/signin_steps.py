@@ -7,17 +7,18 @@ from behave import given, when, then
 from pages.home_page import HomePage
 from pages.login_page import LoginPage
 from utils.helpers import ValidationHelper, LogHelper
+from utils.wait_conditions import pause
 from utils.driver_factory import WebDriverFactory
 
 
 @given('I am on the Elite Shoppy home page')
 def step_navigate_to_home(context):
     """Navighează la pagina principală"""
-    driver = WebDriverFactory.create_driver()
-    context.driver = driver
-    context.home_page = HomePage(driver)
-    # Înlocuiți URL-ul cu cel real
-    context.home_page.open("file:///c:/Users/ciprian.panzaru/Desktop/UTM/Semestrul%20VII/CPP/CPP/Laboratorul6/page.html")
+    context.session = WebDriverFactory.open_session()
+    context.driver = context.session.driver
+    context.home_page = HomePage(context.driver)
+    # URL-ul vine din ELITE_SHOPPY_BASE_URL (local = snapshot-urile servite de fixture_server)
+    context.home_page.open()
     LogHelper.log_step("Navighează la pagina principală")
 
 
@@ -50,8 +51,7 @@ def step_click_sign_in_submit(context):
 def step_verify_sign_in_success(context):
     """Verifică dacă s-a afișat mesajul de succes"""
     # Așteptă un moment pentru afișaj
-    import time
-    time.sleep(1)
+    pause(1)
     LogHelper.log_step("Verifică mesajul de succes")
 
 
@@ -6,6 +6,7 @@ Separat per funcționalitate pentru ușor de găsit și menținut
 from behave import when, then
 from pages.signup_page import SignUpPage
 from utils.helpers import ValidationHelper, LogHelper
+from utils.wait_conditions import pause
 
 
 @when('I click on the Sign Up button')
@@ -38,8 +39,7 @@ def step_click_sign_up_submit(context):
 @then('I should see a registration success message')
 def step_verify_signup_success(context):
     """Verifică dacă s-a afișat mesajul de succes"""
-    import time
-    time.sleep(1)
+    pause(1)
     LogHelper.log_step("Verifică mesajul de succes al înregistrării")
 
 
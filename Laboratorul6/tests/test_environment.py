@@ -0,0 +1,63 @@
+"""
+Teste pentru hook-urile Behave din environment.py (profilul per scenariu, închiderea sesiunilor la final)
+"""
+import threading
+
+import pytest
+
+import environment
+from utils import driver_factory
+from utils.driver_factory import DriverSession, WebDriverFactory
+
+
+class Scenario:
+    name = "TC5 - Test page responsiveness"
+
+    def __init__(self, tags):
+        self.effective_tags = tags
+
+
+class Context:
+    pass
+
+
+class FakeDriver:
+    def __init__(self):
+        self.closed = threading.Event()
+
+    def quit(self):
+        self.closed.set()
+
+
+@pytest.fixture(autouse=True)
+def scenario_context():
+    """Valorile setate de before_scenario nu trec în alte teste"""
+    yield
+    driver_factory._current_profile.set(None)
+    driver_factory._current_block_rulesets.set(())
+    driver_factory._current_network_events.set(None)
+
+
+def test_profile_tag_selects_profile_for_new_sessions(monkeypatch):
+    monkeypatch.delenv("BROWSER_PROFILE", raising=False)
+    monkeypatch.delenv("REQUEST_BLOCKING", raising=False)
+    monkeypatch.setattr(WebDriverFactory, "get_session", staticmethod(lambda key=None: None))
+    context = Context()
+
+    environment.before_scenario(context, Scenario(["high", "profile-fast"]))
+
+    assert context.browser_profile.name == "fast"
+    assert WebDriverFactory.current_profile().name == "fast"
+
+
+def test_after_all_closes_every_registered_session(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    drivers = [FakeDriver(), FakeDriver()]
+    monkeypatch.setattr(WebDriverFactory, "_sessions", {
+        f"worker:{i}": DriverSession(f"worker:{i}", driver) for i, driver in enumerate(drivers)
+    })
+
+    environment.after_all(Context())
+
+    assert WebDriverFactory._sessions == {}
+    assert all(driver.closed.is_set() for driver in drivers)
@@ -0,0 +1,61 @@
+"""
+Teste pentru FixtureServer - resursele lipsă din snapshot (404 implicit, descărcare doar cu FIXTURE_FETCH_MISSING)
+"""
+import http.client
+
+import pytest
+
+from utils import fixture_server
+from utils.fixture_server import FETCH_MISSING_ENV, FixtureServer
+
+
+class Response:
+    def __init__(self, body):
+        self.body = body
+
+    def read(self):
+        return self.body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    urls = []
+
+    def urlopen(url, timeout=None):
+        urls.append(url)
+        return Response(b"body{}")
+
+    monkeypatch.setattr(fixture_server.urllib.request, "urlopen", urlopen)
+    return urls
+
+
+def test_missing_asset_is_404_without_network(tmp_path, monkeypatch, downloads, capsys):
+    monkeypatch.delenv(FETCH_MISSING_ENV, raising=False)
+    server = FixtureServer(root=str(tmp_path)).start()
+    try:
+        for _ in range(2):
+            connection = http.client.HTTPConnection(server.host, server.port, timeout=5)
+            connection.request("GET", "/css/missing.css")
+            assert connection.getresponse().status == 404
+            connection.close()
+    finally:
+        server.stop()
+
+    assert downloads == []
+    assert server.missing == {"/css/missing.css"}
+    assert capsys.readouterr().out.count("/css/missing.css") == 1
+
+
+def test_fetch_missing_downloads_and_caches(tmp_path, monkeypatch, downloads):
+    monkeypatch.setenv(FETCH_MISSING_ENV, "1")
+    server = FixtureServer(root=str(tmp_path))
+
+    assert server.resolve("/css/style.css") == (b"body{}", "text/css", 3600)
+    assert (tmp_path / "fixture_cache" / "css" / "style.css").read_bytes() == b"body{}"
+    assert downloads == [fixture_server.LIVE_BASE_URL + "/css/style.css"]
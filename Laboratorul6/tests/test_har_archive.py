@@ -0,0 +1,72 @@
+"""
+Teste pentru FetchInterceptor - pornirea interceptării pe o conexiune CDP simulată (fără Chrome)
+"""
+from contextlib import asynccontextmanager
+
+import pytest
+from selenium.webdriver.common.bidi import cdp
+
+from utils import har_archive
+
+
+WINDOW_HANDLE = "6A1C9E5F0B2D4C7E8F9A0B1C2D3E4F50"
+
+
+def _run_command(commands, cmd):
+    """Serializează comanda CDP (ca la trimiterea pe websocket) și întoarce rezultatul parsat"""
+    request = next(cmd)
+    commands.append(request)
+    result = {"sessionId": "session-1"} if request["method"] == "Target.attachToTarget" else {}
+    try:
+        cmd.send(result)
+    except StopIteration as stop:
+        return stop.value
+    return None
+
+
+class StubConnection(cdp.CdpConnection):
+    """Conexiune CDP fără websocket: comenzile sunt doar serializate și înregistrate"""
+
+    def __init__(self, commands):
+        super().__init__(ws=None)
+        self.commands = commands
+
+    async def execute(self, cmd):
+        return _run_command(self.commands, cmd)
+
+
+class StubDriver:
+    current_window_handle = WINDOW_HANDLE
+
+
+@pytest.fixture
+def commands(monkeypatch):
+    commands = []
+
+    @asynccontextmanager
+    async def open_cdp(url):
+        yield StubConnection(commands)
+
+    async def session_execute(self, cmd):
+        return _run_command(commands, cmd)
+
+    monkeypatch.setattr(har_archive, "_cdp_endpoint", lambda driver: ("119", "ws://stub"))
+    monkeypatch.setattr(cdp, "open_cdp", open_cdp)
+    monkeypatch.setattr(cdp.CdpSession, "execute", session_execute)
+    return commands
+
+
+@pytest.mark.parametrize("mode, methods", [
+    (har_archive.MODE_RECORD, ["Target.attachToTarget", "Fetch.enable", "Network.enable"]),
+    (har_archive.MODE_REPLAY, ["Target.attachToTarget", "Fetch.enable"]),
+])
+def test_start_attaches_to_window_target(commands, mode, methods):
+    interceptor = har_archive.FetchInterceptor(StubDriver(), mode, archive=None)
+    try:
+        interceptor.start(timeout=5)
+    finally:
+        interceptor.stop()
+        interceptor._thread.join(5)
+
+    assert [command["method"] for command in commands] == methods
+    assert commands[0]["params"]["targetId"] == WINDOW_HANDLE
@@ -0,0 +1,52 @@
+"""
+Teste pentru find_overlaps - sweep-line pe dreptunghiuri construite manual
+"""
+from utils.layout_audit import Box, LayoutAudit, find_overlaps
+
+
+def _box(index, left, top, width, height, ancestors=()):
+    return Box(index, left, top, left + width, top + height, f"el{index}", ancestors)
+
+
+def _pairs(overlaps):
+    return sorted(tuple(sorted((a.index, b.index))) for a, b in overlaps)
+
+
+def test_overlapping_boxes_are_found():
+    boxes = [_box(0, 0, 0, 100, 40), _box(1, 80, 20, 100, 40), _box(2, 400, 0, 50, 50)]
+
+    assert _pairs(find_overlaps(boxes)) == [(0, 1)]
+
+
+def test_touching_edges_are_not_overlaps():
+    boxes = [
+        _box(0, 0, 0, 100, 40),
+        _box(1, 100, 0, 100, 40),      # aceeași margine verticală
+        _box(2, 0, 40, 100, 40),       # aceeași margine orizontală
+        _box(3, 199.5, 0, 50, 40),     # sub toleranța de 1px
+    ]
+
+    assert find_overlaps(boxes) == []
+
+
+def test_nested_elements_are_not_overlaps():
+    # Buton (1) în interiorul unui link (0); link-ul 2 acoperă butonul fără să fie strămoșul lui
+    boxes = [_box(0, 0, 0, 200, 50), _box(1, 10, 10, 80, 30, ancestors=(0,)), _box(2, 50, 20, 100, 40)]
+
+    assert _pairs(find_overlaps(boxes)) == [(0, 2), (1, 2)]
+
+
+def test_sweep_line_matches_pairwise_check():
+    boxes = [_box(i, (i * 37) % 500, (i * 53) % 300, 20 + i % 40, 15 + i % 25) for i in range(200)]
+    expected = sorted(
+        (a.index, b.index) for i, a in enumerate(boxes) for b in boxes[i + 1:]
+        if min(a.intersection(b)) > 1
+    )
+
+    assert _pairs(find_overlaps(boxes)) == expected
+
+
+def test_describe_overlaps_lists_labels():
+    audit = LayoutAudit([_box(0, 0, 0, 100, 40), _box(1, 50, 0, 100, 40)])
+
+    assert audit.describe_overlaps() == "el0 / el1"
@@ -0,0 +1,36 @@
+"""
+Teste pentru MensPage.are_product_images_loaded - imaginile trebuie încărcate și vizibile, nu doar cu src
+"""
+import pytest
+
+from pages.mens_page import MensPage
+
+
+def _image(src="http://shop/images/m1.jpg", displayed=True, complete=True, natural_width=300):
+    return {"displayed": displayed, "text": "",
+            "attributes": {"src": src, "complete": complete, "naturalWidth": natural_width}}
+
+
+class FakeDriver:
+    """Driver cu documentul încărcat și rezultatul inspectării în lot al imaginilor"""
+
+    def __init__(self, images):
+        self.images = images
+
+    def execute_script(self, script, *args):
+        if script == "return document.readyState":
+            return "complete"
+        return self.images
+
+
+@pytest.mark.parametrize("images, loaded", [
+    ([_image(), _image("http://shop/images/m2.jpg")], True),
+    ([_image(), _image(natural_width=0)], False),
+    ([_image(), _image(complete=False, natural_width=0)], False),
+    ([_image(), _image(displayed=False)], False),
+    ([_image(), _image(src="")], False),
+    ([_image(), None], False),
+    ([], False),
+])
+def test_product_images_must_be_loaded_and_visible(images, loaded):
+    assert MensPage(FakeDriver(images)).are_product_images_loaded() is loaded
@@ -0,0 +1,62 @@
+"""
+Teste pentru PageState - snapshot-ul rămâne în memorie până la o acțiune sau o mutație făcută de pagină
+"""
+from pages.base_page import BasePage
+from utils.page_state import DOM_KEY_SCRIPT
+
+
+MENU = "nav .menu"
+
+
+class FakeDriver:
+    """Driver care simulează contorul observer-ului din pagină (cheia document:mutații)"""
+
+    def __init__(self):
+        self.key = "doc1:0"
+        self.captures = 0
+
+    def execute_script(self, script, *args):
+        if script == DOM_KEY_SCRIPT:
+            return self.key
+        self.captures += 1
+        return {"dom": self.key, "url": "http://shop/mens.html", "viewport": {},
+                "elements": {locator: {"count": 1, "displayed": True} for locator in args[0]}}
+
+
+class MenuPage(BasePage):
+    PAGE_STATE_LOCATORS = (MENU,)
+
+
+def test_repeated_reads_reuse_the_snapshot():
+    driver = FakeDriver()
+    page = MenuPage(driver)
+
+    assert page.page_state().is_displayed(MENU)
+    assert page.page_state().is_displayed(MENU)
+    assert driver.captures == 1
+
+
+def test_page_mutation_invalidates_the_snapshot():
+    driver = FakeDriver()
+    page = MenuPage(driver)
+    page.page_state()
+
+    # Conținut încărcat asincron de pagină, fără nicio acțiune din Python
+    driver.key = "doc1:3"
+    page.page_state()
+    # Redirect din client: document nou
+    driver.key = "doc2:0"
+    page.page_state()
+
+    assert driver.captures == 3
+
+
+def test_python_action_invalidates_the_snapshot():
+    driver = FakeDriver()
+    page = MenuPage(driver)
+    page.page_state()
+
+    page.invalidate_state()
+    page.page_state()
+
+    assert driver.captures == 2
@@ -0,0 +1,93 @@
+"""
+Teste pentru waterfall-ul de resurse - hook-ul after_scenario scrie înregistrarea, runner-ul o atașează în JSON
+"""
+import json
+
+import environment
+from utils.resource_waterfall import REPORT_KEY, attach_waterfalls, load_waterfalls
+
+
+def _log_entry(method, params):
+    return {"timestamp": 0, "message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+class FakeDriver:
+    """Driver cu log-ul 'performance' al unei încărcări de pagină"""
+
+    current_url = "http://shop/mens.html"
+
+    def __init__(self, entries):
+        self.entries = entries
+
+    def get_log(self, kind):
+        entries, self.entries = self.entries, []
+        return entries
+
+    def execute_script(self, script, *args):
+        return []
+
+
+def _page_load():
+    entries = []
+    for request_id, url, kind, start, end, size in [
+        ("1", "http://shop/mens.html", "Document", 1.0, 1.2, 8000),
+        ("2", "http://shop/css/style.css", "Stylesheet", 1.21, 1.9, 42000),
+        ("3", "http://shop/images/m1.jpg", "Image", 1.3, 2.6, 250000),
+    ]:
+        entries.append(_log_entry("Network.requestWillBeSent", {
+            "requestId": request_id, "timestamp": start, "type": kind, "documentURL": "http://shop/mens.html",
+            "request": {"url": url, "initialPriority": "VeryHigh"}, "initiator": {"type": "parser"},
+        }))
+        entries.append(_log_entry("Network.responseReceived", {
+            "requestId": request_id, "type": kind, "response": {"status": 200, "url": url},
+        }))
+        entries.append(_log_entry("Network.loadingFinished", {
+            "requestId": request_id, "timestamp": end, "encodedDataLength": size,
+        }))
+    entries.append(_log_entry("Network.requestWillBeSent", {
+        "requestId": "4", "timestamp": 1.4, "type": "Font", "documentURL": "http://shop/mens.html",
+        "request": {"url": "http://shop/fonts/x.woff2"}, "initiator": {"type": "parser"},
+    }))
+    entries.append(_log_entry("Network.loadingFailed", {"requestId": "4", "timestamp": 1.6, "errorText": "net::ERR_FAILED"}))
+    return entries
+
+
+class Session:
+    def __init__(self, driver):
+        self.driver = driver
+
+
+class Scenario:
+    name = "TC1 - Test page loads correctly"
+    location = "features/05_mens_page.feature:7"
+    status = "passed"
+
+
+class Context:
+    block_rulesets = ()
+
+
+def test_after_scenario_waterfall_is_attached_to_report(tmp_path, monkeypatch):
+    monkeypatch.setenv("RESOURCE_WATERFALL_LOG", str(tmp_path / "resource_waterfall.jsonl"))
+    monkeypatch.setenv("STARTUP_RUN_ID", "run-1")
+    session = Session(FakeDriver(_page_load()))
+    monkeypatch.setattr(environment.WebDriverFactory, "get_session", staticmethod(lambda key=None: session))
+
+    environment.after_scenario(Context(), Scenario())
+
+    report = tmp_path / "test_output.json"
+    report.write_text(json.dumps([{"elements": [
+        {"type": "background", "location": "features/05_mens_page.feature:3"},
+        {"type": "scenario", "location": Scenario.location},
+    ]}]), encoding="utf-8")
+    assert attach_waterfalls(str(report), load_waterfalls(run_id="run-1")) == 1
+
+    background, scenario = json.loads(report.read_text(encoding="utf-8"))[0]["elements"]
+    waterfall = scenario[REPORT_KEY]
+    assert REPORT_KEY not in background
+    assert waterfall["source"] == "network"
+    assert waterfall["resources"] == 4
+    assert [entry["url"] for entry in waterfall["slowest"][:2]] == [
+        "http://shop/images/m1.jpg", "http://shop/css/style.css"]
+    assert [entry["url"] for entry in waterfall["failed"]] == ["http://shop/fonts/x.woff2"]
+    assert "http://shop/css/style.css" in [entry["url"] for entry in waterfall["render_blocking"]]
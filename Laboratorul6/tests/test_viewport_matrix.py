@@ -0,0 +1,65 @@
+"""
+Teste pentru run_viewport_matrix - un tab care nu navighează este raportat ca eroare, nu ca layout corect
+"""
+from utils import viewport_matrix
+from utils.viewport_matrix import run_viewport_matrix
+
+
+class SwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def new_window(self, kind):
+        self.driver.handles.append(f"tab-{len(self.driver.handles)}")
+        self.driver.current_window_handle = self.driver.handles[-1]
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """Tab-urile noi rămân pe about:blank (navigarea nu pornește niciodată)"""
+
+    def __init__(self):
+        self.handles = ["main"]
+        self.current_window_handle = "main"
+        self.current_url = "about:blank"
+        self.switch_to = SwitchTo(self)
+        self.captures = 0
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {}
+
+    def execute_script(self, script, *args):
+        if script == "return document.readyState":
+            return "complete"
+        if script.startswith("window.location.href"):
+            return None
+        self.captures += 1
+        return {}
+
+    def close(self):
+        self.handles.remove(self.current_window_handle)
+
+
+def test_tab_that_never_navigates_is_an_error(monkeypatch):
+    monkeypatch.setattr(viewport_matrix.WebDriverFactory, "prepare_target", staticmethod(lambda driver: None))
+    driver = FakeDriver()
+
+    matrix = run_viewport_matrix(driver, "http://shop/mens.html", timeout=0.2)
+
+    assert [result.error for result in matrix] == ["navigation timed out"] * 3
+    assert not matrix.ok
+    assert driver.captures == 0
+    assert driver.handles == ["main"] and driver.current_window_handle == "main"
+
+
+def test_touch_targets_are_checked_on_mobile_only():
+    small = {"x": 0, "y": 0, "width": 30, "height": 20, "displayed": True}
+    state = viewport_matrix.PageState({"elements": {viewport_matrix.TOUCH_TARGETS: {"rects": [small]}}}, 0)
+    results = {name: viewport_matrix.ViewportResult(name, width, height, mobile, state=state)
+               for name, (width, height, mobile) in viewport_matrix.VIEWPORTS.items()}
+
+    assert results["desktop"].problems() == []
+    assert results["tablet"].problems() == []
+    assert results["mobile"].problems() == [f"1 touch target(s) under {viewport_matrix.MIN_TOUCH_SIZE}px"]
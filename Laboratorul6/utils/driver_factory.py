@@ -1,93 +1,368 @@
 """
 WebDriver Factory - gestionează inițializare și închidere WebDriver
+Fiecare worker/thread (sau task asyncio) are propria sesiune de browser
 """
 
+import contextvars
 import os
+import threading
+import time
+
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from utils.driver_reaper import get_reaper
+from utils.driver_resolver import ChromeDriverResolver
+from utils.har_archive import attach_network_mode
+from utils.network_events import enable_performance_logging, network_events_requested
+from utils.page_state import install_dom_observer
+from utils.request_blocker import BLOCK_RULESETS, request_blocker
+from utils.startup_profiler import StartupProfiler
+from utils.wait_conditions import implicit_wait_seconds
+
+
+# Cheia sesiunii curente - setată explicit pentru task-uri asyncio
+_current_session_key = contextvars.ContextVar("webdriver_session_key", default=None)
+
+# Profilul de browser cerut de scenariul curent (setat din environment.py)
+_current_profile = contextvars.ContextVar("webdriver_profile", default=None)
+
+# Tag-urile de forma @profile-<nume> aleg profilul unui scenariu
+PROFILE_TAG_PREFIX = "profile-"
+
+# Fonturile nu au o preferință Chrome dedicată - sunt blocate prin CDP
+FONT_URL_PATTERNS = BLOCK_RULESETS["fonts"]
+
+# Seturile de reguli de blocare cerute de scenariul curent (setate din environment.py)
+_current_block_rulesets = contextvars.ContextVar("request_block_rulesets", default=())
+
+# Log-ul 'performance' cerut de scenariul curent (None = doar variabila NETWORK_EVENTS)
+_current_network_events = contextvars.ContextVar("network_events", default=None)
+
+
+class BrowserProfile:
+    """Profil de browser cu nume: ce resurse se încarcă și cum arată fereastra"""
+
+    def __init__(self, name, headless=False, block_images=False, block_fonts=False,
+                 page_load_strategy="normal", window_size=None, clean_cache=False,
+                 no_extensions=False):
+        self.name = name
+        self.headless = headless
+        self.block_images = block_images
+        self.block_fonts = block_fonts
+        self.page_load_strategy = page_load_strategy
+        self.window_size = window_size
+        self.clean_cache = clean_cache
+        self.no_extensions = no_extensions
+
+    def __repr__(self):
+        return f"BrowserProfile({self.name!r})"
+
+
+BROWSER_PROFILES = {
+    # Teste funcționale: fără imagini/fonturi/extensii, nu așteaptă resursele paginii
+    "fast": BrowserProfile("fast", headless=True, block_images=True, block_fonts=True,
+                           page_load_strategy="eager", window_size=(1920, 1080),
+                           no_extensions=True),
+    # Browser complet, ca pentru un utilizator real
+    "fidelity": BrowserProfile("fidelity"),
+    # Măsurători repetabile: cache gol și viewport fix
+    "perf-measure": BrowserProfile("perf-measure", headless=True, window_size=(1366, 768),
+                                   clean_cache=True),
+}
+
+
+def get_profile(name=None):
+    """Returnează profilul cerut (implicit variabila BROWSER_PROFILE sau 'fidelity')"""
+    name = name or os.environ.get("BROWSER_PROFILE", "fidelity")
+    if name not in BROWSER_PROFILES:
+        raise ValueError(f"Unknown browser profile '{name}'. "
+                         f"Available: {', '.join(sorted(BROWSER_PROFILES))}")
+    return BROWSER_PROFILES[name]
+
+
+def profile_from_tags(tags):
+    """Profilul ales prin tag (ex: @profile-fast), altfel profilul implicit"""
+    for tag in tags:
+        if tag.startswith(PROFILE_TAG_PREFIX):
+            return get_profile(tag[len(PROFILE_TAG_PREFIX):])
+    return get_profile()
+
+
+class DriverSession:
+    """Handle explicit pentru o sesiune de browser (se transmite prin context)"""
+
+    def __init__(self, key, driver, profile=None, network_events=False):
+        self.key = key
+        self.driver = driver
+        self.profile = profile
+        self.network_events = network_events
+
+    def navigate_to(self, url):
+        """Navighează la o adresă URL"""
+        self.driver.get(url)
+
+    def refresh(self):
+        """Reîncarcă pagina curentă"""
+        self.driver.refresh()
+
+    def go_back(self):
+        """Merge înapoi în istoric"""
+        self.driver.back()
+
+    def get_current_url(self):
+        """Obține URL-ul curent"""
+        return self.driver.current_url
+
+    def get_page_title(self):
+        """Obține titlul paginii"""
+        return self.driver.title
+
+    def close(self):
+        """Închide sesiunea și o scoate din registru"""
+        WebDriverFactory.close_session(self.key)
+
+    def __repr__(self):
+        return f"DriverSession(key={self.key!r}, profile={getattr(self.profile, 'name', None)!r})"
 
 
 class WebDriverFactory:
     """Factory pentru crearea și gestionarea instanțelor WebDriver"""
-    
-    _driver = None
-    
+
+    # Registrul sesiunilor: cheie worker/thread -> DriverSession
+    _sessions = {}
+    _lock = threading.RLock()
+
     @staticmethod
-    def create_driver():
-        """Creează o nouă instanță de Chrome WebDriver"""
-        if WebDriverFactory._driver is None:
-            options = webdriver.ChromeOptions()
-            # options.add_argument("--headless")  # Dezactivează pentru a vedea browser-ul
+    def build_driver(profile=None, network_events=None):
+        """Creează o nouă instanță de Chrome WebDriver (nepartajată) pentru un profil"""
+        profile = profile or get_profile()
+        if network_events is None:
+            network_events = network_events_requested()
+        profiler = StartupProfiler(profile=profile.name)
+        options_start = time.perf_counter()
+        options = webdriver.ChromeOptions()
+        # Worker-ii paraleli rulează headless (HEADLESS=1), la fel profilele headless
+        headless = profile.headless or os.environ.get("HEADLESS", "").lower() in ("1", "true", "yes")
+        window_size = profile.window_size
+        if headless:
+            options.add_argument("--headless=new")
+            window_size = window_size or (1920, 1080)
+        if window_size:
+            options.add_argument(f"--window-size={window_size[0]},{window_size[1]}")
+        else:
             options.add_argument("--start-maximized")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-            
-            # Get the chromedriver directory from ChromeDriverManager
-            manager = ChromeDriverManager()
-            driver_dir = manager.install()  # This may return a file path
-            
-            # If it's a file, get the directory
-            if os.path.isfile(driver_dir):
-                driver_dir = os.path.dirname(driver_dir)
-            
-            # Now find chromedriver.exe in the directory
-            chromedriver_path = None
-            if os.path.isdir(driver_dir):
-                for filename in os.listdir(driver_dir):
-                    if filename == 'chromedriver.exe':
-                        chromedriver_path = os.path.join(driver_dir, filename)
-                        break
-            
-            if chromedriver_path is None:
-                raise Exception(f"ChromeDriver not found in {driver_dir}")
-            
+        if profile.no_extensions:
+            options.add_argument("--disable-extensions")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+        if profile.block_images:
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        options.page_load_strategy = profile.page_load_strategy
+        # Evenimentele de rețea (statusuri, rapoarte) vin din log-ul 'performance' - doar la cerere
+        if network_events:
+            enable_performance_logging(options)
+        profiler.record("build_options", time.perf_counter() - options_start)
+
+        try:
+            # Calea către ChromeDriver vine din manifestul local (fără rețea după prima rulare)
+            with profiler.phase("resolve_driver"):
+                chromedriver_path = ChromeDriverResolver().resolve().path
+
             service = Service(chromedriver_path)
-            WebDriverFactory._driver = webdriver.Chrome(service=service, options=options)
-            WebDriverFactory._driver.implicitly_wait(10)
-        
-        return WebDriverFactory._driver
-    
+
+            # Pornirea procesului chromedriver se măsoară separat de crearea sesiunii
+            start_service = service.start
+
+            def timed_start():
+                with profiler.phase("service_spawn"):
+                    start_service()
+
+            service.start = timed_start
+
+            init_start = time.perf_counter()
+            driver = webdriver.Chrome(service=service, options=options)
+            profiler.record(
+                "session_create",
+                time.perf_counter() - init_start - profiler.phases.get("service_spawn", 0.0)
+            )
+
+            with profiler.phase("timeouts"):
+                driver.implicitly_wait(implicit_wait_seconds())
+
+            with profiler.phase("profile_cdp"):
+                if profile.block_fonts:
+                    request_blocker(driver).set_base_patterns(FONT_URL_PATTERNS)
+                if profile.clean_cache:
+                    driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+                # Contorul de mutații pentru PageState (snapshot-uri invalidate și de schimbările făcute de pagină)
+                install_dom_observer(driver)
+
+            # Înregistrare / redare HAR (NETWORK_MODE=record|replay)
+            with profiler.phase("network_mode"):
+                attach_network_mode(driver)
+        except Exception:
+            profiler.finish(status="error")
+            raise
+
+        profiler.finish()
+        return driver
+
+    @staticmethod
+    def prepare_target(driver):
+        """Setările CDP per target ale driverului (blocare cereri, observer DOM, HAR) pe tab-ul curent; întoarce interceptorul"""
+        request_blocker(driver).apply_to_current_target()
+        install_dom_observer(driver)
+        return attach_network_mode(driver)
+
+    # ===== SESSION REGISTRY =====
+
+    @staticmethod
+    def current_session_key():
+        """Cheia sesiunii curente: cea legată explicit sau worker + thread"""
+        key = _current_session_key.get()
+        if key is None:
+            worker = os.environ.get("BEHAVE_WORKER_ID", "main")
+            key = f"{worker}:{threading.get_ident()}"
+        return key
+
+    @staticmethod
+    def bind_session_key(key):
+        """Leagă o cheie de sesiune de contextul curent (ex: un task asyncio)"""
+        return _current_session_key.set(key)
+
+    @staticmethod
+    def unbind_session_key(token):
+        """Anulează legarea făcută cu bind_session_key"""
+        _current_session_key.reset(token)
+
+    @staticmethod
+    def use_profile(name):
+        """Cere un profil de browser pentru sesiunile deschise în contextul curent"""
+        return _current_profile.set(get_profile(name))
+
+    @staticmethod
+    def current_profile():
+        """Profilul cerut în contextul curent (sau cel implicit)"""
+        return _current_profile.get() or get_profile()
+
+    @staticmethod
+    def use_request_blocking(rulesets):
+        """Cere seturile de reguli de blocare pentru sesiunile din contextul curent"""
+        return _current_block_rulesets.set(tuple(rulesets))
+
+    @staticmethod
+    def use_network_events(enabled):
+        """Cere log-ul 'performance' pentru sesiunile din contextul curent"""
+        return _current_network_events.set(bool(enabled))
+
+    @staticmethod
+    def current_network_events():
+        """True dacă evenimentele de rețea sunt cerute în contextul curent"""
+        requested = _current_network_events.get()
+        return network_events_requested() if requested is None else requested
+
+    @staticmethod
+    def open_session(key=None, profile=None):
+        """Returnează sesiunea pentru cheie, creând browser-ul dacă nu există"""
+        key = key or WebDriverFactory.current_session_key()
+        profile = profile or WebDriverFactory.current_profile()
+        network_events = WebDriverFactory.current_network_events()
+        with WebDriverFactory._lock:
+            session = WebDriverFactory._sessions.get(key)
+            if session is not None and session.profile is profile \
+                    and (session.network_events or not network_events):
+                if profile.clean_cache:
+                    session.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+                request_blocker(session.driver).apply(_current_block_rulesets.get())
+                return session
+
+        # Alt profil (sau log-ul 'performance', care se alege la pornire) cerut: browser-ul vechi este înlocuit
+        if session is not None:
+            WebDriverFactory.close_session(key)
+
+        # Pornirea Chrome se face în afara lock-ului - alte sesiuni nu așteaptă
+        driver = WebDriverFactory.build_driver(profile, network_events)
+        with WebDriverFactory._lock:
+            existing = WebDriverFactory._sessions.get(key)
+            if existing is not None:
+                get_reaper().submit(driver)
+                return existing
+            session = DriverSession(key, driver, profile, network_events)
+            WebDriverFactory._sessions[key] = session
+        request_blocker(driver).apply(_current_block_rulesets.get())
+        return session
+
+    @staticmethod
+    def get_session(key=None):
+        """Obține sesiunea existentă pentru cheie (sau None)"""
+        key = key or WebDriverFactory.current_session_key()
+        with WebDriverFactory._lock:
+            return WebDriverFactory._sessions.get(key)
+
+    @staticmethod
+    def close_session(key=None):
+        """Închide sesiunea pentru cheie (quit() rulează pe fundal, fără așteptare)"""
+        key = key or WebDriverFactory.current_session_key()
+        with WebDriverFactory._lock:
+            session = WebDriverFactory._sessions.pop(key, None)
+        if session is not None:
+            get_reaper().submit(session.driver)
+
+    @staticmethod
+    def close_all_sessions(wait=True):
+        """Închide toate sesiunile deschise în proces (așteaptă cel mult termenul reaper-ului)"""
+        with WebDriverFactory._lock:
+            sessions = list(WebDriverFactory._sessions.values())
+            WebDriverFactory._sessions.clear()
+        reaper = get_reaper()
+        for session in sessions:
+            reaper.submit(session.driver)
+        if wait and not reaper.drain():
+            print(f"Warning: {reaper.pending()} browser(s) still closing after the quit deadline")
+
+    # ===== API COMPATIBIL (sesiunea thread-ului curent) =====
+
+    @staticmethod
+    def create_driver():
+        """Creează (sau refolosește) driver-ul sesiunii curente"""
+        return WebDriverFactory.open_session().driver
+
     @staticmethod
     def get_driver():
-        """Obține instanța curentă de WebDriver"""
-        if WebDriverFactory._driver is None:
-            return WebDriverFactory.create_driver()
-        return WebDriverFactory._driver
-    
+        """Obține instanța de WebDriver a sesiunii curente"""
+        return WebDriverFactory.open_session().driver
+
     @staticmethod
     def close_driver():
-        """Închide WebDriver-ul"""
-        if WebDriverFactory._driver is not None:
-            WebDriverFactory._driver.quit()
-            WebDriverFactory._driver = None
-    
+        """Închide WebDriver-ul sesiunii curente"""
+        WebDriverFactory.close_session()
+
     @staticmethod
-    def navigate_to(url):
+    def navigate_to(url, session=None):
         """Navighează la o adresă URL"""
-        driver = WebDriverFactory.get_driver()
-        driver.get(url)
-    
+        session = session or WebDriverFactory.open_session()
+        session.navigate_to(url)
+
     @staticmethod
-    def refresh():
+    def refresh(session=None):
         """Reîncarcă pagina curentă"""
-        driver = WebDriverFactory.get_driver()
-        driver.refresh()
-    
+        session = session or WebDriverFactory.open_session()
+        session.refresh()
+
     @staticmethod
-    def go_back():
+    def go_back(session=None):
         """Merge înapoi în istoric"""
-        driver = WebDriverFactory.get_driver()
-        driver.back()
-    
+        session = session or WebDriverFactory.open_session()
+        session.go_back()
+
     @staticmethod
-    def get_current_url():
+    def get_current_url(session=None):
         """Obține URL-ul curent"""
-        driver = WebDriverFactory.get_driver()
-        return driver.current_url
-    
+        session = session or WebDriverFactory.open_session()
+        return session.get_current_url()
+
     @staticmethod
-    def get_page_title():
+    def get_page_title(session=None):
         """Obține titlul paginii"""
-        driver = WebDriverFactory.get_driver()
-        return driver.title
+        session = session or WebDriverFactory.open_session()
+        return session.get_page_title()
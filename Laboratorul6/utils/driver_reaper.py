@@ -0,0 +1,245 @@
+"""
+Driver Reaper - închide browserele pe fundal, cu termen limită
+Dacă driver.quit() se blochează, arborele chrome/chromedriver este oprit forțat după PID
+"""
+import csv
+import os
+import platform
+import signal
+import subprocess
+import threading
+import time
+
+
+# Procesele care pot fi oprite forțat (verificare contra refolosirii PID-urilor)
+BROWSER_PROCESS_NAMES = ("chrome", "chromedriver", "chromium")
+
+
+def _is_browser_process(name):
+    """True dacă numele procesului aparține Chrome / ChromeDriver"""
+    name = os.path.basename(name or "").lower()
+    return any(browser in name for browser in BROWSER_PROCESS_NAMES)
+
+
+def _process_table():
+    """Tabela proceselor pe POSIX"""
+    try:
+        output = subprocess.run(
+            ["ps", "-A", "-o", "pid=,ppid=,comm="],
+            capture_output=True, text=True, timeout=5
+        ).stdout
+    except Exception:
+        return {}
+
+    table = {}
+    for line in output.splitlines():
+        parts = line.split(None, 2)
+        if len(parts) < 3:
+            continue
+        try:
+            table[int(parts[0])] = (int(parts[1]), parts[2].strip())
+        except ValueError:
+            continue
+    return table
+
+
+def _windows_process_name(pid):
+    """Numele procesului cu un PID pe Windows (None dacă procesul nu mai există)"""
+    try:
+        output = subprocess.run(
+            ["tasklist", "/FI", f"PID eq {pid}", "/FO", "CSV", "/NH"],
+            capture_output=True, text=True, timeout=5
+        ).stdout
+    except Exception:
+        return None
+    for row in csv.reader(output.splitlines()):
+        if len(row) > 1 and row[1].strip() == str(pid):
+            return row[0]
+    return None
+
+
+def process_tree(root_pid):
+    """Procesele din arborele unui PID (inclusiv rădăcina)"""
+    table = _process_table()
+    tree = {}
+    if root_pid in table:
+        tree[root_pid] = table[root_pid][1]
+    frontier = [root_pid]
+    while frontier:
+        parent = frontier.pop()
+        for pid, (ppid, name) in table.items():
+            if ppid == parent and pid not in tree:
+                tree[pid] = name
+                frontier.append(pid)
+    return tree
+
+
+def kill_process_tree(root_pid, snapshot=None):
+    """Oprește forțat un arbore de procese chrome/chromedriver"""
+    if platform.system() == "Windows":
+        # taskkill /T nu verifică programul - PID-ul trebuie să fie încă același chromedriver
+        name = _windows_process_name(root_pid)
+        expected = (snapshot or {}).get(root_pid)
+        if not _is_browser_process(name) or (expected is not None and name != expected):
+            return 0
+        result = subprocess.run(
+            ["taskkill", "/F", "/T", "/PID", str(root_pid)],
+            capture_output=True, text=True
+        )
+        return 1 if result.returncode == 0 else 0
+
+    candidates = dict(snapshot or {})
+    candidates.update(process_tree(root_pid))
+    alive = _process_table()
+
+    killed = 0
+    for pid, name in candidates.items():
+        # PID-ul trebuie să existe încă și să aparțină aceluiași program
+        if pid not in alive or alive[pid][1] != name or not _is_browser_process(name):
+            continue
+        try:
+            os.kill(pid, signal.SIGKILL)
+            killed += 1
+        except OSError:
+            pass
+    return killed
+
+
+class _ReapJob:
+    """O închidere de browser în desfășurare"""
+
+    def __init__(self, driver, deadline):
+        self.driver = driver
+        self.deadline = deadline
+        self.root_pid = self._driver_pid(driver)
+        self.snapshot = {}
+        self.done = threading.Event()
+        self.error = None
+
+    @staticmethod
+    def _driver_pid(driver):
+        """PID-ul procesului chromedriver (None dacă nu este cunoscut)"""
+        try:
+            return driver.service.process.pid
+        except AttributeError:
+            return None
+
+
+class DriverReaper:
+    """Închide driverele pe fundal, cu termen limită și oprire forțată"""
+
+    def __init__(self, deadline=10.0):
+        self.deadline = deadline
+        self._jobs = []
+        self._cond = threading.Condition()
+        self._thread = None
+        self.killed_processes = 0
+
+    def submit(self, driver):
+        """Programează închiderea unui driver și revine imediat"""
+        if driver is None:
+            return
+        job = _ReapJob(driver, time.monotonic() + self.deadline)
+        threading.Thread(target=self._quit, args=(job,), name="driver-quit", daemon=True).start()
+
+        with self._cond:
+            self._jobs.append(job)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._reap_loop, name="driver-reaper", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def _quit(self, job):
+        """Rulează pe thread separat: capturează arborele de procese, apoi quit()"""
+        try:
+            if job.root_pid is not None and platform.system() == "Windows":
+                name = _windows_process_name(job.root_pid)
+                job.snapshot = {job.root_pid: name} if name else {}
+            elif job.root_pid is not None:
+                job.snapshot = process_tree(job.root_pid)
+            job.driver.quit()
+        except Exception as e:
+            job.error = e
+        finally:
+            job.done.set()
+            with self._cond:
+                self._cond.notify_all()
+
+    def _reap_loop(self):
+        """Thread-ul reaper: finalizează închiderile terminate sau expirate"""
+        while True:
+            with self._cond:
+                if not self._jobs:
+                    # submit() pornește un thread nou la următoarea închidere
+                    self._thread = None
+                    return
+                now = time.monotonic()
+                ready = [job for job in self._jobs if job.done.is_set() or now >= job.deadline]
+                if not ready:
+                    next_deadline = min(job.deadline for job in self._jobs)
+                    self._cond.wait(timeout=max(0.0, next_deadline - now))
+                    continue
+            for job in ready:
+                self._finish(job)
+            with self._cond:
+                self._jobs = [job for job in self._jobs if job not in ready]
+                self._cond.notify_all()
+
+    def _finish(self, job):
+        """Oprește procesele rămase după quit() (sau după expirarea termenului)"""
+        timed_out = not job.done.is_set()
+        if timed_out:
+            print(f"[WARNING] driver.quit() exceeded {self.deadline:.0f}s - killing process tree "
+                  f"(chromedriver pid {job.root_pid})")
+        elif job.error is not None:
+            print(f"[WARNING] driver.quit() failed: {job.error}")
+
+        if job.root_pid is None:
+            return
+        if platform.system() == "Windows" and not timed_out and job.error is None:
+            # quit() s-a terminat: PID-ul poate fi deja refolosit de alt program
+            return
+        try:
+            killed = kill_process_tree(job.root_pid, job.snapshot)
+        except Exception as e:
+            print(f"[WARNING] Could not kill process tree {job.root_pid}: {e}")
+            return
+        # Colectează codul de ieșire al chromedriver (altfel rămâne proces zombie)
+        try:
+            job.driver.service.process.poll()
+        except AttributeError:
+            pass
+        if killed:
+            self.killed_processes += killed
+            print(f"[INFO] Reaped {killed} leftover browser process(es) (chromedriver pid {job.root_pid})")
+
+    def pending(self):
+        """Numărul de închideri încă în desfășurare"""
+        with self._cond:
+            return len(self._jobs)
+
+    def drain(self, timeout=None):
+        """Așteaptă terminarea tuturor închiderilor (folosit la final de rulare)"""
+        end = time.monotonic() + (self.deadline + 5 if timeout is None else timeout)
+        with self._cond:
+            while self._jobs:
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(timeout=remaining)
+            return not self._jobs
+
+
+_shared_reaper = None
+_shared_lock = threading.Lock()
+
+
+def get_reaper(deadline=None):
+    """Reaper-ul comun al procesului"""
+    global _shared_reaper
+    with _shared_lock:
+        if _shared_reaper is None:
+            if deadline is None:
+                deadline = float(os.environ.get("DRIVER_QUIT_DEADLINE", "10"))
+            _shared_reaper = DriverReaper(deadline)
+        return _shared_reaper
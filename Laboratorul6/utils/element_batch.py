@@ -0,0 +1,74 @@
+"""
+Element Batch - vizibilitate, text și geometrie pentru o listă de elemente într-o singură cerere
+Rulează o dată atomul isDisplayed al Selenium (în loc de is_displayed() + .text per element)
+"""
+import pkgutil
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from utils.wait_conditions import as_locator
+
+
+_displayed_atom = None
+
+BATCH_SCRIPT = """
+var isDisplayed = __IS_DISPLAYED__;
+var target = arguments[0], attributes = arguments[1] || [];
+var elements = typeof target === 'string' ? Array.from(document.querySelectorAll(target)) : target;
+return elements.map(function (el) {
+    try {
+        var displayed = !!isDisplayed(el);
+        var r = el.getBoundingClientRect();
+        var info = {
+            displayed: displayed,
+            // Ca WebElement.text: elementele ascunse nu au text vizibil
+            text: displayed ? (el.innerText || '').trim() : '',
+            x: r.left + window.scrollX, y: r.top + window.scrollY,
+            width: r.width, height: r.height,
+            attributes: {}
+        };
+        attributes.forEach(function (name) {
+            var value = el[name];
+            info.attributes[name] = value === undefined || value === null ? el.getAttribute(name) : value;
+        });
+        return info;
+    } catch (e) {
+        // Element detașat între găsire și inspectare
+        return null;
+    }
+});
+"""
+
+
+def displayed_atom():
+    """Atomul isDisplayed folosit de WebElement.is_displayed()"""
+    global _displayed_atom
+    if _displayed_atom is None:
+        _displayed_atom = pkgutil.get_data("selenium.webdriver.remote", "isDisplayed.js").decode("utf8")
+    return _displayed_atom
+
+
+def batch_script():
+    """Scriptul de inspectare cu atomul isDisplayed inclus"""
+    return BATCH_SCRIPT.replace("__IS_DISPLAYED__", displayed_atom())
+
+
+def inspect_elements(driver, target, attributes=()):
+    """Vizibilitatea, textul vizibil și geometria tuturor elementelor, într-o singură cerere"""
+    if not isinstance(target, (list, tuple)) or (len(target) == 2 and isinstance(target[0], str)):
+        by, value = as_locator(target)
+        target = value if by == By.CSS_SELECTOR else driver.find_elements(by, value)
+    if not target:
+        return []
+    try:
+        return driver.execute_script(batch_script(), target, list(attributes)) or []
+    except WebDriverException as e:
+        print(f"Warning: batch element inspection failed: {e}")
+        return []
+
+
+def visible_texts(driver, target):
+    """Textele elementelor vizibile (în ordinea din pagină), fără cele goale"""
+    return [info["text"] for info in inspect_elements(driver, target)
+            if info and info["displayed"] and info["text"]]
@@ -0,0 +1,286 @@
+"""
+Fixture Server - servește local snapshot-urile Elite Shoppy (page.html, website_mens.html)
+Se activează cu ELITE_SHOPPY_BASE_URL=local; paginile își iau URL-ul din base_url()
+Resursele care lipsesc din snapshot primesc 404; FIXTURE_FETCH_MISSING=1 le descarcă de pe Netlify (în fixture_cache)
+"""
+import mimetypes
+import os
+import posixpath
+import re
+import threading
+import urllib.error
+import urllib.request
+from urllib.parse import unquote
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Site-ul real (implicit) și valoarea care pornește serverul local
+LIVE_BASE_URL = "https://adoring-pasteur-3ae17d.netlify.app"
+LOCAL_BASE_URL = "local"
+BASE_URL_ENV = "ELITE_SHOPPY_BASE_URL"
+# Descărcarea resurselor lipsă de pe site-ul real (implicit dezactivată - rularea rămâne offline)
+FETCH_MISSING_ENV = "FIXTURE_FETCH_MISSING"
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Rutele servite direct din snapshot-uri
+PAGE_ROUTES = {
+    "/": "page.html",
+    "/index.html": "page.html",
+    "/mens": "website_mens.html",
+    "/mens.html": "website_mens.html",
+}
+# Paginile fără snapshot primesc pagina principală (URL-ul rămâne cel cerut)
+FALLBACK_PAGE = "page.html"
+
+ASSET_DIRS = ("css", "js", "images", "fonts")
+# Foile de stil Google Fonts nu sunt în snapshot - se servesc goale
+FONTS_CSS = "/fonts.css"
+
+# Resursele salvate de browser: ./<titlu>_files/<nume>[.download]
+SAVED_ASSET_RE = re.compile(r'\./[^"\'<>]*?_files/([^"\'<>]+)')
+GOOGLE_FONTS_RE = re.compile(r'(?:https?:)?//fonts\.googleapis\.com/css[^"\'<>]*')
+
+
+def _asset_path(saved_name):
+    """Calea locală a unei resurse salvate (ex: 'bootstrap.js.download' -> '/js/bootstrap.js')"""
+    name = saved_name[:-len(".download")] if saved_name.endswith(".download") else saved_name
+    if re.fullmatch(r"css(\(\d+\))?", name):
+        # Foile de stil Google Fonts salvate ca 'css', 'css(1)'
+        return FONTS_CSS
+    if name.endswith(".js"):
+        return f"/js/{name}"
+    if name.endswith(".css"):
+        return f"/css/{name}"
+    return f"/images/{name}"
+
+
+def rewrite_html(html):
+    """Face pagina independentă de Netlify: link-uri relative la server, resurse locale"""
+    html = html.replace(LIVE_BASE_URL, "")
+    html = SAVED_ASSET_RE.sub(lambda m: _asset_path(m.group(1)), html)
+    return GOOGLE_FONTS_RE.sub(FONTS_CSS, html)
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    """Cererile HTTP către FixtureServer"""
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def _respond(self, send_body):
+        path = self.path.split("?", 1)[0].split("#", 1)[0] or "/"
+        # normpath elimină '..' - nu se servește nimic din afara proiectului
+        path = posixpath.normpath(unquote(path))
+        result = self.server.fixture.resolve(path)
+        if result is None:
+            self.send_error(404)
+            return
+        body, content_type, max_age = result
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", f"max-age={max_age}")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Fără câte o linie în consolă pentru fiecare resursă
+        pass
+
+
+class FixtureServer:
+    """Server HTTP local pentru snapshot-urile Elite Shoppy"""
+
+    def __init__(self, root=PROJECT_ROOT, host="127.0.0.1", port=0, cache_dir=None, fetch_missing=None):
+        self.root = root
+        self.host = host
+        self.port = port
+        self.cache_dir = cache_dir or os.environ.get("FIXTURE_CACHE", os.path.join(root, "fixture_cache"))
+        # Doar la cerere: resursele lipsă se descarcă de pe Netlify
+        if fetch_missing is None:
+            fetch_missing = os.environ.get(FETCH_MISSING_ENV, "0") == "1"
+        self.fetch_missing = fetch_missing
+        self.missing = set()
+        self._httpd = None
+        self._thread = None
+        self._pages = {}
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        """URL-ul serverului (ex: http://127.0.0.1:54321)"""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        """Pornește serverul într-un thread daemon"""
+        if self._httpd is not None:
+            return self
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _FixtureHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.fixture = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fixture-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Oprește serverul"""
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._httpd = None
+        self._thread = None
+
+    def resolve(self, path):
+        """(conținut, content-type, max-age) pentru o cale, None dacă nu există"""
+        extension = os.path.splitext(path)[1].lower()
+        if path.strip("/").split("/", 1)[0] in ASSET_DIRS or extension not in ("", ".html"):
+            body = self._asset(path)
+            if body is None:
+                return None
+            content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+            return body, content_type, 3600
+        return self._page(path), "text/html; charset=utf-8", 0
+
+    def _page(self, path):
+        """HTML-ul unei pagini (snapshot, copie din cache sau pagina principală)"""
+        with self._lock:
+            if path in self._pages:
+                return self._pages[path]
+
+        name = PAGE_ROUTES.get(path)
+        html = self._read_text(os.path.join(self.root, name)) if name else None
+        if html is None:
+            cached = self._cache_file("pages", path.strip("/") + ".html")
+            html = self._read_text(cached)
+            if html is None:
+                body = self._download(path)
+                if body is not None:
+                    html = body.decode("utf-8", errors="replace")
+                    self._write_cache(cached, body)
+        if html is None:
+            html = self._read_text(os.path.join(self.root, FALLBACK_PAGE)) or ""
+
+        page = rewrite_html(html).encode("utf-8")
+        with self._lock:
+            self._pages[path] = page
+        return page
+
+    def _asset(self, path):
+        """Conținutul unei resurse: fișier local, snapshot, cache, apoi Netlify (None dacă lipsește)"""
+        relative = path.lstrip("/")
+        candidates = [os.path.join(self.root, relative)]
+        name = os.path.basename(relative)
+        for entry in self._snapshot_dirs():
+            candidates += [os.path.join(entry, name), os.path.join(entry, name + ".download")]
+        cached = self._cache_file(relative)
+        candidates.append(cached)
+
+        for candidate in candidates:
+            if os.path.isfile(candidate):
+                with open(candidate, "rb") as f:
+                    return f.read()
+
+        if path == FONTS_CSS:
+            return b""
+        body = self._download(path)
+        if body is not None:
+            self._write_cache(cached, body)
+            return body
+
+        with self._lock:
+            first_miss = path not in self.missing
+            self.missing.add(path)
+        if first_miss:
+            print(f"Warning: fixture asset not in snapshot, serving 404: {path}")
+        return None
+
+    def _snapshot_dirs(self):
+        """Directoarele '<titlu>_files' salvate lângă snapshot-uri"""
+        try:
+            return [os.path.join(self.root, entry) for entry in os.listdir(self.root)
+                    if entry.endswith("_files") and os.path.isdir(os.path.join(self.root, entry))]
+        except OSError:
+            return []
+
+    def _cache_file(self, *parts):
+        return os.path.join(self.cache_dir, *parts)
+
+    def _download(self, path):
+        """Descarcă o singură dată o resursă de pe Netlify (None fără FIXTURE_FETCH_MISSING sau la eroare)"""
+        if not self.fetch_missing:
+            return None
+        try:
+            with urllib.request.urlopen(LIVE_BASE_URL + path, timeout=5) as response:
+                return response.read()
+        except urllib.error.HTTPError:
+            return None
+        except (urllib.error.URLError, OSError) as e:
+            # Fără rețea - nu mai încercăm pentru restul rulării
+            print(f"Warning: fixture server cannot reach Netlify ({e}), missing assets get 404")
+            self.fetch_missing = False
+            return None
+
+    @staticmethod
+    def _read_text(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    @staticmethod
+    def _write_cache(path, body):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: could not cache fixture asset {path}: {e}")
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_fixture_server():
+    """Serverul local al procesului (pornit la primul apel)"""
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = FixtureServer().start()
+        return _server
+
+
+def stop_fixture_server():
+    """Oprește serverul local, dacă rulează"""
+    global _server
+    with _server_lock:
+        if _server is not None:
+            _server.stop()
+            _server = None
+
+
+def uses_fixture_server():
+    """True dacă ELITE_SHOPPY_BASE_URL=local"""
+    return os.environ.get(BASE_URL_ENV, "").strip().lower() == LOCAL_BASE_URL
+
+
+def base_url():
+    """URL-ul de bază al site-ului: ELITE_SHOPPY_BASE_URL, serverul local sau Netlify"""
+    if uses_fixture_server():
+        return start_fixture_server().base_url
+    return (os.environ.get(BASE_URL_ENV, "").strip() or LIVE_BASE_URL).rstrip("/")
+
+
+def page_url(path="/"):
+    """URL-ul complet al unei pagini (ex: page_url('/mens'))"""
+    return base_url() + path
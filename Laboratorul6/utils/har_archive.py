@@ -0,0 +1,375 @@
+"""
+HAR Archive - înregistrează (record) și redă (replay) traficul de rețea prin CDP Fetch
+NETWORK_MODE=live|record|replay, directorul arhivei: HAR_ARCHIVE
+"""
+import base64
+import glob
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+import trio
+import urllib3
+from selenium.webdriver.common.bidi import cdp
+
+
+MODE_LIVE = "live"
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+DEFAULT_ARCHIVE_DIR = "har_archive"
+
+# Antete care nu mai sunt valabile după ce corpul a fost decodat de Chrome
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+# Câte evenimente Fetch pot aștepta procesarea (un canal plin pierde cereri)
+_EVENT_BUFFER_SIZE = 1000
+
+
+def network_mode():
+    """Modul de rețea curent: 'live', 'record' sau 'replay' (variabila NETWORK_MODE)"""
+    mode = os.environ.get("NETWORK_MODE", MODE_LIVE).lower()
+    if mode not in (MODE_LIVE, MODE_RECORD, MODE_REPLAY):
+        raise ValueError(f"Unknown NETWORK_MODE '{mode}'. Use live, record or replay")
+    return mode
+
+
+def archive_dir():
+    """Directorul arhivei HAR (variabila HAR_ARCHIVE sau implicit)"""
+    return os.environ.get("HAR_ARCHIVE", DEFAULT_ARCHIVE_DIR)
+
+
+def _url_without_query(url):
+    """URL-ul fără query string și fragment"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+def _utc_now():
+    """Momentul curent în formatul HAR (ISO 8601, UTC)"""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+class HarArchive:
+    """Arhivă HAR: intrări înregistrate și index pentru căutare la redare"""
+
+    def __init__(self):
+        self.entries = []
+        self._exact = {}
+        self._by_path = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, directory):
+        """Încarcă toate fișierele .har dintr-un director"""
+        archive = cls()
+        files = sorted(glob.glob(os.path.join(directory, "*.har")), key=os.path.getmtime)
+        for path in files:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entries = json.load(f)["log"]["entries"]
+            except (OSError, ValueError, KeyError) as e:
+                print(f"[WARNING] Could not read HAR file {path}: {e}")
+                continue
+            for entry in entries:
+                archive.add(entry)
+        return archive
+
+    def add(self, entry):
+        """Adaugă o intrare HAR și o indexează"""
+        method = entry["request"]["method"]
+        url = entry["request"]["url"]
+        with self._lock:
+            self.entries.append(entry)
+            self._exact[(method, url)] = entry
+            self._by_path[(method, _url_without_query(url))] = entry
+
+    def lookup(self, method, url):
+        """Răspunsul înregistrat pentru o cerere"""
+        with self._lock:
+            entry = self._exact.get((method, url))
+            if entry is None:
+                entry = self._by_path.get((method, _url_without_query(url)))
+            return entry
+
+    def __len__(self):
+        return len(self.entries)
+
+    def save(self, path):
+        """Scrie arhiva ca fișier HAR 1.2 (atomic)"""
+        with self._lock:
+            entries = list(self.entries)
+        har = {
+            "log": {
+                "version": "1.2",
+                "creator": {"name": "behave-har-recorder", "version": "1.0"},
+                "pages": [],
+                "entries": entries,
+            }
+        }
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(har, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+def build_entry(method, url, request_headers, status, status_text, response_headers,
+                mime_type, body, base64_encoded, elapsed):
+    """Construiește o intrare HAR 1.2 pentru un răspuns interceptat"""
+    content = {"size": len(body or ""), "mimeType": mime_type or "", "text": body or ""}
+    if base64_encoded:
+        content["encoding"] = "base64"
+    elapsed_ms = round(elapsed * 1000, 1)
+    return {
+        "startedDateTime": _utc_now(),
+        "time": elapsed_ms,
+        "request": {
+            "method": method,
+            "url": url,
+            "httpVersion": "HTTP/1.1",
+            "cookies": [],
+            "headers": [{"name": k, "value": v} for k, v in (request_headers or {}).items()],
+            "queryString": [],
+            "headersSize": -1,
+            "bodySize": -1,
+        },
+        "response": {
+            "status": status,
+            "statusText": status_text or "",
+            "httpVersion": "HTTP/1.1",
+            "cookies": [],
+            "headers": [{"name": name, "value": value} for name, value in response_headers],
+            "content": content,
+            "redirectURL": "",
+            "headersSize": -1,
+            "bodySize": -1,
+        },
+        "cache": {},
+        "timings": {"send": 0, "wait": elapsed_ms, "receive": 0},
+    }
+
+
+def _cdp_endpoint(driver):
+    """Versiunea majoră Chrome și adresa WebSocket DevTools a browser-ului"""
+    debugger_address = driver.capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+    response = urllib3.PoolManager().request("GET", f"http://{debugger_address}/json/version")
+    data = json.loads(response.data)
+    version = data.get("Browser", "").split("/")[-1].split(".")[0]
+    return version, data.get("webSocketDebuggerUrl")
+
+
+class FetchInterceptor:
+    """Handler CDP Fetch pentru un driver, pe un thread propriu (trio)"""
+
+    def __init__(self, driver, mode, archive, strict=True):
+        self.mode = mode
+        self.archive = archive
+        self.strict = strict
+        self.recorded = 0
+        self.served = 0
+        self.missed = []
+        self._version, self._ws_url = _cdp_endpoint(driver)
+        # Pentru Chrome, handle-ul ferestrei este id-ul target-ului DevTools
+        self._target_id = driver.current_window_handle
+        self._ready = threading.Event()
+        self._error = None
+        self._trio_token = None
+        self._cancel_scope = None
+        self._started = {}
+        self._thread = threading.Thread(target=self._run, name=f"fetch-{mode}", daemon=True)
+
+    def start(self, timeout=10):
+        """Pornește interceptarea și așteaptă activarea Fetch"""
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            raise TimeoutError("Fetch interception did not start in time")
+        if self._error is not None:
+            raise self._error
+
+    def stop(self):
+        """Oprește interceptarea (browser-ul continuă fără ea)"""
+        if self._trio_token is None or self._cancel_scope is None:
+            return
+        try:
+            trio.from_thread.run_sync(self._cancel_scope.cancel, trio_token=self._trio_token)
+        except (RuntimeError, trio.RunFinishedError):
+            pass
+
+    def _run(self):
+        """Bucla trio a thread-ului"""
+        try:
+            trio.run(self._main)
+        except Exception as e:
+            # Browser-ul a fost închis sau conexiunea DevTools s-a pierdut
+            if not self._ready.is_set():
+                self._error = e
+        finally:
+            self._ready.set()
+
+    async def _main(self):
+        """Conectare la target, activare Fetch și tratarea evenimentelor"""
+        self._trio_token = trio.lowlevel.current_trio_token()
+        devtools = cdp.import_devtools(self._version)
+        stage = devtools.fetch.RequestStage.RESPONSE if self.mode == MODE_RECORD \
+            else devtools.fetch.RequestStage.REQUEST
+
+        async with cdp.open_cdp(self._ws_url) as connection:
+            # attach_to_target serializează id-ul cu to_json() - handle-ul este doar un str
+            async with connection.open_session(devtools.target.TargetID(self._target_id)) as session:
+                await session.execute(devtools.fetch.enable(
+                    patterns=[devtools.fetch.RequestPattern(url_pattern="*", request_stage=stage)]
+                ))
+                if self.mode == MODE_RECORD:
+                    await session.execute(devtools.network.enable())
+                events = session.listen(devtools.fetch.RequestPaused, buffer_size=_EVENT_BUFFER_SIZE)
+                requests = session.listen(devtools.network.RequestWillBeSent, buffer_size=_EVENT_BUFFER_SIZE) \
+                    if self.mode == MODE_RECORD else None
+
+                with trio.CancelScope() as scope:
+                    self._cancel_scope = scope
+                    self._ready.set()
+                    async with trio.open_nursery() as nursery:
+                        if requests is not None:
+                            nursery.start_soon(self._track_start_times, requests)
+                        async for event in events:
+                            handler = self._record if self.mode == MODE_RECORD else self._replay
+                            nursery.start_soon(handler, session, devtools, event)
+
+    async def _track_start_times(self, requests):
+        """Momentul plecării fiecărei cereri (pentru durata din HAR)"""
+        async for event in requests:
+            self._started[str(event.request.url)] = time.perf_counter()
+
+    async def _record(self, session, devtools, event):
+        """Salvează răspunsul interceptat și îl lasă să ajungă la pagină"""
+        request_id = event.request_id
+        try:
+            if event.response_error_reason is None and event.response_status_code is not None:
+                status = event.response_status_code
+                body, base64_encoded = "", False
+                # Redirecționările nu au corp
+                if not 300 <= status < 400:
+                    try:
+                        body, base64_encoded = await session.execute(
+                            devtools.fetch.get_response_body(request_id)
+                        )
+                    except Exception:
+                        body, base64_encoded = "", False
+
+                headers = [(h.name, h.value) for h in (event.response_headers or [])]
+                mime_type = next((v for n, v in headers if n.lower() == "content-type"), "")
+                url = event.request.url
+                started = self._started.pop(url, None)
+                self.archive.add(build_entry(
+                    event.request.method, url, dict(event.request.headers or {}),
+                    status, event.response_status_text, headers, mime_type,
+                    body, base64_encoded,
+                    time.perf_counter() - started if started else 0.0
+                ))
+                self.recorded += 1
+        finally:
+            try:
+                await session.execute(devtools.fetch.continue_request(request_id))
+            except Exception:
+                pass
+
+    async def _replay(self, session, devtools, event):
+        """Servește cererea din arhivă (sau o lasă / o respinge dacă lipsește)"""
+        request = event.request
+        entry = self.archive.lookup(request.method, request.url)
+        try:
+            if entry is None:
+                self.missed.append(request.url)
+                if self.strict:
+                    await session.execute(devtools.fetch.fail_request(
+                        event.request_id, devtools.network.ErrorReason.INTERNET_DISCONNECTED
+                    ))
+                else:
+                    await session.execute(devtools.fetch.continue_request(event.request_id))
+                return
+
+            response = entry["response"]
+            content = response.get("content", {})
+            text = content.get("text", "")
+            body = text if content.get("encoding") == "base64" \
+                else base64.b64encode(text.encode("utf-8")).decode("ascii")
+            headers = [
+                devtools.fetch.HeaderEntry(name=h["name"], value=h["value"])
+                for h in response.get("headers", [])
+                if h["name"].lower() not in _DROPPED_HEADERS
+            ]
+            await session.execute(devtools.fetch.fulfill_request(
+                event.request_id,
+                response_code=response["status"],
+                response_headers=headers,
+                body=body,
+                response_phrase=response.get("statusText") or None,
+            ))
+            self.served += 1
+        except Exception:
+            # Pagina a navigat între timp - cererea nu mai există
+            pass
+
+
+_interceptors = []
+_recording = None
+_replay_archive = None
+_registry_lock = threading.Lock()
+
+
+def _recording_archive():
+    """Arhiva comună în care se înregistrează toate driverele procesului"""
+    global _recording
+    with _registry_lock:
+        if _recording is None:
+            _recording = HarArchive()
+        return _recording
+
+
+def _loaded_archive():
+    """Arhiva de redare, încărcată o singură dată per proces"""
+    global _replay_archive
+    with _registry_lock:
+        if _replay_archive is None:
+            _replay_archive = HarArchive.load(archive_dir())
+            print(f"[OK] HAR archive loaded: {len(_replay_archive)} response(s) from {archive_dir()}/")
+        return _replay_archive
+
+
+def attach_network_mode(driver):
+    """Pornește înregistrarea / redarea pe un driver nou, conform NETWORK_MODE"""
+    mode = network_mode()
+    if mode == MODE_LIVE:
+        return None
+    archive = _recording_archive() if mode == MODE_RECORD else _loaded_archive()
+    strict = os.environ.get("HAR_REPLAY_STRICT", "1").lower() not in ("0", "false", "no")
+    interceptor = FetchInterceptor(driver, mode, archive, strict=strict)
+    interceptor.start()
+    with _registry_lock:
+        _interceptors.append(interceptor)
+    return interceptor
+
+
+def save_recording():
+    """Salvează răspunsurile înregistrate de proces (modul 'record')"""
+    if network_mode() != MODE_RECORD or _recording is None or not len(_recording):
+        return None
+    worker = os.environ.get("BEHAVE_WORKER_ID", "main")
+    path = os.path.join(archive_dir(), f"{worker}.har")
+    _recording.save(path)
+    print(f"[OK] Recorded {len(_recording)} response(s) to {path}")
+    return path
+
+
+def replay_misses():
+    """URL-urile cerute la redare care nu existau în arhivă (toate driverele)"""
+    with _registry_lock:
+        interceptors = list(_interceptors)
+    missed = []
+    for interceptor in interceptors:
+        missed.extend(interceptor.missed)
+    return missed
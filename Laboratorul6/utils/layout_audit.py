@@ -0,0 +1,112 @@
+"""
+Layout Audit - suprapuneri între elementele interactive (link-uri, butoane, câmpuri)
+Toate dreptunghiurile sunt citite într-un singur script; suprapunerile sunt găsite în Python cu sweep-line pe axa X
+"""
+import heapq
+
+from utils.element_batch import displayed_atom
+
+
+INTERACTIVE_ELEMENTS = ('a[href], button, input:not([type="hidden"]), select, textarea, '
+                        '[role="button"], [onclick]')
+
+# Sub această valoare (px) pe oricare axă, două elemente doar se ating
+OVERLAP_TOLERANCE = 1
+
+LAYOUT_SCRIPT = """
+var isDisplayed = __IS_DISPLAYED__;
+var all = Array.from(document.querySelectorAll(arguments[0]));
+var index = new Map();
+var visible = all.filter(function (el) { return isDisplayed(el); });
+visible.forEach(function (el, i) { index.set(el, i); });
+
+function label(el) {
+    var text = (el.innerText || el.value || el.getAttribute('aria-label') || '').trim().slice(0, 40);
+    return el.tagName.toLowerCase() + (el.id ? '#' + el.id : '') + (text ? ' "' + text + '"' : '');
+}
+
+return visible.map(function (el) {
+    var r = el.getBoundingClientRect();
+    // Elementele interactive imbricate (ex: buton într-un link) se suprapun firesc
+    var ancestors = [];
+    for (var p = el.parentElement; p; p = p.parentElement) {
+        if (index.has(p)) ancestors.push(index.get(p));
+    }
+    return {
+        left: r.left + window.scrollX, top: r.top + window.scrollY,
+        right: r.right + window.scrollX, bottom: r.bottom + window.scrollY,
+        label: label(el), ancestors: ancestors
+    };
+});
+"""
+
+
+class Box:
+    """Dreptunghiul unui element interactiv (coordonate în pagină)"""
+
+    def __init__(self, index, left, top, right, bottom, label='', ancestors=()):
+        self.index = index
+        self.left = left
+        self.top = top
+        self.right = right
+        self.bottom = bottom
+        self.label = label
+        self.ancestors = set(ancestors)
+
+    @property
+    def width(self):
+        return self.right - self.left
+
+    @property
+    def height(self):
+        return self.bottom - self.top
+
+    def intersection(self, other):
+        """(lățime, înălțime) a zonei comune (negative dacă nu se intersectează)"""
+        return (min(self.right, other.right) - max(self.left, other.left),
+                min(self.bottom, other.bottom) - max(self.top, other.top))
+
+    def is_nested_with(self, other):
+        """Unul dintre elemente este în DOM în interiorul celuilalt"""
+        return other.index in self.ancestors or self.index in other.ancestors
+
+    def __repr__(self):
+        return f"Box({self.label!r}, {self.left:.0f},{self.top:.0f} {self.width:.0f}x{self.height:.0f})"
+
+
+def find_overlaps(boxes, tolerance=OVERLAP_TOLERANCE):
+    """Perechile (a, b) de elemente care se suprapun, găsite cu sweep-line pe axa X"""
+    overlaps = []
+    # Elementele "active" sunt cele încă intersectate de linia de baleiere (heap după marginea dreaptă)
+    active = []
+    for box in sorted(boxes, key=lambda b: b.left):
+        while active and active[0][0] <= box.left + tolerance:
+            heapq.heappop(active)
+        for _, _, other in active:
+            width, height = box.intersection(other)
+            if width > tolerance and height > tolerance and not box.is_nested_with(other):
+                overlaps.append((other, box))
+        if box.width > tolerance and box.height > tolerance:
+            heapq.heappush(active, (box.right, box.index, box))
+    return overlaps
+
+
+class LayoutAudit:
+    """Rezultatul auditului de layout pentru viewport-ul curent"""
+
+    def __init__(self, boxes, tolerance=OVERLAP_TOLERANCE):
+        self.boxes = boxes
+        self.overlaps = find_overlaps(boxes, tolerance)
+
+    @classmethod
+    def capture(cls, driver, selector=INTERACTIVE_ELEMENTS, tolerance=OVERLAP_TOLERANCE):
+        """Citește dreptunghiurile elementelor vizibile într-un singur execute_script"""
+        script = LAYOUT_SCRIPT.replace("__IS_DISPLAYED__", displayed_atom())
+        rects = driver.execute_script(script, selector) or []
+        boxes = [Box(i, r['left'], r['top'], r['right'], r['bottom'], r.get('label', ''), r.get('ancestors', ()))
+                 for i, r in enumerate(rects)]
+        return cls(boxes, tolerance)
+
+    def describe_overlaps(self, limit=5):
+        """Text scurt cu primele suprapuneri (pentru log)"""
+        return "; ".join(f"{a.label} / {b.label}" for a, b in self.overlaps[:limit])
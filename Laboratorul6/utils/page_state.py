@@ -0,0 +1,191 @@
+"""
+Page State - vizibilitate, text, atribute și geometrie pentru un set de locatori, într-un singur script
+Snapshot-ul rămâne valabil până la următoarea navigare, acțiune sau mutație a DOM-ului
+(generația driverului plus contorul ținut la zi de un MutationObserver injectat în pagină)
+"""
+import threading
+import weakref
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.element_batch import displayed_atom
+
+
+# Contorul de mutații din pagină: 'nav' se schimbă la fiecare document nou, 'gen' la fiecare mutație.
+# Doar nodurile și textul - atributele (clasele caruselului, animațiile) se schimbă continuu
+DOM_OBSERVER_SCRIPT = """
+(function () {
+    if (window.__domGeneration) return;
+    var state = window.__domGeneration = {
+        nav: Date.now().toString(36) + Math.random().toString(36).slice(2), gen: 0
+    };
+    state.observer = new MutationObserver(function (records) { state.gen += records.length; });
+    state.observer.observe(document, {childList: true, characterData: true, subtree: true});
+})();
+"""
+
+# Cheia curentă (include mutațiile încă nelivrate observer-ului)
+DOM_KEY_FUNCTION = """
+function domKey() {
+    var state = window.__domGeneration;
+    state.gen += state.observer.takeRecords().length;
+    return state.nav + ':' + state.gen;
+}
+"""
+
+DOM_KEY_SCRIPT = DOM_OBSERVER_SCRIPT + DOM_KEY_FUNCTION + "return domKey();"
+
+
+# Vizibilitatea este calculată cu atomul isDisplayed al Selenium (ca în element_batch)
+PAGE_STATE_SCRIPT = """
+var isDisplayed = __IS_DISPLAYED__;
+var selectors = arguments[0];
+var scrollX = window.scrollX, scrollY = window.scrollY;
+
+function visible(el) {
+    return !!isDisplayed(el);
+}
+
+function rect(el) {
+    // Coordonate în pagină (nu în viewport) - scroll-ul nu invalidează snapshot-ul
+    var r = el.getBoundingClientRect();
+    return {x: r.left + scrollX, y: r.top + scrollY, width: r.width, height: r.height,
+            displayed: visible(el)};
+}
+
+var elements = {};
+selectors.forEach(function (selector) {
+    var matches = Array.from(document.querySelectorAll(selector));
+    var first = matches[0];
+    var entry = {count: matches.length, rects: matches.map(rect)};
+    if (first) {
+        entry.displayed = entry.rects[0].displayed;
+        entry.enabled = !first.disabled;
+        entry.text = entry.displayed ? (first.innerText || '').trim() : '';
+        entry.attributes = {};
+        Array.from(first.attributes).forEach(function (a) { entry.attributes[a.name] = a.value; });
+        entry.rect = entry.rects[0];
+    }
+    elements[selector] = entry;
+});
+
+var root = document.documentElement, body = document.body || root;
+return {
+    dom: domKey(),
+    url: location.href,
+    viewport: {
+        width: window.innerWidth,
+        height: window.innerHeight,
+        scroll_width: Math.max(body.scrollWidth, root.scrollWidth),
+        scroll_height: Math.max(body.scrollHeight, root.scrollHeight)
+    },
+    elements: elements
+};
+"""
+
+
+# Generația DOM-ului per driver: crește la navigare și la acțiunile care modifică pagina
+_generations = weakref.WeakKeyDictionary()
+_generations_lock = threading.Lock()
+
+
+def dom_generation(driver):
+    """Generația curentă a DOM-ului pentru un driver"""
+    with _generations_lock:
+        return _generations.get(driver, 0)
+
+
+def mark_dom_changed(driver):
+    """Invalidează snapshot-urile driverului (navigare, click, text introdus, resize)"""
+    with _generations_lock:
+        _generations[driver] = _generations.get(driver, 0) + 1
+
+
+def install_dom_observer(driver):
+    """Injectează observer-ul de mutații în fiecare document nou al tab-ului curent (CDP)"""
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": DOM_OBSERVER_SCRIPT})
+    except (WebDriverException, AttributeError):
+        # Fără CDP observer-ul este pus la prima citire din fiecare document
+        pass
+
+
+def dom_key(driver):
+    """Cheia DOM-ului din pagină (document:mutații); None dacă nu poate fi citită"""
+    try:
+        return driver.execute_script(DOM_KEY_SCRIPT)
+    except WebDriverException:
+        return None
+
+
+def page_generation(driver):
+    """Generația completă: acțiunile din Python și mutațiile făcute de pagină (conținut async, redirect)"""
+    return dom_generation(driver), dom_key(driver)
+
+
+class PageState:
+    """Snapshot-ul paginii pentru locatorii declarați"""
+
+    def __init__(self, data, generation):
+        # (generația driverului, cheia DOM-ului din pagină la captură)
+        self.url = data.get('url')
+        self.viewport = data.get('viewport', {})
+        self.elements = data.get('elements', {})
+        self.generation = (generation, data.get('dom'))
+
+    @classmethod
+    def capture(cls, driver, locators):
+        """Citește starea tuturor locatorilor într-un singur execute_script"""
+        generation = dom_generation(driver)
+        script = DOM_OBSERVER_SCRIPT + DOM_KEY_FUNCTION + PAGE_STATE_SCRIPT.replace("__IS_DISPLAYED__", displayed_atom())
+        data = driver.execute_script(script, list(locators)) or {}
+        return cls(data, generation)
+
+    def covers(self, locators):
+        """True dacă snapshot-ul conține toți locatorii ceruți"""
+        return all(locator in self.elements for locator in locators)
+
+    def is_current(self, driver):
+        """True dacă nu a avut loc nicio navigare / acțiune / mutație de la captură (un script mic, fără DOM)"""
+        return self.generation[1] is not None and self.generation == page_generation(driver)
+
+    def count(self, locator):
+        """Numărul de elemente găsite"""
+        return self.elements.get(locator, {}).get('count', 0)
+
+    def is_present(self, locator):
+        """Cel puțin un element există în DOM"""
+        return self.count(locator) > 0
+
+    def is_displayed(self, locator):
+        """Primul element este vizibil"""
+        return bool(self.elements.get(locator, {}).get('displayed'))
+
+    def is_enabled(self, locator):
+        """Primul element este activ"""
+        return bool(self.elements.get(locator, {}).get('enabled'))
+
+    def text(self, locator):
+        """Textul vizibil al primului element ('' dacă lipsește)"""
+        return self.elements.get(locator, {}).get('text', '')
+
+    def attribute(self, locator, name):
+        """Atributul primului element (None dacă lipsește)"""
+        return self.elements.get(locator, {}).get('attributes', {}).get(name)
+
+    def rect(self, locator):
+        """Geometria primului element (x, y, width, height în pagină)"""
+        return self.elements.get(locator, {}).get('rect')
+
+    def rects(self, locator, displayed_only=False):
+        """Geometria tuturor elementelor găsite (x, y, width, height, displayed)"""
+        rects = self.elements.get(locator, {}).get('rects', [])
+        return [rect for rect in rects if rect['displayed']] if displayed_only else rects
+
+    def has_horizontal_scroll(self):
+        """Conținutul este mai lat decât fereastra"""
+        return self.viewport.get('scroll_width', 0) > self.viewport.get('width', 0)
+
+    def has_vertical_scroll(self):
+        """Conținutul este mai înalt decât fereastra"""
+        return self.viewport.get('scroll_height', 0) > self.viewport.get('height', 0)
@@ -0,0 +1,83 @@
+"""
+Page Timing - metricile de încărcare din Navigation Timing și Paint Timing, citite într-un singur apel
+Valorile sunt în milisecunde față de începutul navigării (None dacă evenimentul nu a avut loc încă)
+"""
+
+
+# Numele metricilor, așa cum apar în pașii din feature-uri
+METRICS = ("ttfb", "dom_content_loaded", "load", "first_contentful_paint")
+
+# Alias-uri acceptate în pași (ex: "FCP", "DOMContentLoaded")
+METRIC_ALIASES = {
+    "ttfb": "ttfb",
+    "time to first byte": "ttfb",
+    "domcontentloaded": "dom_content_loaded",
+    "dom content loaded": "dom_content_loaded",
+    "dom_content_loaded": "dom_content_loaded",
+    "load": "load",
+    "fcp": "first_contentful_paint",
+    "first contentful paint": "first_contentful_paint",
+    "first_contentful_paint": "first_contentful_paint",
+}
+
+PAGE_TIMING_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+var fcp = performance.getEntriesByType('paint').filter(function (e) {
+    return e.name === 'first-contentful-paint';
+})[0];
+function at(value) { return value > 0 ? value : null; }
+if (!nav) return {url: location.href, fcp: fcp ? fcp.startTime : null};
+return {
+    url: nav.name,
+    type: nav.type,
+    ttfb: at(nav.responseStart),
+    dom_content_loaded: at(nav.domContentLoadedEventEnd),
+    load: at(nav.loadEventEnd),
+    first_contentful_paint: fcp ? fcp.startTime : null,
+    transfer_size: nav.transferSize
+};
+"""
+
+
+def metric_name(name):
+    """Numele intern al unei metrici (ValueError pentru nume necunoscute)"""
+    key = METRIC_ALIASES.get(name.strip().lower())
+    if key is None:
+        raise ValueError(f"Unknown page timing metric '{name}'. Available: {', '.join(METRICS)}")
+    return key
+
+
+class PageTiming:
+    """Metricile de încărcare ale documentului curent (ms)"""
+
+    def __init__(self, data):
+        self.url = data.get('url')
+        self.navigation_type = data.get('type')
+        self.transfer_size = data.get('transfer_size')
+        self.metrics = {name: data.get(name) for name in METRICS}
+
+    @classmethod
+    def capture(cls, driver):
+        """Citește Navigation Timing și Paint Timing într-un singur execute_script"""
+        return cls(driver.execute_script(PAGE_TIMING_SCRIPT) or {})
+
+    def __getitem__(self, name):
+        return self.metrics[metric_name(name)]
+
+    @property
+    def complete(self):
+        """True dacă evenimentul load s-a terminat"""
+        return self.metrics['load'] is not None
+
+    def over_budget(self, budgets):
+        """Metricile peste buget: {metrică: (valoare, buget)}; o metrică lipsă este considerată depășită"""
+        failures = {}
+        for name, budget in budgets.items():
+            value = self[name]
+            if value is None or value > budget:
+                failures[metric_name(name)] = (value, budget)
+        return failures
+
+    def __str__(self):
+        return ", ".join(f"{name}={'n/a' if value is None else f'{value:.0f}ms'}"
+                         for name, value in self.metrics.items())
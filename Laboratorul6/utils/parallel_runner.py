@@ -0,0 +1,224 @@
+"""
+Parallel Runner - împarte suita Behave între mai mulți worker-i
+Fiecare worker are propriul Chrome headless; rapoartele JSON sunt unite la final
+"""
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from behave.parser import parse_file
+
+from utils.shard_scheduler import DurationHistory, plan_shards
+
+
+SERIAL_TAG = "serial"
+
+
+class TestUnit:
+    """O unitate de lucru pentru un worker: un feature întreg sau un scenariu"""
+
+    def __init__(self, path, name, line=None, tags=None, scenarios=None):
+        self.path = path
+        self.name = name
+        self.line = line
+        self.tags = tags or []
+        self.scenarios = scenarios or []
+
+    @property
+    def location(self):
+        """Argumentul Behave pentru unitate (ex: features/a.feature:12)"""
+        return self.path if self.line is None else f"{self.path}:{self.line}"
+
+    @property
+    def is_serial(self):
+        """True dacă unitatea trebuie rulată singură"""
+        return SERIAL_TAG in self.tags
+
+    def __repr__(self):
+        return f"TestUnit({self.location!r})"
+
+
+def discover_units(paths="features", granularity="feature"):
+    """Descoperă unitățile de test din fișierele/directoarele date"""
+    if isinstance(paths, str):
+        paths = [paths]
+
+    feature_paths = []
+    for path in paths:
+        if os.path.isfile(path):
+            feature_paths.append(path.replace(os.sep, "/"))
+            continue
+        for root, _, files in os.walk(path):
+            for filename in files:
+                if filename.endswith(".feature"):
+                    feature_paths.append(os.path.join(root, filename).replace(os.sep, "/"))
+
+    units = []
+    for path in sorted(feature_paths):
+        feature = parse_file(path)
+        if feature is None:
+            continue
+
+        scenario_units = [
+            TestUnit(path, scenario.name, scenario.line, list(feature.tags) + list(scenario.tags))
+            for scenario in feature.scenarios
+        ]
+
+        # Un feature cu scenarii @serial este mereu spart pe scenarii
+        has_serial = any(unit.is_serial for unit in scenario_units)
+        if granularity == "scenario" or has_serial:
+            units.extend(scenario_units)
+        else:
+            units.append(TestUnit(path, feature.name, None, list(feature.tags), scenario_units))
+
+    return units
+
+
+def build_shards(units, workers, history=None):
+    """Împarte unitățile în `workers` grupuri care termină cam în același timp"""
+    if not units:
+        return []
+    planned = plan_shards(units, workers, history or DurationHistory())
+    for index, (shard, estimate) in enumerate(planned):
+        print(f"[INFO] Worker {index + 1}: {len(shard)} unit(s), estimated {estimate:.1f}s")
+    return [shard for shard, _ in planned]
+
+
+def run_shard(worker_id, units, output_file, log_file, extra_args=None):
+    """Rulează un grup de unități într-un proces Behave separat (Chrome headless)"""
+    cmd = [
+        sys.executable, "-m", "behave",
+        *[unit.location for unit in units],
+        "--format", "json",
+        "--outfile", output_file,
+        "--format", "plain",
+        "--no-capture",
+        "--no-capture-stderr",
+    ] + list(extra_args or [])
+
+    env = os.environ.copy()
+    env["PYTHONIOENCODING"] = "utf-8"
+    env["BEHAVE_WORKER_ID"] = str(worker_id)
+    env["HEADLESS"] = "1"
+
+    with open(log_file, "w", encoding="utf-8") as log:
+        result = subprocess.run(cmd, cwd=os.getcwd(), env=env, stdout=log, stderr=subprocess.STDOUT)
+    return result.returncode
+
+
+def merge_json_reports(report_files, output_file):
+    """Unește rapoartele JSON Behave ale worker-ilor într-unul singur"""
+    merged = {}
+    order = []
+
+    for report_file in report_files:
+        try:
+            with open(report_file, "r", encoding="utf-8") as f:
+                features = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] Could not read worker report {report_file}: {e}")
+            continue
+
+        for feature in features:
+            key = feature.get("location", "").split(":")[0] or feature.get("name")
+            if key not in merged:
+                merged[key] = dict(feature, elements=[])
+                order.append(key)
+            target = merged[key]
+
+            for element in feature.get("elements", []):
+                if element.get("type") == "background":
+                    if not any(e.get("type") == "background" for e in target["elements"]):
+                        target["elements"].append(element)
+                    continue
+
+                # Behave raportează ca 'skipped' și scenariile nealese pentru worker;
+                # se păstrează rezultatul worker-ului care chiar a rulat scenariul
+                existing = next(
+                    (i for i, e in enumerate(target["elements"])
+                     if e.get("location") == element.get("location")),
+                    None
+                )
+                if existing is None:
+                    target["elements"].append(element)
+                elif target["elements"][existing].get("status") == "skipped" \
+                        and element.get("status") != "skipped":
+                    target["elements"][existing] = element
+
+
+    def _line(element):
+        try:
+            return int(element.get("location", "").rsplit(":", 1)[1])
+        except (IndexError, ValueError):
+            return 0
+
+    result = []
+    for key in order:
+        feature = merged[key]
+        feature["elements"].sort(key=_line)
+        statuses = {e.get("status") for e in feature["elements"] if e.get("type") != "background"}
+        if "failed" in statuses:
+            feature["status"] = "failed"
+        elif "passed" in statuses:
+            feature["status"] = "passed"
+        result.append(feature)
+
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+
+    return result
+
+
+def run_parallel(workers, output_file, paths="features", granularity="feature",
+                 work_dir="workers", extra_args=None, history_files=None):
+    """Rulează suita în paralel și produce raportul JSON unit"""
+    os.makedirs(work_dir, exist_ok=True)
+
+    # Istoricul duratelor se citește înainte ca rularea curentă să suprascrie rapoartele
+    if history_files is None:
+        history_files = [output_file] + [
+            os.path.join(work_dir, f) for f in os.listdir(work_dir) if f.endswith(".json")
+        ]
+    history = DurationHistory(history_files)
+    print(f"[INFO] Duration history: {len(history)} scenario(s) with recorded durations")
+
+    units = discover_units(paths, granularity)
+    parallel_units = [unit for unit in units if not unit.is_serial]
+    serial_units = [unit for unit in units if unit.is_serial]
+    shards = build_shards(parallel_units, workers, history)
+
+    print(f"[INFO] {len(units)} unit(s): {len(shards)} parallel shard(s), "
+          f"{len(serial_units)} @serial scenario(s)")
+
+    report_files = []
+    return_codes = []
+
+    def _run(worker_id, shard):
+        output = os.path.join(work_dir, f"worker-{worker_id}.json")
+        log = os.path.join(work_dir, f"worker-{worker_id}.log")
+        if os.path.exists(output):
+            os.remove(output)
+        code = run_shard(worker_id, shard, output, log, extra_args)
+        print(f"[{'OK' if code == 0 else 'X'}] Worker {worker_id} finished "
+              f"({len(shard)} unit(s), exit code {code}) - log: {log}")
+        return output, code
+
+    with ThreadPoolExecutor(max_workers=max(1, len(shards))) as executor:
+        futures = [executor.submit(_run, index + 1, shard) for index, shard in enumerate(shards)]
+        for future in futures:
+            output, code = future.result()
+            report_files.append(output)
+            return_codes.append(code)
+
+    # Scenariile @serial rulează la final, câte unul, fără alți worker-i activi
+    for index, unit in enumerate(serial_units):
+        output, code = _run(f"serial-{index + 1}", [unit])
+        report_files.append(output)
+        return_codes.append(code)
+
+    merge_json_reports(report_files, output_file)
+    print(f"[OK] Merged {len(report_files)} worker report(s) into {output_file}")
+
+    return next((code for code in return_codes if code != 0), 0)
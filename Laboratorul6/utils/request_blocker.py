@@ -0,0 +1,263 @@
+"""
+Request Blocker - blochează analytics, reclame, fonturi și imagini prin Network.setBlockedURLs
+Seturile de reguli se aleg cu REQUEST_BLOCKING sau cu tag-uri @block-<set>
+"""
+import fnmatch
+import json
+import os
+import threading
+import weakref
+from urllib.parse import urlsplit
+
+from utils.network_events import is_blocked_failure, network_events
+
+
+# Tag-urile de forma @block-<set> aleg seturile de reguli; @block-none le dezactivează
+BLOCK_TAG_PREFIX = "block-"
+NO_BLOCKING = "none"
+
+BLOCK_RULESETS = {
+    "analytics": [
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*analytics.google.com*",
+        "*hotjar.com*",
+        "*connect.facebook.net*",
+        "*clarity.ms*",
+    ],
+    "ads": [
+        "*doubleclick.net*",
+        "*googlesyndication.com*",
+        "*googleadservices.com*",
+        "*adservice.google.*",
+        "*/pagead/*",
+    ],
+    "fonts": [
+        "*fonts.googleapis.com*",
+        "*fonts.gstatic.com*",
+        "*.woff",
+        "*.woff2",
+        "*.ttf",
+        "*.otf",
+        "*.eot",
+    ],
+    "images": [
+        "*.png",
+        "*.jpg",
+        "*.jpeg",
+        "*.gif",
+        "*.webp",
+        "*.bmp",
+    ],
+    "media": [
+        "*.mp4",
+        "*.webm",
+        "*.mp3",
+        "*.ogg",
+    ],
+}
+
+# Seturi compuse
+BLOCK_RULESETS["third-party"] = BLOCK_RULESETS["analytics"] + BLOCK_RULESETS["ads"]
+BLOCK_RULESETS["heavy"] = BLOCK_RULESETS["fonts"] + BLOCK_RULESETS["images"] + BLOCK_RULESETS["media"]
+
+DEFAULT_SIZE_CACHE_PATH = "resource_sizes.json"
+
+
+def rulesets_from_tags(tags, default=None):
+    """Seturile de reguli cerute prin tag-uri (@block-<set>), altfel cele implicite"""
+    names = [tag[len(BLOCK_TAG_PREFIX):] for tag in tags if tag.startswith(BLOCK_TAG_PREFIX)]
+    if not names:
+        default = os.environ.get("REQUEST_BLOCKING", "") if default is None else default
+        names = [name.strip() for name in default.split(",") if name.strip()]
+    if NO_BLOCKING in names:
+        return []
+
+    unknown = [name for name in names if name not in BLOCK_RULESETS]
+    if unknown:
+        raise ValueError(f"Unknown request blocking ruleset(s): {', '.join(unknown)}. "
+                         f"Available: {', '.join(sorted(BLOCK_RULESETS))}")
+    return names
+
+
+def allowlist_patterns():
+    """Tiparele care nu sunt blocate niciodată (REQUEST_ALLOWLIST, separate prin virgulă)"""
+    value = os.environ.get("REQUEST_ALLOWLIST", "")
+    return [pattern.strip() for pattern in value.split(",") if pattern.strip()]
+
+
+def resolve_patterns(rulesets, extra=None, allow=None):
+    """Lista finală de tipare de blocat"""
+    # setBlockedURLs nu are excepții - allowlist-ul elimină tiparele blocate care se suprapun
+    patterns = []
+    for name in rulesets:
+        patterns.extend(BLOCK_RULESETS[name])
+    patterns.extend(extra or [])
+
+    allow = allow or []
+    result = []
+    for pattern in patterns:
+        if pattern in result:
+            continue
+        if any(fnmatch.fnmatch(pattern, a) or fnmatch.fnmatch(a, pattern) for a in allow):
+            continue
+        result.append(pattern)
+    return result
+
+
+def _size_key(url):
+    """Cheia unei resurse în cache-ul de dimensiuni (fără query string / fragment)"""
+    parts = urlsplit(url or "")
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+class ResourceSizeCache:
+    """Dimensiunile (bytes transferați) observate pentru fiecare resursă"""
+
+    def __init__(self, path=None):
+        self.path = path or os.environ.get("RESOURCE_SIZE_CACHE", DEFAULT_SIZE_CACHE_PATH)
+        self._sizes = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._sizes = json.load(f)
+        except (OSError, ValueError):
+            self._sizes = {}
+
+    def record(self, url, size):
+        """Salvează dimensiunea observată a unei resurse"""
+        if not url or not size:
+            return
+        key = _size_key(url)
+        with self._lock:
+            if self._sizes.get(key) != size:
+                self._sizes[key] = size
+                self._dirty = True
+
+    def estimate(self, url):
+        """Dimensiunea cunoscută a unei resurse (None dacă nu a fost văzută)"""
+        with self._lock:
+            return self._sizes.get(_size_key(url))
+
+    def save(self):
+        """Scrie cache-ul pe disc (atomic) dacă s-a modificat"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = dict(self._sizes)
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[WARNING] Could not save resource size cache: {e}")
+
+
+class BlockReport:
+    """Ce a blocat RequestBlocker într-un scenariu"""
+
+    def __init__(self, requests=0, bytes_blocked=0, unknown_sizes=0, urls=None):
+        self.requests = requests
+        self.bytes_blocked = bytes_blocked
+        self.unknown_sizes = unknown_sizes
+        self.urls = urls or []
+
+    def __str__(self):
+        text = f"{self.requests} request(s), ~{self.bytes_blocked / 1024:.1f} KB"
+        if self.unknown_sizes:
+            text += f" ({self.unknown_sizes} with unknown size)"
+        return text
+
+
+class RequestBlocker:
+    """Aplică tiparele de blocare pe un driver și raportează efectul"""
+
+    def __init__(self, driver, size_cache=None):
+        self._driver = weakref.ref(driver)
+        self.size_cache = size_cache or get_size_cache()
+        self.base_patterns = []
+        self.rulesets = []
+        self.patterns = []
+
+    def set_base_patterns(self, patterns):
+        """Tipare blocate mereu pentru acest driver (ex: fonturile profilului 'fast')"""
+        self.base_patterns = list(patterns)
+        self.apply(self.rulesets)
+
+    def apply(self, rulesets):
+        """Activează seturile de reguli (înlocuiesc pe cele anterioare)"""
+        patterns = resolve_patterns(rulesets, self.base_patterns, allowlist_patterns())
+        self.rulesets = list(rulesets)
+        if patterns == self.patterns:
+            return
+        driver = self._driver()
+        if driver is None:
+            return
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        self.patterns = patterns
+
+    def apply_to_current_target(self):
+        """Aplică tiparele active pe tab-ul curent (setBlockedURLs este per target, ex: un tab nou)"""
+        driver = self._driver()
+        if driver is None or not self.patterns:
+            return
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
+
+    def report(self):
+        """Cererile blocate în scenariul curent (din buffer-ul de evenimente)"""
+        driver = self._driver()
+        if driver is None:
+            return BlockReport()
+        events = network_events(driver)
+        events.drain()
+        urls = events.request_urls()
+
+        for event in events.by_method("Network.loadingFinished"):
+            self.size_cache.record(urls.get(event.params.get("requestId")),
+                                   int(event.params.get("encodedDataLength") or 0))
+
+        report = BlockReport()
+        for event in events.by_method("Network.loadingFailed"):
+            params = event.params
+            if not is_blocked_failure(params):
+                continue
+            url = urls.get(params.get("requestId"))
+            report.requests += 1
+            report.urls.append(url)
+            size = self.size_cache.estimate(url)
+            if size is None:
+                report.unknown_sizes += 1
+            else:
+                report.bytes_blocked += size
+        return report
+
+
+_size_cache = None
+_blockers = weakref.WeakKeyDictionary()
+_registry_lock = threading.Lock()
+
+
+def get_size_cache():
+    """Cache-ul comun de dimensiuni al procesului"""
+    global _size_cache
+    with _registry_lock:
+        if _size_cache is None:
+            _size_cache = ResourceSizeCache()
+        return _size_cache
+
+
+def request_blocker(driver):
+    """RequestBlocker-ul unui driver (creat la primul apel)"""
+    size_cache = get_size_cache()
+    with _registry_lock:
+        blocker = _blockers.get(driver)
+        if blocker is None:
+            blocker = RequestBlocker(driver, size_cache)
+            _blockers[driver] = blocker
+        return blocker
@@ -0,0 +1,296 @@
+"""
+Resource Waterfall - toate resursele încărcate într-un scenariu (CSS, JS, imagini, fonturi), din evenimentele de rețea
+Raportul ordonează resursele după durată și mărime, marchează cererile eșuate și cele care blochează randarea
+și este atașat scenariului în raportul JSON Behave (attach_waterfalls)
+"""
+import json
+import os
+import threading
+from datetime import datetime
+from urllib.parse import urlsplit
+
+from utils.network_events import is_blocked_failure, network_events
+from utils.startup_profiler import current_run_id, load_records
+
+
+DEFAULT_WATERFALL_LOG = "resource_waterfall.jsonl"
+
+# Câte resurse se păstrează în clasamente (cele eșuate / blocante se păstrează toate)
+TOP_RESOURCES = 10
+
+# Cheia sub care raportul este pus în scenariul din JSON-ul Behave
+REPORT_KEY = "resource_waterfall"
+
+# Tipurile CDP (Network.ResourceType) grupate ca în raport
+RESOURCE_KINDS = {
+    "Stylesheet": "css",
+    "Script": "js",
+    "Image": "image",
+    "Font": "font",
+    "Document": "document",
+    "Media": "media",
+    "XHR": "xhr",
+    "Fetch": "xhr",
+}
+
+# Resource Timing pentru documentul curent: renderBlockingStatus (Chrome 107+) și fallback fără CDP
+RESOURCE_TIMING_SCRIPT = """
+return performance.getEntriesByType('resource').map(function (e) {
+    return {
+        url: e.name, initiator: e.initiatorType, start: e.startTime, duration: e.duration,
+        transfer_size: e.transferSize || 0, status: e.responseStatus || null,
+        render_blocking: e.renderBlockingStatus ? e.renderBlockingStatus === 'blocking' : null
+    };
+});
+"""
+
+_INITIATOR_KINDS = {"link": "css", "css": "image", "script": "js", "img": "image",
+                    "xmlhttprequest": "xhr", "fetch": "xhr"}
+_EXTENSION_KINDS = {".css": "css", ".js": "js", ".woff": "font", ".woff2": "font", ".ttf": "font",
+                    ".otf": "font", ".eot": "font", ".png": "image", ".jpg": "image", ".jpeg": "image",
+                    ".gif": "image", ".webp": "image", ".svg": "image", ".ico": "image"}
+
+_write_lock = threading.Lock()
+
+
+def _kind_from_url(url, fallback="other"):
+    """Tipul resursei după extensia din URL"""
+    extension = os.path.splitext(urlsplit(url or "").path)[1].lower()
+    return _EXTENSION_KINDS.get(extension, fallback)
+
+
+class ResourceEntry:
+    """O resursă din waterfall (timpii în ms față de prima cerere a scenariului)"""
+
+    def __init__(self, url, kind, start=0.0, duration=None, transfer_size=0, status=None,
+                 error=None, render_blocking=False, document=None):
+        self.url = url
+        self.kind = kind
+        self.start = start
+        self.duration = duration
+        self.transfer_size = transfer_size
+        self.status = status
+        self.error = error
+        self.render_blocking = render_blocking
+        self.document = document
+
+    @property
+    def failed(self):
+        return bool(self.error) or (self.status is not None and self.status >= 400)
+
+    def to_dict(self):
+        return {
+            "url": self.url,
+            "kind": self.kind,
+            "start_ms": round(self.start, 1),
+            "duration_ms": None if self.duration is None else round(self.duration, 1),
+            "transfer_size": self.transfer_size,
+            "status": self.status,
+            "error": self.error,
+            "render_blocking": self.render_blocking,
+            "document": self.document,
+        }
+
+    def __repr__(self):
+        return f"ResourceEntry({self.kind} {self.url})"
+
+
+def entries_from_events(events):
+    """Resursele din evenimentele Network.* ale scenariului (toate navigările, inclusiv cererile eșuate)"""
+    requests = {}
+    first_timestamp = None
+    for event in events.by_method("Network.requestWillBeSent", "Network.responseReceived",
+                                  "Network.loadingFinished", "Network.loadingFailed"):
+        params = event.params
+        request_id = params.get("requestId")
+        if event.method == "Network.requestWillBeSent":
+            # Un redirect refolosește requestId-ul - rămâne ultima cerere
+            first_timestamp = params.get("timestamp") if first_timestamp is None else first_timestamp
+            request = params.get("request", {})
+            initiator = params.get("initiator", {}).get("type")
+            requests[request_id] = {
+                "url": request.get("url"), "type": params.get("type"),
+                "start": params.get("timestamp"), "document": params.get("documentURL"),
+                # Aproximare: foile de stil din parser și scripturile sincrone (prioritate High) blochează randarea
+                "render_blocking": initiator == "parser" and (
+                    params.get("type") == "Stylesheet"
+                    or (params.get("type") == "Script" and request.get("initialPriority") in ("High", "VeryHigh"))),
+            }
+            continue
+        request = requests.get(request_id)
+        if request is None:
+            continue
+        if event.method == "Network.responseReceived":
+            request["status"] = params.get("response", {}).get("status")
+            request["type"] = params.get("type") or request["type"]
+        elif event.method == "Network.loadingFinished":
+            request["end"] = params.get("timestamp")
+            request["transfer_size"] = int(params.get("encodedDataLength") or 0)
+        elif not params.get("canceled") and not is_blocked_failure(params):
+            request["end"] = params.get("timestamp")
+            request["error"] = params.get("errorText")
+
+    entries = []
+    for request in requests.values():
+        if not request.get("url") or request["url"].startswith("data:"):
+            continue
+        start = request.get("start") or first_timestamp or 0
+        end = request.get("end")
+        entries.append(ResourceEntry(
+            request["url"],
+            RESOURCE_KINDS.get(request.get("type"), _kind_from_url(request["url"])),
+            start=(start - (first_timestamp or start)) * 1000,
+            duration=None if end is None else (end - start) * 1000,
+            transfer_size=request.get("transfer_size", 0),
+            status=request.get("status"),
+            error=request.get("error"),
+            render_blocking=request["render_blocking"],
+            document=request.get("document"),
+        ))
+    return entries
+
+
+def entries_from_resource_timing(timings, document=None):
+    """Resursele documentului curent din Resource Timing (fără CDP; cererile eșuate nu apar toate)"""
+    return [
+        ResourceEntry(t["url"], _kind_from_url(t["url"], _INITIATOR_KINDS.get(t.get("initiator"), "other")),
+                      start=t.get("start") or 0.0, duration=t.get("duration"),
+                      transfer_size=t.get("transfer_size") or 0, status=t.get("status"),
+                      render_blocking=bool(t.get("render_blocking")), document=document)
+        for t in timings if t.get("url")
+    ]
+
+
+class ResourceWaterfall:
+    """Waterfall-ul de resurse al unui scenariu"""
+
+    def __init__(self, entries, source="network"):
+        self.entries = entries
+        self.source = source
+
+    @classmethod
+    def capture(cls, driver):
+        """Resursele scenariului: evenimentele de rețea, completate cu renderBlockingStatus din Resource Timing"""
+        try:
+            timings = driver.execute_script(RESOURCE_TIMING_SCRIPT) or []
+            document = driver.current_url
+        except Exception:
+            timings, document = [], None
+
+        events = network_events(driver)
+        events.drain()
+        entries = entries_from_events(events)
+        if not entries:
+            # Fără log-ul 'performance' (RESOURCE_WATERFALL / @network-events): doar documentul curent
+            return cls(entries_from_resource_timing(timings, document), source="resource-timing")
+
+        # Unde browser-ul raportează renderBlockingStatus, acesta înlocuiește aproximarea
+        blocking = {t["url"]: t["render_blocking"] for t in timings if t.get("render_blocking") is not None}
+        for entry in entries:
+            if entry.document == document and entry.url in blocking:
+                entry.render_blocking = blocking[entry.url]
+        return cls(entries)
+
+    def of_kind(self, *kinds):
+        return [entry for entry in self.entries if entry.kind in kinds]
+
+    def slowest(self, limit=TOP_RESOURCES):
+        timed = [entry for entry in self.entries if entry.duration is not None]
+        return sorted(timed, key=lambda entry: -entry.duration)[:limit]
+
+    def largest(self, limit=TOP_RESOURCES):
+        return sorted(self.entries, key=lambda entry: -entry.transfer_size)[:limit]
+
+    @property
+    def failed(self):
+        return [entry for entry in self.entries if entry.failed]
+
+    @property
+    def render_blocking(self):
+        return [entry for entry in self.entries if entry.render_blocking]
+
+    def to_record(self, scenario=None, location=None):
+        """Înregistrarea JSON a waterfall-ului (clasamentele, nu toate resursele)"""
+        by_kind = {}
+        for entry in self.entries:
+            stats = by_kind.setdefault(entry.kind, {"count": 0, "transfer_size": 0})
+            stats["count"] += 1
+            stats["transfer_size"] += entry.transfer_size
+        return {
+            "run_id": current_run_id(),
+            "timestamp": datetime.now().isoformat(timespec="milliseconds"),
+            "worker": os.environ.get("BEHAVE_WORKER_ID", "main"),
+            "scenario": scenario,
+            "location": location,
+            "source": self.source,
+            "resources": len(self.entries),
+            "transfer_size": sum(entry.transfer_size for entry in self.entries),
+            "by_kind": by_kind,
+            "slowest": [entry.to_dict() for entry in self.slowest()],
+            "largest": [entry.to_dict() for entry in self.largest()],
+            "failed": [entry.to_dict() for entry in self.failed],
+            "render_blocking": [entry.to_dict() for entry in self.render_blocking],
+        }
+
+    def summary(self, limit=3):
+        """Câteva linii pentru consolă"""
+        lines = [f"{len(self.entries)} resource(s), {sum(e.transfer_size for e in self.entries) / 1024:.1f} KB, "
+                 f"{len(self.failed)} failed, {len(self.render_blocking)} render-blocking"]
+        for entry in self.slowest(limit):
+            lines.append(f"  {entry.duration:8.0f}ms {entry.transfer_size / 1024:8.1f} KB  {entry.kind:<8} {entry.url}")
+        for entry in self.failed[:limit]:
+            lines.append(f"  FAILED {entry.status or entry.error}  {entry.url}")
+        return "\n".join(lines)
+
+
+def waterfall_enabled():
+    """RESOURCE_WATERFALL=1 cere log-ul 'performance' în toate scenariile (waterfall pentru toate navigările)"""
+    return os.environ.get("RESOURCE_WATERFALL", "").lower() in ("1", "true", "yes")
+
+
+def waterfall_log_path():
+    """Fișierul JSONL cu waterfall-urile (variabila RESOURCE_WATERFALL_LOG sau implicit)"""
+    return os.environ.get("RESOURCE_WATERFALL_LOG", DEFAULT_WATERFALL_LOG)
+
+
+def save_waterfall(record, path=None):
+    """Adaugă înregistrarea unui scenariu în fișierul JSONL"""
+    path = path or waterfall_log_path()
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with _write_lock, open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except OSError as e:
+        print(f"Warning: could not write resource waterfall: {e}")
+    return record
+
+
+def load_waterfalls(path=None, run_id=None):
+    """Citește waterfall-urile din fișierul JSONL"""
+    return load_records(path or waterfall_log_path(), run_id)
+
+
+def attach_waterfalls(report_file, records):
+    """Pune waterfall-ul fiecărui scenariu în raportul JSON Behave (cheia 'resource_waterfall')"""
+    by_location = {record.get("location"): record for record in records if record.get("location")}
+    if not by_location:
+        return 0
+    try:
+        with open(report_file, "r", encoding="utf-8") as f:
+            features = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: could not read {report_file} to attach resource waterfalls: {e}")
+        return 0
+
+    attached = 0
+    for feature in features:
+        for element in feature.get("elements", []):
+            record = by_location.get(element.get("location"))
+            if record is not None and element.get("type") != "background":
+                element[REPORT_KEY] = {key: value for key, value in record.items()
+                                       if key not in ("run_id", "location", "scenario")}
+                attached += 1
+
+    with open(report_file, "w", encoding="utf-8") as f:
+        json.dump(features, f, indent=2, ensure_ascii=False)
+    return attached
@@ -0,0 +1,109 @@
+"""
+Shard Scheduler - împarte unitățile între worker-i după duratele din rulările anterioare
+Algoritm LPT: unitatea cea mai lungă merge la worker-ul cel mai puțin încărcat
+"""
+import heapq
+import json
+import os
+import statistics
+
+
+# Durata presupusă pentru un scenariu fără istoric, când nu există nicio mediană
+DEFAULT_SCENARIO_SECONDS = 10.0
+
+
+class DurationHistory:
+    """Duratele scenariilor din rapoartele JSON Behave anterioare"""
+
+    def __init__(self, report_files=None):
+        self.by_location = {}
+        self.by_name = {}
+        for report_file in self._by_age(report_files or []):
+            self._load(report_file)
+
+    @staticmethod
+    def _by_age(report_files):
+        """Rapoartele existente, de la cel mai vechi la cel mai nou (cel nou câștigă)"""
+        existing = [f for f in report_files if f and os.path.isfile(f)]
+        return sorted(set(existing), key=os.path.getmtime)
+
+    def _load(self, report_file):
+        """Citește duratele scenariilor care au rulat efectiv dintr-un raport"""
+        try:
+            with open(report_file, "r", encoding="utf-8") as f:
+                features = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] Could not read duration history {report_file}: {e}")
+            return
+
+        for feature in features:
+            for element in feature.get("elements", []):
+                if element.get("type") == "background":
+                    continue
+                # Scenariile nealese sau nerulate nu au durate utile
+                if element.get("status") not in ("passed", "failed"):
+                    continue
+                duration = sum(
+                    step.get("result", {}).get("duration", 0) or 0
+                    for step in element.get("steps", [])
+                )
+                if duration <= 0:
+                    continue
+                location = element.get("location", "")
+                path = location.rsplit(":", 1)[0]
+                self.by_location[location] = duration
+                self.by_name[(path, element.get("name", ""))] = duration
+
+    def __len__(self):
+        return len(self.by_location)
+
+    def scenario_duration(self, path, name, line=None):
+        """Durata cunoscută a unui scenariu"""
+        duration = self.by_name.get((path, name))
+        if duration is not None:
+            return duration
+        if line is not None and f"{path}:{line}" in self.by_location:
+            return self.by_location[f"{path}:{line}"]
+
+        prefix = f"{name} -- @"
+        rows = [d for (p, n), d in self.by_name.items() if p == path and n.startswith(prefix)]
+        return sum(rows) if rows else None
+
+    def default_duration(self):
+        """Durata presupusă pentru scenariile fără istoric (mediana celor cunoscute)"""
+        if not self.by_location:
+            return DEFAULT_SCENARIO_SECONDS
+        return statistics.median(self.by_location.values())
+
+
+def estimate_cost(unit, history):
+    """Estimează durata unei unități de test"""
+    default = history.default_duration()
+    if unit.line is not None:
+        known = history.scenario_duration(unit.path, unit.name, unit.line)
+        return default if known is None else known
+
+    # Feature întreg: suma scenariilor sale
+    total = 0.0
+    for scenario in unit.scenarios:
+        known = history.scenario_duration(scenario.path, scenario.name, scenario.line)
+        total += default if known is None else known
+    return total
+
+
+def plan_shards(units, workers, history):
+    """Împarte unitățile în `workers` grupuri cu durate totale cât mai apropiate (LPT)"""
+    workers = max(1, min(workers, len(units)))
+    costs = [(estimate_cost(unit, history), index, unit) for index, unit in enumerate(units)]
+    # Cele mai lungi primele; indexul păstrează ordinea stabilă la egalitate
+    costs.sort(key=lambda item: (-item[0], item[1]))
+
+    shards = [[] for _ in range(workers)]
+    heap = [(0.0, worker) for worker in range(workers)]
+    for cost, _, unit in costs:
+        load, worker = heapq.heappop(heap)
+        shards[worker].append(unit)
+        heapq.heappush(heap, (load + cost, worker))
+
+    loads = {worker: load for load, worker in heap}
+    return [(shards[w], loads[w]) for w in range(workers) if shards[w]]
@@ -0,0 +1,142 @@
+"""
+Startup Profiler - cronometrează fazele pornirii Chrome
+Fiecare lansare scrie o linie JSON; la final se afișează p50/p95 pe fază
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+DEFAULT_LOG_PATH = "startup_profile.jsonl"
+
+_write_lock = threading.Lock()
+
+
+def current_run_id():
+    """Identificatorul rulării curente, moștenit de procesele worker"""
+    run_id = os.environ.get("STARTUP_RUN_ID")
+    if not run_id:
+        run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}-{os.getpid()}"
+        os.environ["STARTUP_RUN_ID"] = run_id
+    return run_id
+
+
+def log_path():
+    """Fișierul JSONL cu înregistrările (variabila STARTUP_PROFILE_LOG sau implicit)"""
+    return os.environ.get("STARTUP_PROFILE_LOG", DEFAULT_LOG_PATH)
+
+
+class StartupProfiler:
+    """Cronometrează fazele unei singure lansări de browser"""
+
+    def __init__(self, label="chrome", **attributes):
+        self.label = label
+        self.attributes = attributes
+        self.phases = {}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        """Cronometrează un bloc de cod ca fază a pornirii"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name, seconds):
+        """Adaugă durata unei faze măsurate separat"""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def finish(self, status="ok"):
+        """Închide măsurătoarea și scrie înregistrarea în fișierul JSONL"""
+        record = {
+            "run_id": current_run_id(),
+            "timestamp": datetime.now().isoformat(timespec="milliseconds"),
+            "worker": os.environ.get("BEHAVE_WORKER_ID", "main"),
+            "pid": os.getpid(),
+            "label": self.label,
+            "status": status,
+            "total": round(time.perf_counter() - self._start, 4),
+            "phases": {name: round(seconds, 4) for name, seconds in self.phases.items()},
+        }
+        record.update(self.attributes)
+
+        path = log_path()
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            # O linie scrisă dintr-o bucată - worker-ii pot scrie în paralel
+            with _write_lock, open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"[WARNING] Could not write startup profile: {e}")
+
+        return record
+
+
+def load_records(path=None, run_id=None):
+    """Citește înregistrările din fișierul JSONL"""
+    records = []
+    try:
+        with open(path or log_path(), "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if run_id is None or record.get("run_id") == run_id:
+                    records.append(record)
+    except OSError:
+        pass
+    return records
+
+
+def percentile(values, pct):
+    """Percentila prin metoda nearest-rank"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(-(-pct * len(ordered) // 100)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(records):
+    """Calculează p50/p95 pe fiecare fază (și pe total)"""
+    samples = {}
+    for record in records:
+        for name, seconds in record.get("phases", {}).items():
+            samples.setdefault(name, []).append(seconds)
+        samples.setdefault("total", []).append(record.get("total", 0.0))
+
+    summary = {
+        name: {
+            "count": len(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "max": max(values),
+        }
+        for name, values in samples.items()
+    }
+    return dict(sorted(summary.items(), key=lambda item: (item[0] == "total", -item[1]["p50"])))
+
+
+def print_summary(records, title="BROWSER STARTUP PROFILE"):
+    """Afișează tabelul p50/p95 pe faze"""
+    if not records:
+        return
+    summary = summarize(records)
+    print(f"\n{'='*80}")
+    print(f"{title} ({len(records)} launch(es))")
+    print(f"{'='*80}")
+    print(f"{'Phase':<28}{'Count':>8}{'p50 (ms)':>14}{'p95 (ms)':>14}{'max (ms)':>14}")
+    print("-"*80)
+    for name, stats in summary.items():
+        print(f"{name:<28}{stats['count']:>8}{stats['p50'] * 1000:>14.1f}"
+              f"{stats['p95'] * 1000:>14.1f}{stats['max'] * 1000:>14.1f}")
+    print(f"{'='*80}\n")
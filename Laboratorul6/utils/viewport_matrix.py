@@ -0,0 +1,160 @@
+"""
+Viewport Matrix - verificările de layout pentru mai multe rezoluții, în tab-uri separate
+Fiecare tab primește Emulation.setDeviceMetricsOverride înainte de încărcare; paginile se încarcă în paralel,
+apoi fiecare tab este citit o singură dată (PageState + LayoutAudit) - fără set_window_size și pauze
+"""
+from utils.driver_factory import WebDriverFactory
+from utils.layout_audit import LayoutAudit
+from utils.page_state import PageState
+from utils.wait_conditions import document_ready, url_changed, wait_until
+
+
+# nume: (lățime, înălțime, mobil) - tableta este doar o fereastră mai îngustă, ca set_tablet_resolution
+VIEWPORTS = {
+    "desktop": (1920, 1080, False),
+    "tablet": (768, 1024, False),
+    "mobile": (375, 667, True),
+}
+
+TOUCH_TARGETS = 'button, input[type="button"], input[type="submit"], a.button'
+MIN_TOUCH_SIZE = 44  # pixels - recomandare pentru touch targets
+
+
+class ViewportResult:
+    """Rezultatul verificărilor de layout pentru o rezoluție"""
+
+    def __init__(self, name, width, height, mobile=False, state=None, audit=None, error=None):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.mobile = mobile
+        self.state = state
+        self.audit = audit
+        self.error = error
+
+    @property
+    def horizontal_scroll(self):
+        return self.state is not None and self.state.has_horizontal_scroll()
+
+    @property
+    def vertical_scroll(self):
+        return self.state is not None and self.state.has_vertical_scroll()
+
+    @property
+    def small_touch_targets(self):
+        """Țintele vizibile mai mici de MIN_TOUCH_SIZE (raportate ca problemă doar pe viewport-urile mobile)"""
+        if self.state is None:
+            return []
+        return [rect for rect in self.state.rects(TOUCH_TARGETS, displayed_only=True)
+                if rect['width'] < MIN_TOUCH_SIZE or rect['height'] < MIN_TOUCH_SIZE]
+
+    @property
+    def overlaps(self):
+        return self.audit.overlaps if self.audit is not None else []
+
+    def is_displayed(self, locator):
+        """Vizibilitatea unui locator citit în snapshot"""
+        return self.state is not None and self.state.is_displayed(locator)
+
+    def problems(self):
+        """Lista problemelor găsite (goală dacă layout-ul este corect)"""
+        if self.error:
+            return [f"error: {self.error}"]
+        problems = []
+        if self.horizontal_scroll:
+            problems.append("horizontal scroll")
+        if self.overlaps:
+            problems.append(f"{len(self.overlaps)} overlapping element(s): {self.audit.describe_overlaps(3)}")
+        if self.mobile and self.small_touch_targets:
+            problems.append(f"{len(self.small_touch_targets)} touch target(s) under {MIN_TOUCH_SIZE}px")
+        return problems
+
+    def __repr__(self):
+        return f"ViewportResult({self.name} {self.width}x{self.height}, problems={self.problems()})"
+
+
+class ViewportMatrixResult:
+    """Rezultatul combinat pentru toate rezoluțiile"""
+
+    def __init__(self, results):
+        self.results = results
+
+    def __getitem__(self, name):
+        return self.results[name]
+
+    def __iter__(self):
+        return iter(self.results.values())
+
+    @property
+    def ok(self):
+        return all(not result.problems() for result in self)
+
+    def summary(self):
+        """Câte o linie per rezoluție"""
+        return "\n".join(
+            f"{result.name:<8} {result.width}x{result.height}: "
+            f"{'; '.join(result.problems()) or 'OK'}"
+            for result in self
+        )
+
+
+def _emulate(driver, width, height, mobile):
+    """Aplică rezoluția pe tab-ul curent prin CDP"""
+    driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+        "width": width, "height": height, "deviceScaleFactor": 0, "mobile": mobile,
+    })
+    driver.execute_cdp_cmd("Emulation.setTouchEmulationEnabled", {"enabled": mobile})
+
+
+def run_viewport_matrix(driver, url, viewports=None, locators=(), timeout=10):
+    """Încarcă url în câte un tab per rezoluție (în paralel) și întoarce verificările combinate"""
+    viewports = viewports or VIEWPORTS
+    locators = tuple(dict.fromkeys((TOUCH_TARGETS,) + tuple(locators)))
+    original = driver.current_window_handle
+    tabs = {}
+    interceptors = []
+    results = {}
+    try:
+        # 1. Câte un tab per rezoluție; navigarea pornește fără să aștepte încărcarea
+        for name, (width, height, mobile) in viewports.items():
+            driver.switch_to.new_window("tab")
+            tabs[name] = driver.current_window_handle
+            try:
+                # Aceeași pagină ca în tab-ul principal: blocarea cererilor și HAR sunt per target
+                interceptors.append(WebDriverFactory.prepare_target(driver))
+                _emulate(driver, width, height, mobile)
+                driver.execute_script("window.location.href = arguments[0];", url)
+            except Exception as e:
+                results[name] = ViewportResult(name, width, height, mobile, error=str(e))
+
+        # 2. Paginile s-au încărcat între timp în paralel - fiecare tab este citit o dată
+        for name, handle in tabs.items():
+            if name in results:
+                continue
+            width, height, mobile = viewports[name]
+            try:
+                driver.switch_to.window(handle)
+                # Tab-ul nou este about:blank (deja 'complete') până când navigarea pornește;
+                # un tab rămas pe about:blank sau pe jumătate încărcat ar trece toate verificările
+                if not (wait_until(driver, url_changed("about:blank"), timeout)
+                        and wait_until(driver, document_ready(), timeout)):
+                    results[name] = ViewportResult(name, width, height, mobile, error="navigation timed out")
+                    continue
+                results[name] = ViewportResult(name, width, height, mobile,
+                                               state=PageState.capture(driver, locators),
+                                               audit=LayoutAudit.capture(driver))
+            except Exception as e:
+                results[name] = ViewportResult(name, width, height, mobile, error=str(e))
+    finally:
+        for interceptor in interceptors:
+            if interceptor is not None:
+                interceptor.stop()
+        for handle in tabs.values():
+            try:
+                driver.switch_to.window(handle)
+                driver.close()
+            except Exception:
+                pass
+        driver.switch_to.window(original)
+
+    return ViewportMatrixResult({name: results[name] for name in viewports if name in results})
@@ -10,8 +10,15 @@ from datetime import datetime
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
-from utils.driver_factory import DriverFactory, DriverConfig
+from utils.driver_factory import DriverConfig, profile_from_tags
+from utils.driver_reaper import get_reaper
+from utils.har_archive import network_mode, replay_misses, save_recording
+from utils.locator_resolver import get_locator_resolver
 from utils.helpers import ScreenshotHelpers
+from utils.network_events import network_events, network_events_requested
+from utils.request_blocker import get_size_cache, request_blocker, rulesets_from_tags
+from utils.startup_profiler import current_run_id, load_records, print_summary
+from utils.wait_conditions import get_budget, print_budget_report
 
 
 def before_all(context):
@@ -27,8 +34,11 @@ def before_all(context):
     screenshots_dir = "reports/screenshots"
     os.makedirs(screenshots_dir, exist_ok=True)
 
+    # Worker-ii paraleli nu șterg screenshot-urile (o face runner-ul, o singură dată)
+    context.worker_id = os.environ.get("BEHAVE_WORKER_ID")
+
     # Șterge screenshot-urile vechi
-    if os.path.exists(screenshots_dir):
+    if not context.worker_id and os.path.exists(screenshots_dir):
         old_screenshots = [f for f in os.listdir(screenshots_dir) if f.endswith('.png')]
         if old_screenshots:
             print(f"[INFO] Cleaning up {len(old_screenshots)} old screenshot(s)...")
@@ -47,6 +57,20 @@ def before_all(context):
     # Configurare
     context.config.setup_logging()
 
+    # Rețea: live, record (arhivă HAR) sau replay (răspunsuri din arhivă)
+    context.network_mode = network_mode()
+    if context.network_mode != "live":
+        print(f"[INFO] Network mode: {context.network_mode}")
+
+    # Un singur pool de browsere pornite în avans (DRIVER_POOL_SIZE pentru toate profilurile).
+    # Este încălzit cu profilul implicit; alte profiluri înlocuiesc la nevoie un browser liber.
+    context.driver_pool = DriverConfig.create_pool()
+    try:
+        context.driver_pool.warm_up(profile=DriverConfig.PROFILE, network_events=network_events_requested())
+        print(f"[OK] Chrome driver pool warmed up (profile: {DriverConfig.PROFILE})")
+    except Exception as e:
+        print(f"[WARNING] Could not warm up driver pool: {e}")
+
 
 def before_feature(context, feature):
     """
@@ -60,16 +84,25 @@ def before_feature(context, feature):
 def before_scenario(context, scenario):
     """
     Rulează înainte de fiecare scenario
-    Inițializează browser-ul Chrome
+    Împrumută un browser Chrome din pool
     """
     print(f"\n{'-'*80}")
     print(f"Scenario: {scenario.name}")
     print(f"{'-'*80}")
 
-    # Inițializează Chrome WebDriver
+    # Împrumută Chrome WebDriver din pool-ul profilului scenariului (@profile-<nume>)
     try:
-        context.driver = DriverConfig.get_driver()
-        print("[OK] Chrome browser initialized successfully")
+        context.browser_profile = profile_from_tags(scenario.effective_tags)
+        context.block_rulesets = rulesets_from_tags(scenario.effective_tags)
+        context.network_events = network_events_requested(scenario.effective_tags, context.block_rulesets)
+        context.driver = context.driver_pool.lease(context.browser_profile.name, context.network_events)
+        print(f"[OK] Chrome browser leased from pool (profile: {context.browser_profile.name})")
+
+        # Evenimentele de rețea și blocarea cererilor încep curat pentru fiecare scenariu
+        network_events(context.driver).reset()
+        request_blocker(context.driver).apply(context.block_rulesets)
+        if context.block_rulesets:
+            print(f"[OK] Request blocking enabled: {', '.join(context.block_rulesets)}")
     except Exception as e:
         print(f"[ERROR] Failed to initialize Chrome browser: {e}")
         raise
@@ -119,7 +152,7 @@ def after_step(context, step):
 def after_scenario(context, scenario):
     """
     Rulează după fiecare scenario
-    Închide browser-ul și salvează rezultatele
+    Returnează browser-ul în pool și salvează rezultatele
     """
     # Calculează durata
     if hasattr(context, 'scenario_start_time'):
@@ -154,6 +187,15 @@ def after_scenario(context, scenario):
     except Exception as e:
         print(f"[ERROR] Failed to take screenshot: {e}")
 
+    # Cereri blocate în acest scenariu (și bytes evitați, estimați)
+    try:
+        if getattr(context, 'driver', None):
+            block_report = request_blocker(context.driver).report()
+            if block_report.requests or getattr(context, 'block_rulesets', None):
+                print(f"[INFO] Blocked: {block_report}")
+    except Exception as e:
+        print(f"[WARNING] Could not collect blocked requests: {e}")
+
     # Verifică status și adaugă la lista corespunzătoare
     if scenario.status == "failed":
         print(f"\n[X] Scenario FAILED: {scenario.name} (Duration: {duration_str})")
@@ -170,13 +212,14 @@ def after_scenario(context, scenario):
             'feature': scenario.feature.name
         })
 
-    # Închide browser-ul
+    # Returnează browser-ul în pool (reciclat la eșec)
     try:
         if hasattr(context, 'driver') and context.driver:
-            DriverFactory.quit_driver(context.driver)
-            print("[OK] Chrome browser closed")
+            context.driver_pool.release(context.driver, failed=scenario.status == "failed")
+            context.driver = None
+            print("[OK] Chrome browser returned to pool")
     except Exception as e:
-        print(f"[ERROR] Error closing browser: {e}")
+        print(f"[ERROR] Error releasing browser: {e}")
 
     print(f"{'-'*80}\n")
 
@@ -199,6 +242,39 @@ def after_all(context):
     print("Test Execution Completed")
     print("="*80)
 
+    # Închide browserele libere din pool
+    if getattr(context, 'driver_pool', None) is not None:
+        context.driver_pool.close()
+        print("[OK] Chrome driver pool closed")
+
+    # Arhiva HAR (record) și cererile care lipseau din arhivă (replay)
+    try:
+        save_recording()
+    except Exception as e:
+        print(f"[ERROR] Failed to save HAR recording: {e}")
+    missing = replay_misses()
+    if missing:
+        print(f"[WARNING] {len(missing)} request(s) were not in the HAR archive, e.g. {missing[0]}")
+
+    # Dimensiunile resurselor observate (pentru estimarea bytes blocați data viitoare)
+    get_size_cache().save()
+
+    # Alternativele de locatori găsite (încercate primele la rularea următoare)
+    get_locator_resolver().save()
+
+    # Așteaptă închiderile pe fundal (cu termen limită; procesele blocate sunt oprite forțat)
+    reaper = get_reaper(DriverConfig.QUIT_DEADLINE)
+    if not reaper.drain():
+        print(f"[WARNING] {reaper.pending()} browser(s) still closing after the quit deadline")
+    if reaper.killed_processes:
+        print(f"[INFO] Killed {reaper.killed_processes} leftover chrome/chromedriver process(es)")
+
+    # Durata fazelor de pornire Chrome (p50/p95) pentru lansările din această rulare
+    print_summary(load_records(run_id=current_run_id()))
+
+    # Timpul petrecut în pauze fixe vs. așteptări pe condiții (procesul curent)
+    print_budget_report([get_budget().save()])
+
     # Calculează statistici
     total_scenarios = len(context.passed_scenarios) + len(context.failed_scenarios)
     passed_count = len(context.passed_scenarios)
@@ -238,6 +314,9 @@ def generate_text_report(context, total, passed, failed, success_rate):
     """
     try:
         report_path = "reports/test_summary.txt"
+        if getattr(context, 'worker_id', None):
+            report_path = f"reports/workers/test_summary_{context.worker_id}.txt"
+            os.makedirs(os.path.dirname(report_path), exist_ok=True)
         with open(report_path, 'w', encoding='utf-8') as f:
             f.write("="*80 + "\n")
             f.write("GOOGLE SEARCH AUTOMATION - TEST EXECUTION SUMMARY\n")
@@ -2,10 +2,10 @@
 Step definitions pentru funcționalitatea Google Search.
 Pașii sunt separați pe funcționalitate.
 """
-import time
 from behave import given, when, then, step
 from pages.google_home_page import GoogleHomePage
 from pages.google_results_page import GoogleResultsPage
+from utils.wait_conditions import document_ready, pause, url_contains, wait_until
 
 
 # ============================================================================
@@ -33,7 +33,7 @@ def step_user_on_google_page(context):
     assert success, "Failed to navigate to Google"
 
     # Așteaptă ca pagina să se încarce
-    time.sleep(1)
+    wait_until(context.driver, document_ready(), timeout=10)
     assert context.google_home_page.is_google_page_loaded(), "Google page not loaded properly"
 
 
@@ -48,7 +48,7 @@ def step_user_accesses_url(context, url):
     """
     context.google_home_page = GoogleHomePage(context.driver)
     context.driver.get(url)
-    time.sleep(2)  # Așteaptă încărcarea paginii
+    wait_until(context.driver, document_ready(), timeout=10)
 
 
 @when('utilizatorul caută după "{search_term}"')
@@ -70,7 +70,7 @@ def step_user_searches_for(context, search_term):
     assert success, f"Failed to search for '{search_term}'"
 
     # Așteaptă ca rezultatele să se încarce
-    time.sleep(2)
+    wait_until(context.driver, document_ready(), timeout=10)
 
     # Inițializează pagina de rezultate
     context.google_results_page = GoogleResultsPage(context.driver)
@@ -86,7 +86,7 @@ def step_user_enters_nothing(context):
 
     # Asigură-te că search box-ul este gol
     context.google_home_page.clear_search_box()
-    time.sleep(0.5)
+    pause(0.5)
 
 
 @when('utilizatorul apasă pe butonul "{button_name}"')
@@ -111,7 +111,7 @@ def step_user_clicks_button(context, button_name):
 
         # Pentru căutare goală, este ok dacă click-ul nu reușește
         # deoarece butonul poate fi disabled
-        time.sleep(2)
+        wait_until(context.driver, url_contains("search?"), timeout=2)
 
 
 # ============================================================================
@@ -361,7 +361,6 @@ def step_verify_next_button_exists(context):
 
     # Scroll la sfârșitul paginii pentru a vedea butonul Next
     context.google_results_page.scroll_to_bottom()
-    time.sleep(1)
 
     is_visible = context.google_results_page.is_next_page_button_visible()
     assert is_visible, "Next button is not visible"
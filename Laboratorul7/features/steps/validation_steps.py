@@ -2,9 +2,10 @@
 Step definitions generice pentru validarea datelor.
 Acești pași pot fi reutilizați în diferite scenarii și funcționalități.
 """
-import time
 from behave import given, when, then
 from selenium.webdriver.common.by import By
+from utils.helpers import WaitHelpers
+from utils.wait_conditions import element_present, pause, wait_until
 
 
 # ============================================================================
@@ -195,12 +196,21 @@ def step_verify_element_count_maximum(context, max_count, class_name):
 # Generic attribute validation steps
 # ============================================================================
 
+def _find_element_by_id(context, element_id, timeout=10):
+    """
+    Așteaptă explicit elementul cu id-ul dat (implicit wait-ul este 0 în modul explicit)
+    """
+    elements = wait_until(context.driver, element_present((By.ID, element_id)), timeout)
+    assert elements, f"Element with id '{element_id}' not found after {timeout} seconds"
+    return elements[0]
+
+
 @then('elementul cu id "{element_id}" ar trebui să aibă atributul "{attribute_name}" cu valoarea "{expected_value}"')
 def step_verify_element_attribute_value(context, element_id, attribute_name, expected_value):
     """
     Verifică valoarea unui atribut al unui element
     """
-    element = context.driver.find_element(By.ID, element_id)
+    element = _find_element_by_id(context, element_id)
     actual_value = element.get_attribute(attribute_name)
     assert actual_value == expected_value, \
         f"Attribute '{attribute_name}' has value '{actual_value}', expected '{expected_value}'"
@@ -212,7 +222,7 @@ def step_verify_element_enabled(context, element_id):
     """
     Verifică că un element este enabled
     """
-    element = context.driver.find_element(By.ID, element_id)
+    element = _find_element_by_id(context, element_id)
     assert element.is_enabled(), f"Element with id '{element_id}' is not enabled"
     print(f"Element with id '{element_id}' is enabled")
 
@@ -222,7 +232,7 @@ def step_verify_element_disabled(context, element_id):
     """
     Verifică că un element este disabled
     """
-    element = context.driver.find_element(By.ID, element_id)
+    element = _find_element_by_id(context, element_id)
     assert not element.is_enabled(), f"Element with id '{element_id}' is not disabled"
     print(f"Element with id '{element_id}' is disabled")
 
@@ -236,7 +246,7 @@ def step_wait_seconds(context, seconds):
     """
     Așteaptă un număr specific de secunde
     """
-    time.sleep(seconds)
+    pause(seconds)
     print(f"Waited {seconds} seconds")
 
 
@@ -245,17 +255,10 @@ def step_verify_element_disappears(context, element_id, timeout):
     """
     Verifică că un element dispare în timpul specificat
     """
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-
     locator = (By.ID, element_id)
-    try:
-        WebDriverWait(context.driver, timeout).until(
-            EC.invisibility_of_element_located(locator)
-        )
-        print(f"Element with id '{element_id}' disappeared")
-    except Exception as e:
+    if not WaitHelpers.wait_for_element_invisible(context.driver, locator, timeout):
         raise AssertionError(f"Element with id '{element_id}' did not disappear in {timeout} seconds")
+    print(f"Element with id '{element_id}' disappeared")
 
 
 # ============================================================================
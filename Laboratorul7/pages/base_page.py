@@ -12,6 +12,8 @@ from utils.helpers import (
     ValidationHelpers,
     ScrollHelpers
 )
+from utils.locator_resolver import get_locator_resolver
+from utils.network_events import network_events
 
 
 class BasePage:
@@ -189,10 +191,57 @@ class BasePage:
         Returns:
             WebElement sau None
         """
-        try:
-            return self.driver.find_element(*locator)
-        except NoSuchElementException:
+        # Fără așteptare: cu SYNC_MODE=explicit un element lipsă întoarce None imediat
+        elements = self.get_elements(locator)
+        return elements[0] if elements else None
+
+    def find_first(self, chain, locators, timeout=5, kind="visible"):
+        """
+        Primul element găsit dintr-un lanț de locatori alternativi
+
+        Toate alternativele sunt verificate în aceeași interogare din pagină;
+        cea găsită este încercată prima la rularea următoare.
+
+        Args:
+            chain: Numele lanțului (ex: 'google_logo')
+            locators: Lista de tupluri (By, value), în ordinea declarată
+            timeout: Timeout în secunde pentru tot lanțul
+            kind: 'present', 'visible' sau 'clickable'
+
+        Returns:
+            WebElement sau None
+        """
+        element, _ = get_locator_resolver().resolve(self.driver, chain, locators, timeout, kind)
+        return element
+
+    @property
+    def last_response_status(self):
+        """
+        Statusul HTTP al ultimului document principal, din Network.responseReceived
+
+        Returns:
+            int sau None (fără evenimente de rețea: NETWORK_EVENTS=1 sau tag @network-events)
+        """
+        events = network_events(self.driver)
+        events.drain()
+        response = events.main_document_response()
+        if not response or response.get("status") is None:
             return None
+        return int(response["status"])
+
+    @property
+    def failed_requests(self):
+        """
+        Cererile eșuate ale paginii curente (documentul și resursele lui)
+
+        Erorile paginilor vizitate anterior în scenariu nu sunt incluse (filtrare după loaderId).
+
+        Returns:
+            List[FailedRequest]: Status >= 400 sau eroare de rețea
+        """
+        events = network_events(self.driver)
+        events.drain()
+        return events.failed_requests(events.main_document_loader())
 
     def take_screenshot(self, name):
         """
@@ -1,10 +1,11 @@
 """
 Page Object Model pentru pagina principală Google.
 """
-import time
 from selenium.webdriver.common.keys import Keys
 from pages.base_page import BasePage
+from utils.element_batch import visible_texts
 from utils.locators import GoogleHomePageLocators
+from utils.wait_conditions import document_ready, element_present, url_changed, wait_until
 
 
 class GoogleHomePage(BasePage):
@@ -71,7 +72,6 @@ class GoogleHomePage(BasePage):
                 search_box.clear()
                 # Introduce textul
                 search_box.send_keys(search_term)
-                time.sleep(0.5)  # Așteaptă puțin pentru sugestii
                 return True
             return False
         except Exception as e:
@@ -94,6 +94,7 @@ class GoogleHomePage(BasePage):
             )
 
             if search_button:
+                old_url = self.get_current_url()
                 # Încearcă click normal
                 try:
                     search_button.click()
@@ -101,7 +102,7 @@ class GoogleHomePage(BasePage):
                     # Dacă click-ul normal eșuează, folosește JavaScript
                     self.driver.execute_script("arguments[0].click();", search_button)
 
-                time.sleep(1)  # Așteaptă încărcarea rezultatelor
+                self._wait_for_navigation(old_url)
                 return True
             return False
         except Exception as e:
@@ -118,14 +119,31 @@ class GoogleHomePage(BasePage):
         try:
             search_box = self.get_element(self.locators.SEARCH_BOX)
             if search_box:
+                old_url = self.get_current_url()
                 search_box.send_keys(Keys.RETURN)
-                time.sleep(1)  # Așteaptă încărcarea rezultatelor
+                self._wait_for_navigation(old_url)
                 return True
             return False
         except Exception as e:
             print(f"Error pressing enter: {e}")
             return False
 
+    def _wait_for_navigation(self, old_url, timeout=3):
+        """
+        Așteaptă încărcarea rezultatelor după submit
+
+        Args:
+            old_url: URL-ul dinainte de submit
+            timeout: Timeout în secunde
+
+        Returns:
+            bool: True dacă s-a navigat la o pagină nouă încărcată complet
+        """
+        # O căutare goală nu navighează - URL-ul rămâne același până la timeout
+        if not wait_until(self.driver, url_changed(old_url), timeout):
+            return False
+        return bool(wait_until(self.driver, document_ready(), timeout))
+
     def search_for(self, search_term, use_enter=False):
         """
         Realizează o căutare completă
@@ -173,8 +191,8 @@ class GoogleHomePage(BasePage):
             bool: True dacă sugestiile sunt vizibile
         """
         try:
-            # Așteaptă puțin pentru sugestii
-            time.sleep(0.5)
+            # Sugestiile apar asincron - se termină la prima sugestie afișată
+            wait_until(self.driver, element_present(self.locators.SEARCH_SUGGESTIONS), timeout=0.5)
             suggestions = self.get_elements(self.locators.SEARCH_SUGGESTIONS)
             return len(suggestions) > 0
         except Exception as e:
@@ -189,9 +207,8 @@ class GoogleHomePage(BasePage):
             List[str]: Lista de sugestii
         """
         try:
-            time.sleep(0.5)  # Așteaptă sugestiile
-            suggestions = self.get_elements(self.locators.SEARCH_SUGGESTIONS)
-            return [suggestion.text for suggestion in suggestions if suggestion.text]
+            wait_until(self.driver, element_present(self.locators.SEARCH_SUGGESTIONS), timeout=0.5)
+            return visible_texts(self.driver, self.locators.SEARCH_SUGGESTIONS)
         except Exception as e:
             print(f"Error getting search suggestions: {e}")
             return []
@@ -199,24 +216,18 @@ class GoogleHomePage(BasePage):
     def is_google_logo_visible(self):
         """
         Verifică dacă logo-ul Google este vizibil
-        Încearcă mai multe locatori până găsește logo-ul
+        Toate variantele de locatori sunt verificate deodată
 
         Returns:
             bool: True dacă logo-ul este vizibil
         """
-        # Încearcă mai multe variante de locatori
         logo_locators = [
             self.locators.GOOGLE_LOGO,
             self.locators.GOOGLE_LOGO_ALTERNATIVE,
             self.locators.GOOGLE_LOGO_ALTERNATIVE2,
             self.locators.GOOGLE_LOGO_ALTERNATIVE3,
         ]
-
-        for locator in logo_locators:
-            if self.is_element_visible(locator, timeout=2):
-                return True
-
-        return False
+        return self.find_first("google_logo", logo_locators, timeout=2) is not None
 
     def get_search_box_text(self):
         """
@@ -1,10 +1,12 @@
 """
 Page Object Model pentru pagina de rezultate Google.
 """
-import time
 import re
+from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils.element_batch import inspect_elements, visible_texts
 from utils.locators import GoogleResultsPageLocators
+from utils.wait_conditions import document_ready, element_present, scroll_settled, url_contains, wait_until
 
 
 class GoogleResultsPage(BasePage):
@@ -50,9 +52,10 @@ class GoogleResultsPage(BasePage):
             bool: True dacă rezultatele s-au încărcat
         """
         try:
-            # Simplu: doar așteaptă ca URL-ul să conțină 'search?'
-            time.sleep(2)  # Așteaptă încărcarea paginii
-            return "search?" in self.get_current_url()
+            # URL-ul de rezultate, apoi documentul încărcat complet
+            if not wait_until(self.driver, url_contains("search?"), timeout):
+                return False
+            return bool(wait_until(self.driver, document_ready(), timeout))
         except Exception as e:
             print(f"Error waiting for results to load: {e}")
             return False
@@ -65,11 +68,13 @@ class GoogleResultsPage(BasePage):
             List[WebElement]: Lista de rezultate
         """
         try:
-            # Așteaptă ca rezultatele să se încarce
-            time.sleep(1)
+            # Așteaptă primul rezultat (sau mesajul "no results"), nu o pauză fixă
+            wait_until(self.driver, element_present((By.CSS_SELECTOR, "h3"),
+                                                    self.locators.SEARCH_RESULTS,
+                                                    self.locators.SEARCH_RESULTS_ALTERNATIVE,
+                                                    self.locators.NO_RESULTS_MESSAGE), timeout=5)
 
             # Caută titluri H3 - acestea sunt mai stabile ca locatori
-            from selenium.webdriver.common.by import By
             h3_elements = self.get_elements((By.CSS_SELECTOR, "h3"))
 
             if h3_elements:
@@ -93,21 +98,9 @@ class GoogleResultsPage(BasePage):
             int: Numărul de rezultate
         """
         try:
-            # Simplu: numără titlurile H3 care sunt rezultate
-            from selenium.webdriver.common.by import By
-            h3_elements = self.get_elements((By.CSS_SELECTOR, "h3"))
-
-            # Filtrează doar H3-urile care au părinte cu link
-            valid_count = 0
-            for h3 in h3_elements:
-                try:
-                    # Verifică dacă are text și este vizibil
-                    if h3.text and h3.is_displayed():
-                        valid_count += 1
-                except:
-                    continue
-
-            return valid_count
+            # Simplu: numără titlurile H3 vizibile și cu text, inspectate toate într-o cerere
+            h3_infos = inspect_elements(self.driver, (By.CSS_SELECTOR, "h3"))
+            return sum(1 for info in h3_infos if info and info["displayed"] and info["text"])
         except Exception as e:
             print(f"Error getting number of results: {e}")
             return 0
@@ -159,7 +152,7 @@ class GoogleResultsPage(BasePage):
             bool: True dacă este vizibil
         """
         try:
-            # Încearcă toate locatorii posibili pentru diferite versiuni Google
+            # Toate locatorii posibili pentru diferite versiuni Google, verificați deodată
             locators_to_try = [
                 self.locators.DID_YOU_MEAN,
                 self.locators.DID_YOU_MEAN_ALTERNATIVE,
@@ -167,17 +160,29 @@ class GoogleResultsPage(BasePage):
                 self.locators.SHOWING_RESULTS_FOR_NEW,
                 self.locators.ORIGINALLY_SEARCHED_FOR
             ]
-
-            for locator in locators_to_try:
-                if self.is_element_visible(locator, timeout=2):
-                    print(f"Found 'did you mean' element with locator: {locator}")
-                    return True
-
-            return False
+            return self.find_first("did_you_mean_any", locators_to_try, timeout=2) is not None
         except Exception as e:
             print(f"Error checking did you mean: {e}")
             return False
 
+    def _did_you_mean_link(self, timeout=3, kind="visible"):
+        """
+        Linkul "Did you mean" (oricare dintre variante)
+
+        Args:
+            timeout: Timeout în secunde
+            kind: 'visible' sau 'clickable'
+
+        Returns:
+            WebElement sau None
+        """
+        return self.find_first(
+            "did_you_mean_link",
+            [self.locators.DID_YOU_MEAN, self.locators.DID_YOU_MEAN_ALTERNATIVE],
+            timeout=timeout,
+            kind=kind,
+        )
+
     def get_did_you_mean_text(self):
         """
         Obține textul din linkul "Did you mean"
@@ -186,14 +191,7 @@ class GoogleResultsPage(BasePage):
             str: Textul sugestiei
         """
         try:
-            # Încearcă să găsească elementul "Did you mean"
-            did_you_mean_element = None
-
-            if self.is_element_visible(self.locators.DID_YOU_MEAN, timeout=3):
-                did_you_mean_element = self.get_element(self.locators.DID_YOU_MEAN)
-            elif self.is_element_visible(self.locators.DID_YOU_MEAN_ALTERNATIVE, timeout=3):
-                did_you_mean_element = self.get_element(self.locators.DID_YOU_MEAN_ALTERNATIVE)
-
+            did_you_mean_element = self._did_you_mean_link()
             if did_you_mean_element:
                 return did_you_mean_element.text
 
@@ -210,11 +208,11 @@ class GoogleResultsPage(BasePage):
             bool: True dacă click-ul a reușit
         """
         try:
-            if self.is_element_visible(self.locators.DID_YOU_MEAN, timeout=3):
-                return self.click_element(self.locators.DID_YOU_MEAN)
-            elif self.is_element_visible(self.locators.DID_YOU_MEAN_ALTERNATIVE, timeout=3):
-                return self.click_element(self.locators.DID_YOU_MEAN_ALTERNATIVE)
-            return False
+            did_you_mean_element = self._did_you_mean_link(kind="clickable")
+            if did_you_mean_element is None:
+                return False
+            did_you_mean_element.click()
+            return True
         except Exception as e:
             print(f"Error clicking did you mean: {e}")
             return False
@@ -227,8 +225,7 @@ class GoogleResultsPage(BasePage):
             List[str]: Lista de titluri
         """
         try:
-            titles = self.get_elements(self.locators.SEARCH_RESULT_TITLES)
-            return [title.text for title in titles if title.text]
+            return visible_texts(self.driver, self.locators.SEARCH_RESULT_TITLES)
         except Exception as e:
             print(f"Error getting result titles: {e}")
             return []
@@ -342,7 +339,7 @@ class GoogleResultsPage(BasePage):
             if index < len(results):
                 result = results[index]
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", result)
-                time.sleep(0.5)
+                wait_until(self.driver, scroll_settled(result), timeout=2)
                 return True
             return False
         except Exception as e:
@@ -1,11 +1,16 @@
 """
 Script pentru rularea testelor Behave și generarea raportului HTML.
 """
+import argparse
 import os
 import sys
 import subprocess
 from datetime import datetime
 
+from utils.parallel_runner import run_parallel
+from utils.startup_profiler import current_run_id, load_records, print_summary
+from utils.wait_conditions import load_budgets, print_budget_report
+
 # Set UTF-8 encoding for Windows console to handle Romanian characters
 if sys.platform == 'win32':
     os.environ['PYTHONIOENCODING'] = 'utf-8'
@@ -18,9 +23,13 @@ if sys.platform == 'win32':
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
 
-def run_behave_tests():
+def run_behave_tests(workers=1, granularity="feature"):
     """
     Rulează testele Behave cu raportare HTML
+
+    Args:
+        workers (int): Numărul de procese paralele (1 = rulare secvențială)
+        granularity (str): Împărțirea pentru rularea paralelă ('feature' sau 'scenario')
     """
     print("="*80)
     print("GOOGLE SEARCH AUTOMATION - LABORATORUL 7")
@@ -48,6 +57,9 @@ def run_behave_tests():
     # Definește calea pentru rapoarte
     json_report = "reports/behave-report.json"
 
+    # Toate procesele Behave ale rulării scriu profilul de pornire sub același id
+    run_id = current_run_id()
+
     # Construiește comanda Behave (fără HTML formatter care nu este disponibil)
     behave_cmd = [
         "behave",
@@ -59,22 +71,30 @@ def run_behave_tests():
         "--no-capture-stderr",  # Don't capture stderr
     ]
 
-    print("Running Behave tests...")
-    print(f"Command: {' '.join(behave_cmd)}\n")
-
     try:
-        # Setează encoding pentru subprocess
-        env = os.environ.copy()
-        env['PYTHONIOENCODING'] = 'utf-8'
-
-        # Rulează Behave
-        result = subprocess.run(
-            behave_cmd,
-            cwd=os.getcwd(),
-            capture_output=False,
-            text=True,
-            env=env
-        )
+        if workers > 1:
+            # Rulare paralelă: fiecare worker are propriul Chrome headless
+            print(f"Running Behave tests on {workers} parallel workers (split by {granularity})...\n")
+            returncode = run_parallel(workers, json_report, granularity=granularity)
+            merge_worker_summaries("reports/workers", "reports/test_summary.txt")
+            print_summary(load_records(run_id=run_id), title="BROWSER STARTUP PROFILE - ALL WORKERS")
+            print_budget_report(load_budgets(run_id=run_id), title="WAIT BUDGET - ALL WORKERS")
+        else:
+            print("Running Behave tests...")
+            print(f"Command: {' '.join(behave_cmd)}\n")
+
+            # Setează encoding pentru subprocess
+            env = os.environ.copy()
+            env['PYTHONIOENCODING'] = 'utf-8'
+
+            # Rulează Behave
+            returncode = subprocess.run(
+                behave_cmd,
+                cwd=os.getcwd(),
+                capture_output=False,
+                text=True,
+                env=env
+            ).returncode
 
         print("\n" + "="*80)
         print("TEST EXECUTION COMPLETED")
@@ -106,7 +126,7 @@ def run_behave_tests():
         print("="*80 + "\n")
 
         # Return code
-        return result.returncode
+        return returncode
 
     except FileNotFoundError:
         print("\n[ERROR] Behave is not installed or not found in PATH")
@@ -117,6 +137,27 @@ def run_behave_tests():
         return 1
 
 
+def merge_worker_summaries(workers_dir, summary_path):
+    """
+    Unește rapoartele text ale worker-ilor paraleli într-un singur fișier
+    """
+    if not os.path.isdir(workers_dir):
+        return
+
+    summaries = sorted(
+        f for f in os.listdir(workers_dir)
+        if f.startswith("test_summary_") and f.endswith(".txt")
+    )
+    with open(summary_path, 'w', encoding='utf-8') as out:
+        for summary in summaries:
+            summary_file = os.path.join(workers_dir, summary)
+            with open(summary_file, 'r', encoding='utf-8') as f:
+                out.write(f"### {summary[len('test_summary_'):-len('.txt')]}\n")
+                out.write(f.read())
+                out.write("\n")
+            os.remove(summary_file)
+
+
 def generate_custom_html_report():
     """
     Generează un raport HTML customizat cu statistici și screenshots
@@ -405,8 +446,15 @@ def open_html_report_in_browser():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Google Search Automation - Behave runner")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Numărul de procese paralele (fiecare cu Chrome headless)")
+    parser.add_argument("--by", choices=["feature", "scenario"], default="feature",
+                        help="Granularitatea împărțirii pentru rularea paralelă")
+    args = parser.parse_args()
+
     # Rulează testele
-    exit_code = run_behave_tests()
+    exit_code = run_behave_tests(workers=args.workers, granularity=args.by)
 
     # Generează raport HTML customizat
     generate_custom_html_report()
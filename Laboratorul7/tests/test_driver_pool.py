@@ -0,0 +1,113 @@
+"""
+Teste pentru DriverPool - o singură limită pentru toate profilurile, cu înlocuirea browserelor libere de alt tip
+"""
+import threading
+
+import pytest
+
+from utils.driver_factory import DriverPool
+
+
+class FakeDriver:
+    def __init__(self, profile, network_events):
+        self.kind = (profile, network_events)
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {}
+
+
+class FakeReaper:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, driver):
+        self.submitted.append(driver)
+
+
+@pytest.fixture
+def built(monkeypatch):
+    # Resetarea folosește CDP pe un browser real - aici contează doar ciclul de viață
+    monkeypatch.setattr(DriverPool, "reset_driver", staticmethod(lambda driver: None))
+    return []
+
+
+def _pool(built, size, reaper, max_leases=20):
+    def builder(profile, network_events):
+        driver = FakeDriver(profile, network_events)
+        built.append(driver)
+        return driver
+    return DriverPool(size=size, max_leases=max_leases, driver_builder=builder,
+                      default_profile="fidelity", reaper=reaper)
+
+
+def _alive(built, reaper):
+    return len(built) - len(reaper.submitted)
+
+
+def test_same_kind_reuses_the_idle_driver(built):
+    reaper = FakeReaper()
+    pool = _pool(built, 2, reaper)
+    pool.warm_up(1)
+
+    driver = pool.lease()
+    pool.release(driver)
+
+    assert pool.lease() is driver
+    assert len(built) == 1 and reaper.submitted == []
+
+
+def test_size_bounds_all_profiles_together(built):
+    reaper = FakeReaper()
+    pool = _pool(built, 2, reaper)
+    pool.lease("fast")
+    pool.lease("fidelity", network_events=True)
+
+    with pytest.raises(TimeoutError):
+        pool.lease("perf-measure", timeout=0.1)
+    assert len(built) == 2
+
+
+def test_other_kind_replaces_an_idle_driver(built):
+    reaper = FakeReaper()
+    pool = _pool(built, 1, reaper)
+    pool.warm_up()
+    pool.release(pool.lease())
+
+    driver = pool.lease("fast", network_events=True)
+
+    assert driver.kind == ("fast", True)
+    assert [d.kind for d in reaper.submitted] == [("fidelity", False)]
+    assert _alive(built, reaper) == 1
+
+
+def test_waiting_lease_gets_the_released_slot(built):
+    reaper = FakeReaper()
+    pool = _pool(built, 1, reaper)
+    first = pool.lease("fast")
+    leased = []
+    waiter = threading.Thread(target=lambda: leased.append(pool.lease("fidelity", timeout=5)))
+    waiter.start()
+
+    pool.release(first)
+    waiter.join(5)
+
+    assert leased[0].kind == ("fidelity", False)
+    assert reaper.submitted == [first]
+    assert _alive(built, reaper) == 1
+
+
+def test_failed_or_worn_out_drivers_are_recycled(built):
+    reaper = FakeReaper()
+    pool = _pool(built, 1, reaper, max_leases=2)
+
+    first = pool.lease()
+    pool.release(first, failed=True)
+    second = pool.lease()
+    pool.release(second)
+    pool.release(pool.lease())
+
+    assert reaper.submitted == [first, second]
+    pool.close()
+    assert _alive(built, reaper) == 0
+    with pytest.raises(RuntimeError):
+        pool.lease()
@@ -0,0 +1,88 @@
+"""
+Teste pentru DriverReaper pe Windows - taskkill doar pentru același chromedriver și doar după un quit() eșuat
+"""
+import subprocess
+import threading
+
+import pytest
+
+from utils import driver_reaper
+from utils.driver_reaper import DriverReaper, kill_process_tree
+
+
+ROOT_PID = 4242
+
+
+@pytest.fixture
+def windows(monkeypatch):
+    """Simulează Windows: tasklist întoarce procesul curent al PID-ului, taskkill este înregistrat"""
+    state = {"name": "chromedriver.exe", "killed": []}
+
+    def run(args, **kwargs):
+        if args[0] == "tasklist":
+            output = (f'"{state["name"]}","{ROOT_PID}","Console","1","10,000 K"\n' if state["name"]
+                      else "INFO: No tasks are running which match the specified criteria.\n")
+            return subprocess.CompletedProcess(args, 0, stdout=output, stderr="")
+        state["killed"].append(args)
+        return subprocess.CompletedProcess(args, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(driver_reaper.platform, "system", lambda: "Windows")
+    monkeypatch.setattr(driver_reaper.subprocess, "run", run)
+    return state
+
+
+class Process:
+    pid = ROOT_PID
+
+    def poll(self):
+        return 0
+
+
+class Service:
+    process = Process()
+
+
+class FakeDriver:
+    service = Service()
+
+    def __init__(self, hang=False, error=None):
+        self.release = threading.Event()
+        self.hang = hang
+        self.error = error
+
+    def quit(self):
+        if self.hang:
+            self.release.wait(5)
+        if self.error:
+            raise self.error
+
+
+def test_taskkill_runs_for_the_same_chromedriver(windows):
+    assert kill_process_tree(ROOT_PID, {ROOT_PID: "chromedriver.exe"}) == 1
+    assert windows["killed"] == [["taskkill", "/F", "/T", "/PID", str(ROOT_PID)]]
+
+
+@pytest.mark.parametrize("current", ["notepad.exe", None])
+def test_reused_or_missing_pid_is_not_killed(windows, current):
+    windows["name"] = current
+
+    assert kill_process_tree(ROOT_PID, {ROOT_PID: "chromedriver.exe"}) == 0
+    assert windows["killed"] == []
+
+
+def test_no_taskkill_after_graceful_quit(windows):
+    reaper = DriverReaper(deadline=5)
+    reaper.submit(FakeDriver())
+
+    assert reaper.drain(5)
+    assert windows["killed"] == []
+
+
+@pytest.mark.parametrize("driver", [FakeDriver(hang=True), FakeDriver(error=RuntimeError("quit failed"))])
+def test_taskkill_after_hung_or_failed_quit(windows, driver):
+    reaper = DriverReaper(deadline=0.2)
+    reaper.submit(driver)
+
+    assert reaper.drain(5)
+    driver.release.set()
+    assert windows["killed"] == [["taskkill", "/F", "/T", "/PID", str(ROOT_PID)]]
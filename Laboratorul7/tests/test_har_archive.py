@@ -0,0 +1,131 @@
+"""
+Teste pentru redarea HAR (NETWORK_MODE=replay) pe o conexiune CDP simulată (fără Chrome)
+Căutările Google au parametri variabili (ei, sei) - redarea trebuie să găsească răspunsul după cale
+"""
+import base64
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+import trio
+from selenium.webdriver.common.bidi import cdp
+
+from utils import har_archive
+from utils.har_archive import HarArchive, build_entry
+
+
+CDP_VERSION = "119"
+WINDOW_HANDLE = "6A1C9E5F0B2D4C7E8F9A0B1C2D3E4F50"
+SEARCH_URL = "https://www.google.com/search?q=selenium&ei=recorded"
+
+
+class StubDriver:
+    current_window_handle = WINDOW_HANDLE
+
+
+class StubSession:
+    """Sesiune CDP care doar serializează și înregistrează comenzile"""
+
+    def __init__(self, commands):
+        self.commands = commands
+
+    async def execute(self, cmd):
+        request = next(cmd)
+        self.commands.append(request)
+        result = {"sessionId": "session-1"} if request["method"] == "Target.attachToTarget" else {}
+        try:
+            cmd.send(result)
+        except StopIteration as stop:
+            return stop.value
+        return None
+
+
+@pytest.fixture
+def commands(monkeypatch):
+    commands = []
+
+    class StubConnection(cdp.CdpConnection):
+        def __init__(self):
+            super().__init__(ws=None)
+
+        async def execute(self, cmd):
+            return await StubSession(commands).execute(cmd)
+
+    @asynccontextmanager
+    async def open_cdp(url):
+        yield StubConnection()
+
+    async def session_execute(self, cmd):
+        return await StubSession(commands).execute(cmd)
+
+    monkeypatch.setattr(har_archive, "_cdp_endpoint", lambda driver: (CDP_VERSION, "ws://stub"))
+    monkeypatch.setattr(cdp, "open_cdp", open_cdp)
+    monkeypatch.setattr(cdp.CdpSession, "execute", session_execute)
+    return commands
+
+
+@pytest.fixture
+def archive():
+    archive = HarArchive()
+    archive.add(build_entry(
+        "GET", SEARCH_URL, {}, 200, "OK",
+        [("Content-Type", "text/html"), ("Content-Encoding", "br"), ("Content-Length", "42")],
+        "text/html", "<h3>Selenium</h3>", False, 0.2,
+    ))
+    return archive
+
+
+def _replay(interceptor, url):
+    """Trece o cerere interceptată prin handler-ul de redare"""
+    devtools = cdp.import_devtools(CDP_VERSION)
+    event = SimpleNamespace(request_id=devtools.fetch.RequestId("request-1"),
+                            request=SimpleNamespace(method="GET", url=url))
+    commands = []
+    trio.run(interceptor._replay, StubSession(commands), devtools, event)
+    return commands
+
+
+def test_replay_mode_attaches_to_the_window_target(commands, archive, tmp_path, monkeypatch):
+    archive.save(str(tmp_path / "main.har"))
+    monkeypatch.setenv("NETWORK_MODE", "replay")
+    monkeypatch.setenv("HAR_ARCHIVE", str(tmp_path))
+    monkeypatch.setattr(har_archive, "_replay_archive", None)
+    monkeypatch.setattr(har_archive, "_interceptors", [])
+
+    interceptor = har_archive.attach_network_mode(StubDriver())
+    interceptor.stop()
+    interceptor._thread.join(5)
+
+    assert len(interceptor.archive) == 1
+    assert [command["method"] for command in commands] == ["Target.attachToTarget", "Fetch.enable"]
+    assert commands[0]["params"]["targetId"] == WINDOW_HANDLE
+    assert commands[1]["params"]["patterns"] == [{"urlPattern": "*", "requestStage": "Request"}]
+
+
+def test_search_with_new_query_parameters_is_served_from_archive(commands, archive):
+    interceptor = har_archive.FetchInterceptor(StubDriver(), har_archive.MODE_REPLAY, archive)
+
+    sent = _replay(interceptor, "https://www.google.com/search?q=selenium&ei=live")
+
+    assert [command["method"] for command in sent] == ["Fetch.fulfillRequest"]
+    params = sent[0]["params"]
+    assert params["requestId"] == "request-1"
+    assert params["responseCode"] == 200
+    # Corpul este deja decodat în arhivă - antetele de codare nu mai sunt valabile
+    assert params["responseHeaders"] == [{"name": "Content-Type", "value": "text/html"}]
+    assert base64.b64decode(params["body"]).decode("utf-8") == "<h3>Selenium</h3>"
+    assert interceptor.served == 1 and interceptor.missed == []
+
+
+@pytest.mark.parametrize("strict, method", [(True, "Fetch.failRequest"), (False, "Fetch.continueRequest")])
+def test_request_missing_from_archive(commands, archive, strict, method):
+    interceptor = har_archive.FetchInterceptor(StubDriver(), har_archive.MODE_REPLAY, archive, strict=strict)
+    url = "https://www.google.com/images/branding/logo.png"
+
+    sent = _replay(interceptor, url)
+
+    assert [command["method"] for command in sent] == [method]
+    if strict:
+        # Fără rețea la redarea strictă: pagina vede o eroare, nu răspunsul live
+        assert sent[0]["params"]["errorReason"] == "InternetDisconnected"
+    assert interceptor.missed == [url] and interceptor.served == 0
@@ -0,0 +1,50 @@
+"""
+Teste pentru BasePage.failed_requests - doar erorile navigării curente, nu ale paginilor anterioare
+"""
+import json
+
+from pages.base_page import BasePage
+
+
+def _log_entry(method, params):
+    return {"timestamp": 0, "message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+def _navigation(loader_id, frame_id, page_url, broken_url):
+    """Log-ul unei navigări: documentul (200) și o resursă lipsă (404)"""
+    return [
+        _log_entry("Page.frameNavigated", {"frame": {"id": frame_id, "loaderId": loader_id, "url": page_url}}),
+        _log_entry("Network.requestWillBeSent", {
+            "requestId": loader_id, "loaderId": loader_id, "type": "Document", "request": {"url": page_url}}),
+        _log_entry("Network.responseReceived", {
+            "requestId": loader_id, "loaderId": loader_id, "frameId": frame_id, "type": "Document",
+            "response": {"url": page_url, "status": 200}}),
+        _log_entry("Network.requestWillBeSent", {
+            "requestId": f"{loader_id}.img", "loaderId": loader_id, "type": "Image", "request": {"url": broken_url}}),
+        _log_entry("Network.responseReceived", {
+            "requestId": f"{loader_id}.img", "loaderId": loader_id, "frameId": frame_id, "type": "Image",
+            "response": {"url": broken_url, "status": 404}}),
+    ]
+
+
+class FakeDriver:
+    """Driver cu log-ul 'performance' al navigărilor din scenariu"""
+
+    def __init__(self):
+        self.entries = []
+
+    def get_log(self, kind):
+        entries, self.entries = self.entries, []
+        return entries
+
+
+def test_failed_requests_are_scoped_to_the_current_page():
+    driver = FakeDriver()
+    page = BasePage(driver)
+
+    driver.entries = _navigation("L1", "F", "https://www.google.com/", "https://www.google.com/old.png")
+    assert [request.url for request in page.failed_requests] == ["https://www.google.com/old.png"]
+
+    driver.entries = _navigation("L2", "F", "https://www.google.com/search?q=x", "https://www.google.com/new.png")
+    assert [request.url for request in page.failed_requests] == ["https://www.google.com/new.png"]
+    assert page.last_response_status == 200
@@ -0,0 +1,95 @@
+"""
+Teste pentru rularea paralelă - unirea rapoartelor worker-ilor, împărțirea pe unități și scenariile @serial
+"""
+import json
+
+from utils.parallel_runner import build_shards, discover_units, merge_json_reports
+
+
+FEATURE = "features/google_search.feature"
+
+BACKGROUND = {"type": "background", "keyword": "Background", "location": f"{FEATURE}:3", "steps": []}
+
+
+def _scenario(line, status):
+    return {"type": "scenario", "keyword": "Scenario", "name": f"Scenario at {line}",
+            "location": f"{FEATURE}:{line}", "status": status, "steps": []}
+
+
+def _worker_report(path, elements):
+    report = [{"keyword": "Feature", "name": "Google Search", "location": f"{FEATURE}:1",
+               "status": "skipped", "elements": [BACKGROUND] + elements}]
+    path.write_text(json.dumps(report), encoding="utf-8")
+    return str(path)
+
+
+def test_merge_keeps_the_result_of_the_worker_that_ran_each_scenario(tmp_path):
+    # Fiecare worker raportează ca 'skipped' scenariile care nu i-au fost alocate
+    first = _worker_report(tmp_path / "worker-1.json", [_scenario(8, "passed"), _scenario(14, "skipped"),
+                                                        _scenario(20, "skipped")])
+    second = _worker_report(tmp_path / "worker-2.json", [_scenario(20, "failed"), _scenario(8, "skipped"),
+                                                         _scenario(14, "passed")])
+    output = tmp_path / "behave-report.json"
+
+    merged = merge_json_reports([first, str(tmp_path / "missing.json"), second], str(output))
+
+    assert json.loads(output.read_text(encoding="utf-8")) == merged
+    assert len(merged) == 1
+    feature = merged[0]
+    assert feature["status"] == "failed"
+    assert [(e["type"], e["location"], e.get("status")) for e in feature["elements"]] == [
+        ("background", f"{FEATURE}:3", None),
+        ("scenario", f"{FEATURE}:8", "passed"),
+        ("scenario", f"{FEATURE}:14", "passed"),
+        ("scenario", f"{FEATURE}:20", "failed"),
+    ]
+
+
+def test_merge_of_all_passed_workers_marks_the_feature_passed(tmp_path):
+    first = _worker_report(tmp_path / "worker-1.json", [_scenario(8, "passed"), _scenario(14, "skipped")])
+    second = _worker_report(tmp_path / "worker-2.json", [_scenario(14, "passed"), _scenario(8, "skipped")])
+
+    merged = merge_json_reports([first, second], str(tmp_path / "behave-report.json"))
+
+    assert merged[0]["status"] == "passed"
+
+
+def _write_features(tmp_path):
+    (tmp_path / "a_search.feature").write_text(
+        "Feature: Search\n\n"
+        "  Scenario: One\n    Given a step\n\n"
+        "  Scenario: Two\n    Given a step\n",
+        encoding="utf-8")
+    (tmp_path / "b_images.feature").write_text(
+        "@images\nFeature: Images\n\n"
+        "  Scenario: Three\n    Given a step\n\n"
+        "  @serial\n  Scenario: Four\n    Given a step\n",
+        encoding="utf-8")
+    return str(tmp_path)
+
+
+def test_features_with_serial_scenarios_are_split(tmp_path):
+    units = discover_units(_write_features(tmp_path), granularity="feature")
+
+    assert [(unit.name, unit.line is None, unit.is_serial) for unit in units] == [
+        ("Search", True, False), ("Three", False, False), ("Four", False, True)]
+    assert [scenario.name for scenario in units[0].scenarios] == ["One", "Two"]
+    assert units[2].tags == ["images", "serial"]
+    assert units[2].location.endswith("b_images.feature:8")
+
+
+def test_scenario_granularity_lists_every_scenario(tmp_path):
+    units = discover_units(_write_features(tmp_path), granularity="scenario")
+
+    assert [unit.name for unit in units] == ["One", "Two", "Three", "Four"]
+
+
+def test_build_shards_distributes_every_unit_once(tmp_path):
+    units = discover_units(_write_features(tmp_path), granularity="scenario")
+
+    shards = build_shards(units, 3)
+
+    assert len(shards) == 3
+    assert sorted(unit.name for shard in shards for unit in shard) == ["Four", "One", "Three", "Two"]
+    assert build_shards([], 3) == []
+    assert len(build_shards(units, 8)) == len(units)
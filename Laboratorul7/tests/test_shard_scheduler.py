@@ -0,0 +1,83 @@
+"""
+Teste pentru planificarea shard-urilor - istoricul duratelor, valorile implicite și împărțirea LPT
+"""
+import json
+
+import pytest
+
+from utils import parallel_runner
+from utils.shard_scheduler import DEFAULT_SCENARIO_SECONDS, DurationHistory, estimate_cost, plan_shards
+
+
+FEATURE = "features/google_search.feature"
+
+# Durata fiecărui scenariu din raportul anterior (linie -> secunde)
+DURATIONS = {10: 9.0, 20: 8.0, 30: 6.0, 40: 5.0, 50: 4.0, 60: 2.0}
+
+
+def _element(line, seconds, status="passed", kind="scenario"):
+    # Durata scenariului este suma pașilor
+    return {"type": kind, "name": f"S{line}", "location": f"{FEATURE}:{line}", "status": status,
+            "steps": [{"result": {"duration": seconds / 2}}, {"result": {"duration": seconds / 2}}]}
+
+
+@pytest.fixture
+def history(tmp_path):
+    elements = [_element(3, 50.0, kind="background")]
+    elements += [_element(line, seconds) for line, seconds in DURATIONS.items()]
+    # Un scenariu sărit nu are o durată utilă, chiar dacă pașii au valori
+    elements.append(_element(70, 100.0, status="skipped"))
+    report = tmp_path / "behave-report.json"
+    report.write_text(json.dumps([{"name": "Google Search", "elements": elements}]), encoding="utf-8")
+    return DurationHistory([str(report), str(tmp_path / "missing.json")])
+
+
+def _unit(line):
+    return parallel_runner.TestUnit(FEATURE, f"S{line}", line)
+
+
+def test_history_reads_scenario_durations(history):
+    assert len(history) == len(DURATIONS)
+    assert history.scenario_duration(FEATURE, "S10", 10) == pytest.approx(9.0)
+    # Scenariul mutat în fișier își păstrează istoricul după nume
+    assert history.scenario_duration(FEATURE, "S20", 21) == pytest.approx(8.0)
+    assert history.scenario_duration(FEATURE, "S70", 70) is None
+
+
+def test_new_and_skipped_scenarios_get_the_median(history):
+    median = 5.5
+    assert history.default_duration() == pytest.approx(median)
+    assert estimate_cost(_unit(70), history) == pytest.approx(median)
+    assert estimate_cost(_unit(80), history) == pytest.approx(median)
+
+
+def test_empty_history_uses_the_default():
+    history = DurationHistory()
+
+    assert history.default_duration() == DEFAULT_SCENARIO_SECONDS
+    assert estimate_cost(_unit(10), history) == DEFAULT_SCENARIO_SECONDS
+
+
+def test_feature_cost_is_the_sum_of_its_scenarios(history):
+    feature = parallel_runner.TestUnit(FEATURE, "Google Search", scenarios=[_unit(10), _unit(20), _unit(80)])
+
+    assert estimate_cost(feature, history) == pytest.approx(9.0 + 8.0 + 5.5)
+
+
+def test_lpt_assigns_longest_units_to_the_least_loaded_worker(history):
+    planned = plan_shards([_unit(line) for line in DURATIONS], 2, history)
+
+    assert [[unit.line for unit in shard] for shard, _ in planned] == [[10, 40, 50], [20, 30, 60]]
+    assert [load for _, load in planned] == pytest.approx([18.0, 16.0])
+
+
+def test_shards_finish_close_to_total_divided_by_workers(history):
+    units = [_unit(line) for line in DURATIONS] * 3
+    total = sum(DURATIONS.values()) * 3
+
+    planned = plan_shards(units, 3, history)
+
+    loads = [load for _, load in planned]
+    assert sum(loads) == pytest.approx(total)
+    assert max(loads) - min(loads) <= min(DURATIONS.values())
+    assert max(loads) <= total / 3 + min(DURATIONS.values())
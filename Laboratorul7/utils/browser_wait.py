@@ -0,0 +1,250 @@
+"""
+Motor de așteptare în browser (execute_async_script + MutationObserver).
+WebDriverWait verifică condiția prin HTTP la fiecare poll; aici condiția este
+verificată în pagină, la fiecare mutație DOM sau eveniment relevant
+(transitionend, animationend, hashchange, popstate, load, resize), așa că
+așteptarea se termină imediat și costă o singură cerere WebDriver.
+Dacă pagina navighează în timpul scriptului (documentul este descărcat) sau
+scriptul eșuează, restul timpului se așteaptă prin polling obișnuit.
+WAIT_ENGINE=polling dezactivează motorul din browser.
+"""
+import os
+import time
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+from selenium.webdriver.support import expected_conditions as EC
+
+from utils.element_batch import displayed_atom
+from utils.wait_conditions import Condition, as_locator, get_budget, wait_until
+
+
+ENGINE_BROWSER = "browser"
+ENGINE_POLLING = "polling"
+
+# Scriptul asincron este limitat de script timeout-ul sesiunii (implicit 30s)
+MAX_BROWSER_WAIT = 25.0
+
+# Verificare de siguranță în pagină, pentru schimbări fără mutații (ex: history.pushState)
+BACKSTOP_INTERVAL_MS = 250
+
+WAIT_SCRIPT = """
+var kind = arguments[0], locators = arguments[1], text = arguments[2],
+    timeoutMs = arguments[3], backstopMs = arguments[4], done = arguments[arguments.length - 1];
+
+// Vizibilitatea se decide cu atomul isDisplayed al Selenium, ca la polling și în page_state / element_batch
+var isDisplayed = __IS_DISPLAYED__;
+
+function first(list) { return list && list.length ? list[0] : null; }
+
+function find(by, value) {
+    switch (by) {
+        case 'css selector': return document.querySelector(value);
+        case 'id': return document.getElementById(value);
+        case 'name': return first(document.getElementsByName(value));
+        case 'class name': return first(document.getElementsByClassName(value));
+        case 'tag name': return first(document.getElementsByTagName(value));
+        case 'xpath':
+            return document.evaluate(value, document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'link text':
+            return Array.from(document.links).find(function (a) {
+                return a.innerText.trim() === value; }) || null;
+        case 'partial link text':
+            return Array.from(document.links).find(function (a) {
+                return a.innerText.indexOf(value) !== -1; }) || null;
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+
+function visible(el) {
+    return !!el && el.isConnected && !!isDisplayed(el);
+}
+
+function matches(el) {
+    switch (kind) {
+        case 'present': return !!el;
+        case 'visible': return visible(el);
+        case 'clickable': return visible(el) && !el.disabled;
+        case 'text': return !!el && (el.innerText || el.textContent || '').indexOf(text) !== -1;
+    }
+    throw new Error('Unknown wait kind: ' + kind);
+}
+
+// Primul locator (în ordinea dată) care îndeplinește condiția: {value, index}
+function check() {
+    if (kind === 'url_contains') return location.href.indexOf(text) !== -1 ? {value: true} : null;
+    if (kind === 'invisible') {
+        return locators.every(function (l) { return !visible(find(l[0], l[1])); }) ? {value: true} : null;
+    }
+    for (var i = 0; i < locators.length; i++) {
+        var el = find(locators[i][0], locators[i][1]);
+        if (matches(el)) return {value: kind === 'text' ? true : el, index: i};
+    }
+    return null;
+}
+
+var finished = false, observer = null, timer = null, backstop = null;
+var events = ['transitionend', 'animationend', 'hashchange', 'popstate', 'load', 'resize'];
+
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    clearInterval(backstop);
+    events.forEach(function (name) { window.removeEventListener(name, recheck, true); });
+    done(result);
+}
+
+function recheck() {
+    try {
+        var result = check();
+        if (result) finish(result);
+    } catch (e) {
+        finish({error: String(e)});
+    }
+}
+
+recheck();
+if (!finished) {
+    observer = new MutationObserver(recheck);
+    observer.observe(document.documentElement, {
+        childList: true, subtree: true, attributes: true, characterData: true
+    });
+    events.forEach(function (name) { window.addEventListener(name, recheck, true); });
+    backstop = setInterval(recheck, backstopMs);
+    timer = setTimeout(function () { finish({timeout: true}); }, timeoutMs);
+}
+"""
+
+# Condiția echivalentă pentru polling (fallback) pentru fiecare tip de așteptare
+_POLLING_CONDITIONS = {
+    "present": lambda locator, text: EC.presence_of_element_located(locator),
+    "visible": lambda locator, text: EC.visibility_of_element_located(locator),
+    "clickable": lambda locator, text: EC.element_to_be_clickable(locator),
+    "text": lambda locator, text: EC.text_to_be_present_in_element(locator, text),
+    "invisible": lambda locator, text: EC.invisibility_of_element_located(locator),
+    "url_contains": lambda locator, text: EC.url_contains(text),
+}
+
+
+def wait_script():
+    """
+    Scriptul de așteptare cu atomul isDisplayed inclus
+
+    Returns:
+        str: WAIT_SCRIPT gata de trimis cu execute_async_script
+    """
+    return WAIT_SCRIPT.replace("__IS_DISPLAYED__", displayed_atom())
+
+
+def wait_engine():
+    """
+    Motorul de așteptare ales cu variabila WAIT_ENGINE
+
+    Returns:
+        str: 'browser' (implicit) sau 'polling'
+    """
+    engine = os.environ.get("WAIT_ENGINE", ENGINE_BROWSER).strip().lower() or ENGINE_BROWSER
+    if engine not in (ENGINE_BROWSER, ENGINE_POLLING):
+        raise ValueError(f"Unknown WAIT_ENGINE '{engine}'. Available: {ENGINE_BROWSER}, {ENGINE_POLLING}")
+    return engine
+
+
+def _polling_condition(kind, locators, text):
+    """Condiția de polling echivalentă scriptului (fallback): (valoare, index) sau False"""
+    if kind == "url_contains":
+        url_check = EC.url_contains(text)
+        return Condition(f"{kind} (polling)", lambda driver: url_check(driver) and (True, None))
+
+    checks = [_POLLING_CONDITIONS[kind](locator, text) for locator in locators]
+    if kind == "invisible":
+        return Condition(f"{kind} (polling)",
+                         lambda driver: all(check(driver) for check in checks) and (True, None))
+
+    def predicate(driver):
+        for index, check in enumerate(checks):
+            try:
+                value = check(driver)
+            except (NoSuchElementException, StaleElementReferenceException):
+                value = False
+            if value:
+                return value, index
+        return False
+    return Condition(f"{kind} (polling)", predicate)
+
+
+def _wait(driver, kind, locators, timeout, text):
+    """Rulează așteptarea în pagină; la navigare / eroare continuă prin polling"""
+    if kind not in _POLLING_CONDITIONS:
+        raise ValueError(f"Unknown wait kind '{kind}'. Available: {', '.join(_POLLING_CONDITIONS)}")
+    locators = [as_locator(locator) for locator in locators]
+    fallback = _polling_condition(kind, locators, text)
+
+    if wait_engine() != ENGINE_BROWSER:
+        return wait_until(driver, fallback, timeout) or (False, None)
+
+    start = time.perf_counter()
+    browser_timeout = min(timeout, MAX_BROWSER_WAIT)
+    try:
+        outcome = driver.execute_async_script(
+            wait_script(), kind, [list(locator) for locator in locators], text,
+            int(browser_timeout * 1000), BACKSTOP_INTERVAL_MS,
+        ) or {}
+    except WebDriverException:
+        # Documentul a fost descărcat (navigare) sau sesiunea a refuzat scriptul
+        outcome = {"error": "script interrupted"}
+
+    elapsed = time.perf_counter() - start
+    if "value" in outcome:
+        get_budget().record_condition(f"{kind} (browser)", elapsed, True)
+        return outcome["value"], outcome.get("index")
+    if outcome.get("timeout") and browser_timeout >= timeout:
+        get_budget().record_condition(f"{kind} (browser)", elapsed, False)
+        return False, None
+
+    # Navigare, eroare de script sau timeout mai lung decât limita scriptului: polling
+    get_budget().record_condition(f"{kind} (browser, fell back)", elapsed, True)
+    return wait_until(driver, fallback, max(timeout - elapsed, 0)) or (False, None)
+
+
+def browser_wait(driver, kind, locator=None, timeout=10, text=None):
+    """
+    Așteaptă o condiție printr-un singur script asincron rulat în pagină
+
+    Args:
+        driver: WebDriver instance
+        kind (str): 'present', 'visible', 'clickable', 'text', 'invisible' sau 'url_contains'
+        locator: Tuple (By, value) sau selector CSS (nu este folosit pentru 'url_contains')
+        timeout (float): Timeout în secunde
+        text (str): Textul așteptat ('text') sau fragmentul de URL ('url_contains')
+
+    Returns:
+        WebElement pentru present/visible/clickable, True pentru celelalte,
+        False dacă a expirat timeout-ul
+    """
+    value, _ = _wait(driver, kind, [locator] if locator is not None else [], timeout, text)
+    return value
+
+
+def browser_wait_any(driver, kind, locators, timeout=10, text=None):
+    """
+    Așteaptă primul dintre mai mulți locatori alternativi care îndeplinește condiția
+
+    Toți candidații sunt verificați în aceeași interogare din pagină, în ordinea dată.
+
+    Args:
+        driver: WebDriver instance
+        kind (str): 'present', 'visible', 'clickable' sau 'text'
+        locators (list): Locatorii candidați, în ordinea preferată
+        timeout (float): Timeout în secunde
+        text (str): Textul așteptat (pentru 'text')
+
+    Returns:
+        tuple: (valoare, indexul locatorului câștigător) sau (False, None) la timeout
+    """
+    return _wait(driver, kind, list(locators), timeout, text)
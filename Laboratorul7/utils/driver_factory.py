@@ -2,27 +2,162 @@
 Factory pentru crearea și configurarea WebDriver.
 Toate testele rulează în browserul Chrome.
 """
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+
+from utils.driver_reaper import get_reaper
+from utils.driver_resolver import ChromeDriverResolver
+from utils.har_archive import attach_network_mode
+from utils.network_events import enable_performance_logging, network_events, network_events_requested
+from utils.request_blocker import BLOCK_RULESETS, request_blocker
+from utils.startup_profiler import StartupProfiler
+from utils.wait_conditions import implicit_wait_seconds, sync_mode
+
+
+# Tag-urile de forma @profile-<nume> aleg profilul unui scenariu
+PROFILE_TAG_PREFIX = "profile-"
+
+# Fonturile nu au o preferință Chrome dedicată - sunt blocate prin CDP
+FONT_URL_PATTERNS = BLOCK_RULESETS["fonts"]
+
+# Ce se șterge pentru fiecare origine vizitată la returnarea unui driver în pool
+CLEARED_STORAGE_TYPES = "local_storage,indexeddb,websql,cache_storage,service_workers,file_systems,shader_cache"
+
+
+class BrowserProfile:
+    """
+    Profil de browser cu nume (fast, fidelity, perf-measure).
+
+    Un profil descrie ce resurse încarcă Chrome și cum arată fereastra.
+    Profilul 'fast' renunță la tot ce testele funcționale nu verifică
+    (imagini, fonturi, randare vizibilă), 'fidelity' păstrează comportamentul
+    unui browser obișnuit, iar 'perf-measure' oferă condiții repetabile
+    pentru măsurători (cache gol, viewport fix).
+    """
+
+    def __init__(self, name, headless=False, block_images=False, block_fonts=False,
+                 page_load_strategy="normal", window_size=None, maximize=True,
+                 clean_cache=False):
+        """
+        Args:
+            name (str): Numele profilului
+            headless (bool): Rulează fără fereastră vizibilă
+            block_images (bool): Nu încarcă imagini (preferință Chrome)
+            block_fonts (bool): Nu încarcă fonturi web (blocate prin CDP)
+            page_load_strategy (str): 'normal', 'eager' sau 'none'
+            window_size (tuple): Dimensiunea fixă a ferestrei (lățime, înălțime)
+            maximize (bool): Maximizează fereastra (ignorat dacă window_size e setat)
+            clean_cache (bool): Golește cache-ul la pornire și la fiecare resetare
+        """
+        self.name = name
+        self.headless = headless
+        self.block_images = block_images
+        self.block_fonts = block_fonts
+        self.page_load_strategy = page_load_strategy
+        self.window_size = window_size
+        self.maximize = maximize and window_size is None
+        self.clean_cache = clean_cache
+
+    def prepare_driver(self, driver):
+        """
+        Aplică setările care se fac prin CDP (după pornirea browser-ului)
+
+        Args:
+            driver: WebDriver instance
+        """
+        if self.block_fonts:
+            # Tipare de bază - se combină cu seturile alese per scenariu (@block-<set>)
+            request_blocker(driver).set_base_patterns(FONT_URL_PATTERNS)
+        if self.clean_cache:
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+
+    def __repr__(self):
+        return f"BrowserProfile({self.name!r})"
+
+
+BROWSER_PROFILES = {
+    "fast": BrowserProfile(
+        "fast",
+        headless=True,
+        block_images=True,
+        block_fonts=True,
+        page_load_strategy="eager",
+        window_size=(1920, 1080),
+    ),
+    "fidelity": BrowserProfile("fidelity"),
+    "perf-measure": BrowserProfile(
+        "perf-measure",
+        headless=True,
+        window_size=(1366, 768),
+        clean_cache=True,
+    ),
+}
+
+
+def get_profile(name=None):
+    """
+    Returnează profilul cerut (implicit cel din BROWSER_PROFILE / DriverConfig)
+
+    Args:
+        name (str): Numele profilului
+
+    Returns:
+        BrowserProfile: Profilul găsit
+    """
+    name = name or DriverConfig.PROFILE
+    if name not in BROWSER_PROFILES:
+        raise ValueError(f"Unknown browser profile '{name}'. "
+                         f"Available: {', '.join(sorted(BROWSER_PROFILES))}")
+    return BROWSER_PROFILES[name]
+
+
+def profile_from_tags(tags, default=None):
+    """
+    Alege profilul după tag-uri (ex: @profile-fast), altfel profilul implicit
+
+    Args:
+        tags (list): Tag-urile efective ale scenariului
+        default (str): Profilul folosit dacă nu există tag
+
+    Returns:
+        BrowserProfile: Profilul scenariului
+    """
+    for tag in tags:
+        if tag.startswith(PROFILE_TAG_PREFIX):
+            return get_profile(tag[len(PROFILE_TAG_PREFIX):])
+    return get_profile(default)
 
 
 class DriverFactory:
     """Factory class pentru gestionarea WebDriver"""
 
     @staticmethod
-    def get_chrome_driver(headless=False, maximize=True):
+    def get_chrome_driver(headless=False, maximize=True, profile=None, network_events=None):
         """
         Creează și configurează un Chrome WebDriver
 
         Args:
             headless (bool): Rulează browser în mod headless
             maximize (bool): Maximizează fereastra browser-ului
+            profile (BrowserProfile): Profilul aplicat peste setările de bază
+            network_events (bool): Activează log-ul 'performance' (implicit doar cu NETWORK_EVENTS=1)
 
         Returns:
             WebDriver: Instanță configurată de Chrome WebDriver
         """
+        profiler = StartupProfiler(profile=profile.name if profile is not None else None)
+        options_start = time.perf_counter()
+
+        if profile is not None:
+            headless = headless or profile.headless
+            maximize = profile.maximize
+
         # Configurare opțiuni Chrome
         chrome_options = Options()
 
@@ -36,22 +171,33 @@ class DriverFactory:
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")  # Evită detecția automation
 
         # Dezactivează notificările
-        chrome_options.add_experimental_option(
-            "prefs", {
-                "profile.default_content_setting_values.notifications": 2,
-                "profile.default_content_settings.popups": 0,
-                "download.prompt_for_download": False
-            }
-        )
+        prefs = {
+            "profile.default_content_setting_values.notifications": 2,
+            "profile.default_content_settings.popups": 0,
+            "download.prompt_for_download": False
+        }
+        if profile is not None and profile.block_images:
+            prefs["profile.managed_default_content_settings.images"] = 2
+        chrome_options.add_experimental_option("prefs", prefs)
+
+        if profile is not None:
+            chrome_options.page_load_strategy = profile.page_load_strategy
+
+        # Evenimentele de rețea (statusuri, raportul blocărilor) vin din log-ul 'performance' - doar la cerere
+        if network_events_requested() if network_events is None else network_events:
+            enable_performance_logging(chrome_options)
 
         # Exclude logging și automation flags pentru a evita detecția
         chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
         chrome_options.add_experimental_option('useAutomationExtension', False)
 
         # Mod headless (optional)
+        window_size = profile.window_size if profile is not None else None
         if headless:
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--window-size=1920,1080")
+            chrome_options.add_argument("--headless=new")
+            window_size = window_size or (1920, 1080)
+        if window_size:
+            chrome_options.add_argument(f"--window-size={window_size[0]},{window_size[1]}")
 
         # User agent pentru a evita bot detection
         chrome_options.add_argument(
@@ -59,89 +205,345 @@ class DriverFactory:
             "AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/120.0.0.0 Safari/537.36"
         )
+        profiler.record("build_options", time.perf_counter() - options_start)
+
+        # Rezolvă ChromeDriver din manifestul local (rețea doar la prima rezolvare)
+        try:
+            with profiler.phase("resolve_driver"):
+                resolution = ChromeDriverResolver().resolve()
+        except Exception as e:
+            print(f"[ERROR] ChromeDriver resolution failed: {e}")
+            profiler.finish(status="error")
+            raise Exception("ChromeDriver not found! Please install Chrome browser or add chromedriver to drivers/ folder")
+        service = Service(resolution.path)
+
+        # Pornirea procesului chromedriver se măsoară separat de crearea sesiunii
+        start_service = service.start
+
+        def timed_start():
+            with profiler.phase("service_spawn"):
+                start_service()
+
+        service.start = timed_start
+
+        try:
+            # Creează WebDriver
+            init_start = time.perf_counter()
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+            profiler.record(
+                "session_create",
+                time.perf_counter() - init_start - profiler.phases.get("service_spawn", 0.0)
+            )
+
+            # Elimină flag-ul webdriver pentru a evita detecția bot
+            with profiler.phase("cdp_user_agent"):
+                driver.execute_cdp_cmd('Network.setUserAgentOverride', {
+                    "userAgent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+                })
+            with profiler.phase("webdriver_flag_script"):
+                driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+            if profile is not None:
+                with profiler.phase("profile_cdp"):
+                    profile.prepare_driver(driver)
+
+            # Înregistrare / redare HAR (NETWORK_MODE=record|replay)
+            with profiler.phase("network_mode"):
+                attach_network_mode(driver)
+
+            # Setări suplimentare
+            with profiler.phase("maximize_and_timeouts"):
+                if maximize:
+                    driver.maximize_window()
+
+                # Timeouts
+                # Implicit wait 0 în modul explicit (SYNC_MODE)
+                driver.implicitly_wait(implicit_wait_seconds())
+                driver.set_page_load_timeout(30)  # Page load timeout
+        except Exception:
+            profiler.finish(status="error")
+            raise
+
+        profiler.finish()
+        return driver
 
-        # Folosește webdriver-manager pentru a gestiona automat ChromeDriver
-        # NU SE FOLOSESC CĂILE ABSOLUTE - se lasă managerul să gestioneze
-        import os
-
-        # Verifică dacă există chromedriver în directorul curent sau în PATH
-        chromedriver_path = None
-        local_paths = [
-            os.path.join("drivers", "chromedriver.exe"),  # Cale relativă la proiect
-            "chromedriver.exe"  # În directorul curent sau PATH
-        ]
-
-        for path in local_paths:
-            if os.path.exists(path):
-                chromedriver_path = os.path.abspath(path)
-                print(f"[OK] Found ChromeDriver at: {path}")
-                break
-
-        if chromedriver_path:
-            service = Service(chromedriver_path)
-        else:
-            # Folosește webdriver-manager (gestionează automat descărcarea)
+    @staticmethod
+    def quit_driver(driver):
+        """
+        Închide și curăță WebDriver
+
+        Args:
+            driver: Instanța WebDriver de închis
+        """
+        if driver:
             try:
-                import platform
-                print("[INFO] Using webdriver-manager to download ChromeDriver...")
-
-                # Forțează descărcarea versiunii win64 pentru Windows 64-bit
-                if platform.system() == "Windows" and platform.machine().endswith('64'):
-                    # Șterge cache-ul vechi win32 și forțează win64
-                    import shutil
-                    cache_path = os.path.join(os.path.expanduser("~"), ".wdm", "drivers", "chromedriver")
-                    if os.path.exists(cache_path):
-                        try:
-                            shutil.rmtree(cache_path)
-                            print("[INFO] Cleared old ChromeDriver cache")
-                        except:
-                            pass
-
-                service = Service(ChromeDriverManager().install())
-                print("[OK] ChromeDriver installed successfully")
+                driver.quit()
             except Exception as e:
-                print(f"[ERROR] WebDriver Manager failed: {e}")
-                raise Exception("ChromeDriver not found! Please install Chrome browser or add chromedriver.exe to drivers/ folder")
+                print(f"Error closing driver: {e}")
+
 
-        # Creează WebDriver
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+class DriverPool:
+    """
+    Pool limitat de instanțe Chrome pornite în avans.
 
-        # Elimină flag-ul webdriver pentru a evita detecția bot
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    Fiecare scenariu împrumută un driver (lease) și îl returnează (release).
+    La returnare driver-ul este resetat (cookies, storage, ferestre extra,
+    about:blank) în loc să fie închis. Chrome este recreat doar după
+    un număr configurabil de împrumuturi sau după un eșec.
 
-        # Setări suplimentare
-        if maximize:
-            driver.maximize_window()
+    Profilul și log-ul 'performance' se aleg la pornirea browser-ului, așa că
+    fiecare driver are un tip (profil, evenimente de rețea). Limita `size` este
+    comună tuturor tipurilor: când un scenariu cere un tip care nu are driver
+    liber și pool-ul este plin, cel mai vechi driver liber de alt tip este
+    închis și înlocuit.
+    """
 
-        # Timeouts
-        driver.implicitly_wait(10)  # Implicit wait
-        driver.set_page_load_timeout(30)  # Page load timeout
+    def __init__(self, size=1, max_leases=20, driver_builder=None, default_profile=None, reaper=None):
+        """
+        Inițializează pool-ul
 
+        Args:
+            size (int): Numărul maxim de drivere deschise simultan (toate tipurile)
+            max_leases (int): După câte împrumuturi este reciclat un driver
+            driver_builder (callable): Funcție (profil, evenimente de rețea) care creează un driver nou
+            default_profile (str): Profilul folosit când lease() nu primește unul
+            reaper (DriverReaper): Închide driverele scoase din pool pe fundal
+        """
+        self.default_profile = default_profile or DriverConfig.PROFILE
+        self._reaper = reaper or get_reaper()
+        self.size = max(1, size)
+        self.max_leases = max(1, max_leases)
+        self._driver_builder = driver_builder or DriverConfig.create_driver
+        # Driverele libere, de la cel mai vechi la cel mai recent returnat: [(tip, driver)]
+        self._idle = []
+        self._kinds = {}
+        self._lease_counts = {}
+        self._created = 0
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def _kind(self, profile=None, network_events=False):
+        """Tipul unui driver: (numele profilului, log-ul 'performance' activat)"""
+        return profile or self.default_profile, bool(network_events)
+
+    def _build(self, kind):
+        """Creează un driver de tipul cerut (locul din pool este deja rezervat)"""
+        try:
+            driver = self._driver_builder(*kind)
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify_all()
+            raise
+        with self._cond:
+            self._kinds[id(driver)] = kind
+            self._lease_counts[id(driver)] = 0
         return driver
 
-    @staticmethod
-    def quit_driver(driver):
+    def warm_up(self, count=None, profile=None, network_events=False):
         """
-        Închide și curăță WebDriver
+        Pornește în avans drivere până la numărul cerut
 
         Args:
-            driver: Instanța WebDriver de închis
+            count (int): Câte drivere să fie pregătite (implicit: size)
+            profile (str): Profilul driverelor pornite (implicit default_profile)
+            network_events (bool): Driverele au log-ul 'performance' activat
         """
-        if driver:
+        kind = self._kind(profile, network_events)
+        target = self.size if count is None else min(count, self.size)
+        while True:
+            with self._cond:
+                if self._created >= target:
+                    return
+                self._created += 1
+            driver = self._build(kind)
+            with self._cond:
+                self._idle.append((kind, driver))
+                self._cond.notify_all()
+
+    def lease(self, profile=None, network_events=False, timeout=None):
+        """
+        Împrumută un driver de tipul cerut (refolosit, creat sau înlocuind unul liber de alt tip)
+
+        Args:
+            profile (str): Profilul cerut de scenariu (implicit default_profile)
+            network_events (bool): Scenariul are nevoie de log-ul 'performance'
+            timeout (float): Cât se așteaptă după un loc liber în pool
+
+        Returns:
+            WebDriver: Driver pregătit pentru un scenariu nou
+        """
+        kind = self._kind(profile, network_events)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        evicted = None
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("DriverPool is closed")
+                # Cel mai recent driver liber de același tip
+                match = next((i for i in range(len(self._idle) - 1, -1, -1) if self._idle[i][0] == kind), None)
+                if match is not None:
+                    driver = self._idle.pop(match)[1]
+                    self._lease_counts[id(driver)] += 1
+                    return driver
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                if self._idle:
+                    # Pool plin, dar cu drivere libere de alt tip: cel mai vechi face loc
+                    evicted = self._idle.pop(0)[1]
+                    self._forget(evicted)
+                    self._created += 1
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No driver released within {timeout}s (pool size {self.size})")
+                self._cond.wait(remaining)
+
+        if evicted is not None:
+            print(f"[INFO] Replacing an idle browser with a new one (profile: {kind[0]}"
+                  f"{', network events' if kind[1] else ''})")
+            self._reaper.submit(evicted)
+        driver = self._build(kind)
+        with self._cond:
+            self._lease_counts[id(driver)] += 1
+        return driver
+
+    def release(self, driver, failed=False):
+        """
+        Returnează un driver în pool
+
+        Args:
+            driver: Driver-ul împrumutat
+            failed (bool): Scenariul a eșuat - driver-ul este reciclat
+        """
+        if driver is None:
+            return
+
+        with self._cond:
+            kind = self._kinds.get(id(driver), self._kind())
+            leases = self._lease_counts.get(id(driver), 0)
+        recycle = failed or self._closed or leases >= self.max_leases
+
+        if not recycle:
             try:
-                driver.quit()
+                self.reset_driver(driver)
+                if get_profile(kind[0]).clean_cache:
+                    driver.execute_cdp_cmd("Network.clearBrowserCache", {})
             except Exception as e:
-                print(f"Error closing driver: {e}")
+                print(f"[WARNING] Driver reset failed, recycling: {e}")
+                recycle = True
+
+        if not recycle:
+            with self._cond:
+                # close() poate rula între timp (after_all) - driver-ul nu mai intră în pool
+                if not self._closed:
+                    self._idle.append((kind, driver))
+                    self._cond.notify_all()
+                    return
+        self._discard(driver)
+
+    @staticmethod
+    def reset_driver(driver):
+        """
+        Aduce driver-ul într-o stare curată pentru următorul scenariu
+
+        Args:
+            driver: WebDriver instance
+        """
+        handles = driver.window_handles
+        main_handle = handles[0]
+        origins = set()
+        for handle in reversed(handles):
+            driver.switch_to.window(handle)
+            origins |= DriverPool.visited_origins(driver)
+            if handle != main_handle:
+                driver.close()
+        driver.switch_to.window(main_handle)
+
+        try:
+            # sessionStorage ține de tab, nu de origine - se golește pentru pagina curentă
+            driver.execute_script("window.sessionStorage.clear();")
+        except Exception:
+            # about:blank și paginile de eroare nu au storage
+            pass
+        driver.get("about:blank")
+
+        # delete_all_cookies() și localStorage.clear() ar atinge doar originea curentă:
+        # cookie-urile tuturor domeniilor și storage-ul fiecărei origini vizitate se șterg prin CDP
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for origin in sorted(origins):
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                "origin": origin, "storageTypes": CLEARED_STORAGE_TYPES,
+            })
+
+    @staticmethod
+    def visited_origins(driver):
+        """
+        Originile http(s) vizitate în tab-ul curent
+
+        Istoricul tab-ului dă paginile principale, arborele de cadre dă iframe-urile
+        paginii curente, iar evenimentele de rețea (dacă sunt activate) documentele
+        tuturor cadrelor din scenariu.
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            set: Originile (ex: 'https://www.google.co.in')
+        """
+        urls = [entry.get("url") for entry in
+                driver.execute_cdp_cmd("Page.getNavigationHistory", {}).get("entries", [])]
+
+        frames = [driver.execute_cdp_cmd("Page.getFrameTree", {}).get("frameTree", {})]
+        while frames:
+            node = frames.pop()
+            urls.append(node.get("frame", {}).get("url"))
+            frames.extend(node.get("childFrames", []))
+
+        events = network_events(driver)
+        events.drain()
+        urls.extend(event.params.get("documentURL") for event in events.by_method("Network.requestWillBeSent"))
+
+        origins = set()
+        for url in urls:
+            parts = urlsplit(url or "")
+            if parts.scheme in ("http", "https") and parts.netloc:
+                origins.add(f"{parts.scheme}://{parts.netloc}")
+        return origins
+
+    def _forget(self, driver):
+        """Uită un driver scos din pool (apelat cu _cond luat)"""
+        self._kinds.pop(id(driver), None)
+        self._lease_counts.pop(id(driver), None)
+        self._created -= 1
+        self._cond.notify_all()
+
+    def _discard(self, driver):
+        """
+        Scoate definitiv un driver din pool și eliberează locul imediat.
+        quit() rulează pe fundal (reaper), deci scenariul următor nu așteaptă.
+        """
+        with self._cond:
+            self._forget(driver)
+        self._reaper.submit(driver)
+
+    def close(self):
+        """Închide toate driverele libere din pool"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for _, driver in idle:
+            self._discard(driver)
 
 
 class DriverConfig:
     """Configurații pentru WebDriver"""
 
-    # Implicit wait time (seconds)
-    IMPLICIT_WAIT = 10
+    # Implicit wait time (seconds) - 0 în modul de sincronizare explicit (SYNC_MODE)
+    SYNC_MODE = sync_mode()
+    IMPLICIT_WAIT = implicit_wait_seconds()
 
     # Explicit wait time (seconds)
     EXPLICIT_WAIT = 20
@@ -158,16 +560,55 @@ class DriverConfig:
 
     # Browser settings
     BROWSER = "chrome"
-    HEADLESS = False
+    HEADLESS = os.environ.get("HEADLESS", "").lower() in ("1", "true", "yes")
     MAXIMIZE_WINDOW = True
 
+    # Profil implicit: fast, fidelity sau perf-measure (suprascris per scenariu cu @profile-<nume>)
+    PROFILE = os.environ.get("BROWSER_PROFILE", "fidelity")
+
+    # Driver pool settings (suprascrise prin variabile de mediu)
+    POOL_SIZE = int(os.environ.get("DRIVER_POOL_SIZE", "1"))
+    POOL_MAX_LEASES = int(os.environ.get("DRIVER_POOL_MAX_LEASES", "20"))
+
+    # Cât are driver.quit() la dispoziție înainte ca procesele să fie oprite forțat (seconds)
+    QUIT_DEADLINE = float(os.environ.get("DRIVER_QUIT_DEADLINE", "10"))
+
     # URL settings
     BASE_URL = "https://www.google.co.in"
 
     @classmethod
-    def get_driver(cls):
-        """Convenience method pentru a obține driver cu configurații default"""
+    def create_driver(cls, profile=None, network_events=None):
+        """
+        Creează un driver nou cu configurațiile default
+
+        Args:
+            profile (str): Numele profilului (implicit PROFILE)
+            network_events (bool): Log-ul 'performance' (implicit doar cu NETWORK_EVENTS=1)
+        """
         return DriverFactory.get_chrome_driver(
             headless=cls.HEADLESS,
-            maximize=cls.MAXIMIZE_WINDOW
+            maximize=cls.MAXIMIZE_WINDOW,
+            profile=get_profile(profile or cls.PROFILE),
+            network_events=network_events
         )
+
+    @classmethod
+    def create_pool(cls):
+        """
+        Creează DriverPool-ul cu configurațiile default
+
+        Un singur pool pentru toate profilurile: POOL_SIZE limitează numărul
+        total de browsere deschise, indiferent de profil sau evenimente de rețea.
+        """
+        return DriverPool(
+            size=cls.POOL_SIZE,
+            max_leases=cls.POOL_MAX_LEASES,
+            driver_builder=cls.create_driver,
+            default_profile=cls.PROFILE,
+            reaper=get_reaper(cls.QUIT_DEADLINE)
+        )
+
+    @classmethod
+    def get_driver(cls):
+        """Convenience method pentru a obține driver cu configurații default"""
+        return cls.create_driver()
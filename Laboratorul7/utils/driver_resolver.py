@@ -0,0 +1,328 @@
+"""
+Rezolvare offline a căii către ChromeDriver.
+Păstrează un manifest versionat pe disc care leagă versiunea Chrome instalată
+de calea unui chromedriver verificat, astfel încât după prima rezolvare
+pornirea driver-ului nu mai are nevoie de rețea.
+"""
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import threading
+import time
+from datetime import datetime
+
+
+MANIFEST_SCHEMA = 1
+
+DEFAULT_MANIFEST_PATH = os.path.join(
+    os.path.expanduser("~"), ".wdm", "chromedriver-manifest.json"
+)
+
+
+def chromedriver_executable_name():
+    """Numele executabilului chromedriver pentru platforma curentă"""
+    return "chromedriver.exe" if platform.system() == "Windows" else "chromedriver"
+
+
+class DriverResolution:
+    """Rezultatul unei rezolvări de ChromeDriver"""
+
+    def __init__(self, path, chrome_version, source, elapsed):
+        """
+        Args:
+            path (str): Calea absolută către chromedriver
+            chrome_version (str): Versiunea Chrome pentru care a fost rezolvat
+            source (str): De unde provine calea ('memory', 'manifest', 'local', 'download')
+            elapsed (float): Durata rezolvării în secunde
+        """
+        self.path = path
+        self.chrome_version = chrome_version
+        self.source = source
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return (f"DriverResolution(path={self.path!r}, chrome_version={self.chrome_version!r}, "
+                f"source={self.source!r}, elapsed={self.elapsed:.4f})")
+
+
+class ChromeDriverResolver:
+    """Rezolvă calea către ChromeDriver folosind un manifest pe disc"""
+
+    # Rezolvări deja făcute în procesul curent, per manifest
+    _memory = {}
+    _memory_lock = threading.Lock()
+
+    def __init__(self, manifest_path=None, local_paths=None):
+        """
+        Inițializează resolver-ul
+
+        Args:
+            manifest_path (str): Calea manifestului (implicit ~/.wdm/chromedriver-manifest.json
+                                 sau variabila de mediu CHROMEDRIVER_MANIFEST)
+            local_paths (list): Căi locale verificate înainte de descărcare
+        """
+        self.manifest_path = (
+            manifest_path
+            or os.environ.get("CHROMEDRIVER_MANIFEST")
+            or DEFAULT_MANIFEST_PATH
+        )
+        executable = chromedriver_executable_name()
+        self.local_paths = local_paths or [
+            os.path.join("drivers", executable),
+            executable,
+        ]
+
+    def resolve(self):
+        """
+        Returnează calea către un chromedriver compatibil cu Chrome-ul instalat
+
+        Returns:
+            DriverResolution: Calea, versiunea Chrome, sursa și durata rezolvării
+        """
+        start = time.perf_counter()
+
+        chrome_binary = self.find_chrome_binary()
+        fingerprint = self._fingerprint(chrome_binary)
+
+        with self._memory_lock:
+            cached = self._memory.get((self.manifest_path, fingerprint))
+        if cached and self._is_valid_driver(cached["path"], cached.get("size")):
+            return self._finish(cached["path"], cached["chrome_version"], "memory", start)
+
+        manifest = self._load_manifest()
+
+        # Căutare în timp constant: amprenta binarului Chrome -> versiune -> driver
+        chrome_version = manifest["binaries"].get(fingerprint) if fingerprint else None
+        if chrome_version:
+            entry = manifest["drivers"].get(chrome_version)
+            if entry and self._is_valid_driver(entry["path"], entry.get("size")):
+                self._remember(fingerprint, entry, chrome_version)
+                return self._finish(entry["path"], chrome_version, "manifest", start)
+
+        # Amprenta s-a schimbat (Chrome actualizat) - detectează versiunea
+        chrome_version = self.detect_chrome_version(chrome_binary) or "unknown"
+        entry = manifest["drivers"].get(chrome_version)
+        source = "manifest"
+        if not (entry and self._is_valid_driver(entry["path"], entry.get("size"))):
+            path, source = self._locate_driver(chrome_version)
+            entry = {
+                "path": path,
+                "size": os.path.getsize(path),
+                "driver_version": self.detect_driver_version(path),
+                "verified_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            manifest["drivers"][chrome_version] = entry
+
+        if fingerprint:
+            manifest["binaries"][fingerprint] = chrome_version
+        self._save_manifest(manifest)
+        self._remember(fingerprint, entry, chrome_version)
+
+        return self._finish(entry["path"], chrome_version, source, start)
+
+    # ------------------------------------------------------------------
+    # Chrome
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def find_chrome_binary():
+        """
+        Găsește executabilul Chrome instalat
+
+        Returns:
+            str: Calea către Chrome sau None
+        """
+        env_binary = os.environ.get("CHROME_BINARY")
+        if env_binary and os.path.isfile(env_binary):
+            return env_binary
+
+        system = platform.system()
+        if system == "Windows":
+            candidates = [
+                os.path.join(os.environ.get(var, ""), "Google", "Chrome", "Application", "chrome.exe")
+                for var in ("PROGRAMFILES", "PROGRAMFILES(X86)", "LOCALAPPDATA")
+                if os.environ.get(var)
+            ]
+        elif system == "Darwin":
+            candidates = ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"]
+        else:
+            candidates = [
+                shutil.which(name)
+                for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser")
+            ]
+
+        for candidate in candidates:
+            if candidate and os.path.isfile(candidate):
+                return candidate
+        return None
+
+    @staticmethod
+    def detect_chrome_version(chrome_binary):
+        """
+        Detectează versiunea Chrome instalată
+
+        Args:
+            chrome_binary (str): Calea către Chrome
+
+        Returns:
+            str: Versiunea (ex: '120.0.6099.109') sau None
+        """
+        if platform.system() == "Windows":
+            try:
+                import winreg
+                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon") as key:
+                    return winreg.QueryValueEx(key, "version")[0]
+            except Exception:
+                return None
+
+        if not chrome_binary:
+            return None
+        try:
+            output = subprocess.run(
+                [chrome_binary, "--version"],
+                capture_output=True, text=True, timeout=10
+            ).stdout
+        except Exception:
+            return None
+        match = re.search(r"(\d+\.\d+\.\d+\.\d+)", output)
+        return match.group(1) if match else None
+
+    # ------------------------------------------------------------------
+    # ChromeDriver
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def detect_driver_version(driver_path):
+        """
+        Obține versiunea unui chromedriver rulând `chromedriver --version`
+
+        Args:
+            driver_path (str): Calea către chromedriver
+
+        Returns:
+            str: Versiunea sau None dacă executabilul nu rulează
+        """
+        try:
+            output = subprocess.run(
+                [driver_path, "--version"],
+                capture_output=True, text=True, timeout=10
+            ).stdout
+        except Exception:
+            return None
+        match = re.search(r"ChromeDriver (\d+\.\d+\.\d+\.\d+)", output)
+        return match.group(1) if match else None
+
+    def _locate_driver(self, chrome_version):
+        """Caută un driver compatibil local, apoi îl descarcă (o singură dată)"""
+        candidates = list(self.local_paths)
+        on_path = shutil.which(chromedriver_executable_name())
+        if on_path:
+            candidates.append(on_path)
+
+        for candidate in candidates:
+            if os.path.isfile(candidate) and self._matches_chrome(candidate, chrome_version):
+                print(f"[OK] Found ChromeDriver at: {candidate}")
+                return os.path.abspath(candidate), "local"
+
+        print("[INFO] Using webdriver-manager to download ChromeDriver (first resolve only)...")
+        from webdriver_manager.chrome import ChromeDriverManager
+        installed = ChromeDriverManager().install()
+        path = self._find_executable(installed)
+        if path is None or not self._matches_chrome(path, chrome_version):
+            raise Exception(f"ChromeDriver not found or not runnable near {installed}")
+        return path, "download"
+
+    @staticmethod
+    def _find_executable(installed_path):
+        """
+        webdriver-manager poate returna un fișier vecin (ex: THIRD_PARTY_NOTICES);
+        caută executabilul corect în același director
+        """
+        executable = chromedriver_executable_name()
+        if os.path.basename(installed_path) == executable:
+            return installed_path
+
+        directory = installed_path if os.path.isdir(installed_path) else os.path.dirname(installed_path)
+        for root, _, files in os.walk(directory):
+            if executable in files:
+                path = os.path.join(root, executable)
+                if platform.system() != "Windows":
+                    os.chmod(path, 0o755)
+                return path
+        return None
+
+    def _matches_chrome(self, driver_path, chrome_version):
+        """Verifică faptul că driver-ul rulează și are aceeași versiune majoră ca Chrome"""
+        driver_version = self.detect_driver_version(driver_path)
+        if driver_version is None:
+            return False
+        if chrome_version in (None, "unknown"):
+            return True
+        return driver_version.split(".")[0] == chrome_version.split(".")[0]
+
+    @staticmethod
+    def _is_valid_driver(path, expected_size):
+        """Verificare ieftină (fără subprocess) că driver-ul din manifest există încă"""
+        try:
+            return os.path.isfile(path) and (expected_size is None or os.path.getsize(path) == expected_size)
+        except OSError:
+            return False
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _fingerprint(chrome_binary):
+        """Amprenta binarului Chrome - se schimbă la fiecare actualizare"""
+        if not chrome_binary:
+            return None
+        try:
+            stat = os.stat(chrome_binary)
+        except OSError:
+            return None
+        return f"{chrome_binary}|{int(stat.st_mtime)}|{stat.st_size}"
+
+    def _load_manifest(self):
+        """Încarcă manifestul (sau unul gol dacă lipsește / are altă schemă)"""
+        empty = {"schema": MANIFEST_SCHEMA, "binaries": {}, "drivers": {}}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return empty
+        if manifest.get("schema") != MANIFEST_SCHEMA:
+            return empty
+        manifest.setdefault("binaries", {})
+        manifest.setdefault("drivers", {})
+        return manifest
+
+    def _save_manifest(self, manifest):
+        """Salvează manifestul atomic (scriere în fișier temporar + replace)"""
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path) or ".", exist_ok=True)
+            tmp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            print(f"[WARNING] Could not save ChromeDriver manifest: {e}")
+
+    def _remember(self, fingerprint, entry, chrome_version):
+        """Păstrează rezultatul în memorie pentru lansările următoare din proces"""
+        with self._memory_lock:
+            self._memory[(self.manifest_path, fingerprint)] = {
+                "path": entry["path"],
+                "size": entry.get("size"),
+                "chrome_version": chrome_version,
+            }
+
+    @staticmethod
+    def _finish(path, chrome_version, source, start):
+        """Construiește rezultatul și raportează durata rezolvării"""
+        elapsed = time.perf_counter() - start
+        print(f"[OK] ChromeDriver resolved from {source} in {elapsed * 1000:.1f} ms: {path}")
+        return DriverResolution(path, chrome_version, source, elapsed)
@@ -0,0 +1,108 @@
+"""
+Vizibilitate și text pentru o listă întreagă de elemente, într-o singură cerere.
+WebElement.is_displayed() injectează atomul isDisplayed al Selenium la fiecare
+apel, iar .text este încă o cerere, deci o listă de N elemente costă 2N cereri.
+Aici același atom (isDisplayed.js din pachetul selenium) este rulat o singură
+dată pentru toate elementele, împreună cu textul vizibil și geometria lor.
+"""
+import pkgutil
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from utils.wait_conditions import as_locator
+
+
+_displayed_atom = None
+
+BATCH_SCRIPT = """
+var isDisplayed = __IS_DISPLAYED__;
+var target = arguments[0], attributes = arguments[1] || [];
+var elements = typeof target === 'string' ? Array.from(document.querySelectorAll(target)) : target;
+return elements.map(function (el) {
+    try {
+        var displayed = !!isDisplayed(el);
+        var r = el.getBoundingClientRect();
+        var info = {
+            displayed: displayed,
+            // Ca WebElement.text: elementele ascunse nu au text vizibil
+            text: displayed ? (el.innerText || '').trim() : '',
+            x: r.left + window.scrollX, y: r.top + window.scrollY,
+            width: r.width, height: r.height,
+            attributes: {}
+        };
+        attributes.forEach(function (name) {
+            var value = el[name];
+            info.attributes[name] = value === undefined || value === null ? el.getAttribute(name) : value;
+        });
+        return info;
+    } catch (e) {
+        // Element detașat între găsire și inspectare
+        return null;
+    }
+});
+"""
+
+
+def displayed_atom():
+    """
+    Atomul isDisplayed folosit de WebElement.is_displayed()
+
+    Returns:
+        str: Funcția JavaScript a atomului
+    """
+    global _displayed_atom
+    if _displayed_atom is None:
+        _displayed_atom = pkgutil.get_data("selenium.webdriver.remote", "isDisplayed.js").decode("utf8")
+    return _displayed_atom
+
+
+def batch_script():
+    """
+    Scriptul de inspectare cu atomul isDisplayed inclus
+
+    Returns:
+        str: Scriptul pentru execute_script
+    """
+    return BATCH_SCRIPT.replace("__IS_DISPLAYED__", displayed_atom())
+
+
+def inspect_elements(driver, target, attributes=()):
+    """
+    Vizibilitatea, textul vizibil și geometria tuturor elementelor, într-o singură cerere
+
+    Args:
+        driver: WebDriver instance
+        target: Listă de WebElement, tuple (By, value) sau selector CSS
+            (locatorii CSS sunt rezolvați în același script)
+        attributes (tuple): Proprietăți / atribute citite suplimentar (ex: ('src',))
+
+    Returns:
+        List[dict]: Câte un dict per element (displayed, text, x, y, width, height,
+        attributes); None pentru elementele detașate între timp
+    """
+    if not isinstance(target, (list, tuple)) or (len(target) == 2 and isinstance(target[0], str)):
+        by, value = as_locator(target)
+        target = value if by == By.CSS_SELECTOR else driver.find_elements(by, value)
+    if not target:
+        return []
+    try:
+        return driver.execute_script(batch_script(), target, list(attributes)) or []
+    except WebDriverException as e:
+        print(f"[WARNING] Batch element inspection failed: {e}")
+        return []
+
+
+def visible_texts(driver, target):
+    """
+    Textele elementelor vizibile (în ordinea din pagină), fără cele goale
+
+    Args:
+        driver: WebDriver instance
+        target: Listă de WebElement, tuple (By, value) sau selector CSS
+
+    Returns:
+        List[str]: Textele vizibile
+    """
+    return [info["text"] for info in inspect_elements(driver, target)
+            if info and info["displayed"] and info["text"]]
@@ -3,15 +3,15 @@ Helper functions pentru testele automate.
 Include funcții generice pentru așteptare, screenshot, validare date, etc.
 """
 import os
-import time
 from datetime import datetime
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
-    NoSuchElementException,
     StaleElementReferenceException
 )
+from utils.browser_wait import browser_wait
+from utils.wait_conditions import scroll_settled, wait_until
 
 
 class WaitHelpers:
@@ -30,14 +30,12 @@ class WaitHelpers:
         Returns:
             WebElement sau None
         """
-        try:
-            element = WebDriverWait(driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
-            return element
-        except TimeoutException:
+        # O singură cerere: condiția este urmărită în pagină (MutationObserver)
+        element = browser_wait(driver, "visible", locator, timeout)
+        if not element:
             print(f"Element {locator} not visible after {timeout} seconds")
             return None
+        return element
 
     @staticmethod
     def wait_for_element_clickable(driver, locator, timeout=20):
@@ -52,14 +50,12 @@ class WaitHelpers:
         Returns:
             WebElement sau None
         """
-        try:
-            element = WebDriverWait(driver, timeout).until(
-                EC.element_to_be_clickable(locator)
-            )
-            return element
-        except TimeoutException:
+        # O singură cerere: condiția este urmărită în pagină (MutationObserver)
+        element = browser_wait(driver, "clickable", locator, timeout)
+        if not element:
             print(f"Element {locator} not clickable after {timeout} seconds")
             return None
+        return element
 
     @staticmethod
     def wait_for_element_present(driver, locator, timeout=20):
@@ -74,14 +70,12 @@ class WaitHelpers:
         Returns:
             WebElement sau None
         """
-        try:
-            element = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
-            return element
-        except TimeoutException:
+        # O singură cerere: condiția este urmărită în pagină (MutationObserver)
+        element = browser_wait(driver, "present", locator, timeout)
+        if not element:
             print(f"Element {locator} not present after {timeout} seconds")
             return None
+        return element
 
     @staticmethod
     def wait_for_elements_present(driver, locator, timeout=20):
@@ -119,14 +113,10 @@ class WaitHelpers:
         Returns:
             bool
         """
-        try:
-            WebDriverWait(driver, timeout).until(
-                EC.text_to_be_present_in_element(locator, text)
-            )
+        if browser_wait(driver, "text", locator, timeout, text=text):
             return True
-        except TimeoutException:
-            print(f"Text '{text}' not found in element {locator} after {timeout} seconds")
-            return False
+        print(f"Text '{text}' not found in element {locator} after {timeout} seconds")
+        return False
 
     @staticmethod
     def wait_for_url_contains(driver, url_fragment, timeout=20):
@@ -141,14 +131,28 @@ class WaitHelpers:
         Returns:
             bool
         """
-        try:
-            WebDriverWait(driver, timeout).until(
-                EC.url_contains(url_fragment)
-            )
+        if browser_wait(driver, "url_contains", timeout=timeout, text=url_fragment):
             return True
-        except TimeoutException:
-            print(f"URL does not contain '{url_fragment}' after {timeout} seconds")
-            return False
+        print(f"URL does not contain '{url_fragment}' after {timeout} seconds")
+        return False
+
+    @staticmethod
+    def wait_for_element_invisible(driver, locator, timeout=20):
+        """
+        Așteaptă ca un element să dispară (ascuns sau eliminat din DOM)
+
+        Args:
+            driver: WebDriver instance
+            locator: Tuple (By, value)
+            timeout: Timeout în secunde
+
+        Returns:
+            bool
+        """
+        if browser_wait(driver, "invisible", locator, timeout):
+            return True
+        print(f"Element {locator} still visible after {timeout} seconds")
+        return False
 
 
 class ElementHelpers:
@@ -239,13 +243,7 @@ class ElementHelpers:
         Returns:
             bool
         """
-        try:
-            WebDriverWait(driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
-            return True
-        except TimeoutException:
-            return False
+        return bool(browser_wait(driver, "visible", locator, timeout))
 
     @staticmethod
     def is_element_present(driver, locator):
@@ -259,11 +257,8 @@ class ElementHelpers:
         Returns:
             bool
         """
-        try:
-            driver.find_element(*locator)
-            return True
-        except NoSuchElementException:
-            return False
+        # find_elements nu aruncă excepție; cu implicit wait 0 absența se vede imediat
+        return len(driver.find_elements(*locator)) > 0
 
 
 class ScreenshotHelpers:
@@ -426,9 +421,11 @@ class ScrollHelpers:
             locator: Tuple (By, value)
         """
         try:
-            element = driver.find_element(*locator)
+            element = WaitHelpers.wait_for_element_present(driver, locator, timeout=10)
+            if element is None:
+                return
             driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(0.5)  # Așteaptă stabilizarea
+            wait_until(driver, scroll_settled(element), timeout=2)
         except Exception as e:
             print(f"Error scrolling to element: {e}")
 
@@ -441,7 +438,7 @@ class ScrollHelpers:
             driver: WebDriver instance
         """
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(0.5)
+        wait_until(driver, scroll_settled(), timeout=2)
 
     @staticmethod
     def scroll_to_top(driver):
@@ -452,4 +449,4 @@ class ScrollHelpers:
             driver: WebDriver instance
         """
         driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(0.5)
+        wait_until(driver, scroll_settled(), timeout=2)
@@ -0,0 +1,121 @@
+"""
+Rezolvarea lanțurilor de locatori alternativi (ex: GOOGLE_LOGO, GOOGLE_LOGO_ALTERNATIVE...).
+În loc să încerce fiecare alternativă pe rând, cu câte un timeout, toți candidații
+sunt verificați în aceeași interogare din pagină (browser_wait_any) și se întoarce
+primul găsit. Alternativa câștigătoare este reținută pe disc și încercată prima
+la rularea următoare (LOCATOR_ORDER_CACHE, implicit reports/locator_order.json).
+"""
+import json
+import os
+import threading
+
+from utils.browser_wait import browser_wait_any
+from utils.wait_conditions import as_locator
+
+
+DEFAULT_ORDER_PATH = os.path.join("reports", "locator_order.json")
+
+
+def _locator_key(locator):
+    """Cheia unui locator în fișierul de ordine (ex: 'css selector=a.gL9Hy')"""
+    by, value = as_locator(locator)
+    return f"{by}={value}"
+
+
+class LocatorResolver:
+    """Alege primul locator găsit dintr-un lanț și învață ordinea alternativelor"""
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str): Fișierul JSON (implicit LOCATOR_ORDER_CACHE sau reports/locator_order.json)
+        """
+        self.path = path or os.environ.get("LOCATOR_ORDER_CACHE", DEFAULT_ORDER_PATH)
+        self._winners = self._load()
+        self._changed = set()
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def ordered(self, chain, locators):
+        """
+        Locatorii lanțului, cu alternativa câștigătoare ultima dată pe primul loc
+
+        Args:
+            chain (str): Numele lanțului (ex: 'google_logo')
+            locators (list): Alternativele, în ordinea declarată
+
+        Returns:
+            list: Locatorii reordonați
+        """
+        with self._lock:
+            winner = self._winners.get(chain)
+        locators = list(locators)
+        for index, locator in enumerate(locators):
+            if _locator_key(locator) == winner:
+                return [locator] + locators[:index] + locators[index + 1:]
+        return locators
+
+    def resolve(self, driver, chain, locators, timeout=5, kind="visible"):
+        """
+        Primul element care îndeplinește condiția, căutat într-o singură interogare
+
+        Args:
+            driver: WebDriver instance
+            chain (str): Numele lanțului (cheia în fișierul de ordine)
+            locators (list): Alternativele, în ordinea declarată
+            timeout (float): Timeout în secunde pentru tot lanțul
+            kind (str): 'present', 'visible' sau 'clickable'
+
+        Returns:
+            tuple: (WebElement, locatorul câștigător) sau (None, None)
+        """
+        candidates = self.ordered(chain, locators)
+        element, index = browser_wait_any(driver, kind, candidates, timeout)
+        if not element or index is None:
+            return None, None
+
+        locator = candidates[index]
+        key = _locator_key(locator)
+        with self._lock:
+            if self._winners.get(chain) != key:
+                self._winners[chain] = key
+                self._changed.add(chain)
+        return element, locator
+
+    def save(self):
+        """Scrie ordinea învățată pe disc (atomic), păstrând lanțurile altor procese"""
+        with self._lock:
+            if not self._changed:
+                return
+            changes = {chain: self._winners[chain] for chain in self._changed}
+            self._changed.clear()
+        data = self._load()
+        data.update(changes)
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[WARNING] Could not save locator order: {e}")
+
+
+_resolver = None
+_resolver_lock = threading.Lock()
+
+
+def get_locator_resolver():
+    """Resolver-ul comun al procesului"""
+    global _resolver
+    with _resolver_lock:
+        if _resolver is None:
+            _resolver = LocatorResolver()
+        return _resolver
@@ -0,0 +1,276 @@
+"""
+Evenimentele de rețea ale browser-ului (CDP Network.* / Page.*).
+ChromeDriver înregistrează evenimentele DevTools în log-ul 'performance'
+(capabilitatea goog:loggingPrefs). Log-ul se golește la fiecare citire, așa
+că toate componentele care au nevoie de evenimente (blocarea cererilor,
+rapoartele de rețea) citesc din același buffer, atașat driver-ului.
+"""
+import json
+import os
+import threading
+import weakref
+
+from selenium.common.exceptions import WebDriverException
+
+
+# Capabilitatea care pornește log-ul DevTools în ChromeDriver
+PERFORMANCE_LOGGING_PREFS = {"performance": "ALL"}
+
+# Domeniile DevTools păstrate în buffer (restul sunt ignorate)
+TRACKED_DOMAINS = ("Network.", "Page.")
+
+# Tag-ul prin care un scenariu cere evenimentele de rețea (statusuri HTTP, cereri eșuate)
+NETWORK_EVENTS_TAG = "network-events"
+
+
+def is_blocked_failure(params):
+    """True dacă un Network.loadingFailed vine din blocarea intenționată a cererii"""
+    return params.get("blockedReason") == "inspector" \
+        or params.get("errorText") == "net::ERR_BLOCKED_BY_CLIENT"
+
+
+def enable_performance_logging(options):
+    """
+    Activează log-ul 'performance' în opțiunile Chrome
+
+    Args:
+        options: ChromeOptions
+    """
+    options.set_capability("goog:loggingPrefs", PERFORMANCE_LOGGING_PREFS)
+
+
+def network_events_requested(tags=(), block_rulesets=()):
+    """
+    Log-ul 'performance' adaugă overhead la fiecare cerere, așa că se activează doar la cerere
+
+    Args:
+        tags (list): Tag-urile efective ale scenariului (@network-events)
+        block_rulesets (list): Seturile de blocare active (raportul lor vine din evenimente)
+
+    Returns:
+        bool: True pentru NETWORK_EVENTS=1, tag-ul @network-events sau blocarea cererilor
+    """
+    if os.environ.get("NETWORK_EVENTS", "").lower() in ("1", "true", "yes"):
+        return True
+    return NETWORK_EVENTS_TAG in tags or bool(block_rulesets)
+
+
+class NetworkEvent:
+    """Un eveniment DevTools din log-ul 'performance'"""
+
+    __slots__ = ("timestamp", "method", "params")
+
+    def __init__(self, timestamp, method, params):
+        """
+        Args:
+            timestamp (int): Momentul înregistrării (ms, ceasul ChromeDriver)
+            method (str): Numele evenimentului (ex: 'Network.loadingFailed')
+            params (dict): Parametrii evenimentului
+        """
+        self.timestamp = timestamp
+        self.method = method
+        self.params = params
+
+    def __repr__(self):
+        return f"NetworkEvent({self.method!r})"
+
+
+class FailedRequest:
+    """O cerere eșuată: status HTTP >= 400 sau eroare de rețea"""
+
+    __slots__ = ("url", "status", "error", "resource_type")
+
+    def __init__(self, url, status=None, error=None, resource_type=None):
+        """
+        Args:
+            url (str): URL-ul cererii
+            status (int): Statusul HTTP (None pentru erori de rețea)
+            error (str): Eroarea de rețea (ex: 'net::ERR_CONNECTION_REFUSED')
+            resource_type (str): Tipul resursei (Document, Script, Image...)
+        """
+        self.url = url
+        self.status = status
+        self.error = error
+        self.resource_type = resource_type
+
+    def __repr__(self):
+        return f"FailedRequest({self.status or self.error} {self.url})"
+
+
+class NetworkEventBuffer:
+    """Evenimentele de rețea ale scenariului curent pentru un driver"""
+
+    def __init__(self, driver):
+        """
+        Args:
+            driver: WebDriver instance
+        """
+        # Referință slabă: buffer-ul nu ține în viață un driver închis
+        self._driver = weakref.ref(driver)
+        self.events = []
+        self._lock = threading.Lock()
+
+    @property
+    def driver(self):
+        """Driver-ul buffer-ului (None după ce a fost eliberat)"""
+        return self._driver()
+
+    def drain(self):
+        """
+        Mută evenimentele noi din log-ul ChromeDriver în buffer
+
+        Returns:
+            List[NetworkEvent]: Evenimentele noi
+        """
+        driver = self.driver
+        if driver is None:
+            return []
+        try:
+            entries = driver.get_log("performance")
+        except WebDriverException:
+            # Log-ul 'performance' nu este activat pentru acest driver
+            return []
+
+        new_events = []
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get("method", "")
+            if method.startswith(TRACKED_DOMAINS):
+                new_events.append(NetworkEvent(entry.get("timestamp"), method, message.get("params", {})))
+
+        with self._lock:
+            self.events.extend(new_events)
+        return new_events
+
+    def reset(self):
+        """Golește log-ul și buffer-ul (la începutul unui scenariu)"""
+        self.drain()
+        with self._lock:
+            self.events = []
+
+    def by_method(self, *methods):
+        """
+        Evenimentele din buffer cu metodele date
+
+        Args:
+            *methods (str): Ex: 'Network.responseReceived'
+
+        Returns:
+            List[NetworkEvent]: Evenimentele găsite, în ordine
+        """
+        with self._lock:
+            return [event for event in self.events if event.method in methods]
+
+    def request_urls(self):
+        """
+        URL-ul fiecărei cereri din buffer
+
+        Returns:
+            dict: requestId -> URL (din Network.requestWillBeSent)
+        """
+        return {
+            event.params.get("requestId"): event.params.get("request", {}).get("url")
+            for event in self.by_method("Network.requestWillBeSent")
+        }
+
+
+    def _main_document(self):
+        """
+        Parametrii Network.responseReceived ai ultimului document principal (fără iframe-uri)
+
+        Returns:
+            dict: Parametrii evenimentului sau None
+        """
+        # Cadrul principal este cel navigat fără parentId (iframe-urile au părinte)
+        main_frames = {
+            event.params.get("frame", {}).get("id")
+            for event in self.by_method("Page.frameNavigated")
+            if not event.params.get("frame", {}).get("parentId")
+        }
+        documents = [event.params for event in self.by_method("Network.responseReceived")
+                     if event.params.get("type") == "Document"]
+        for params in reversed(documents):
+            if not main_frames or params.get("frameId") in main_frames:
+                return params
+        return None
+
+    def main_document_response(self):
+        """
+        Răspunsul ultimului document principal încărcat (fără iframe-uri)
+
+        Returns:
+            dict: Parametrul 'response' din Network.responseReceived sau None
+        """
+        params = self._main_document()
+        return params.get("response") if params else None
+
+    def main_document_loader(self):
+        """
+        loaderId-ul ultimului document principal (comun documentului și resurselor lui)
+
+        Returns:
+            str: loaderId sau None
+        """
+        params = self._main_document()
+        return params.get("loaderId") if params else None
+
+    def failed_requests(self, loader_id=None):
+        """
+        Cererile eșuate din buffer (status >= 400 sau eroare de rețea)
+
+        Cererile blocate intenționat (RequestBlocker) și cele anulate nu sunt incluse.
+
+        Args:
+            loader_id (str): Doar cererile unei navigări (main_document_loader); None = tot buffer-ul
+
+        Returns:
+            List[FailedRequest]: Cererile eșuate, în ordine
+        """
+        urls = self.request_urls()
+        loaders = {
+            event.params.get("requestId"): event.params.get("loaderId")
+            for event in self.by_method("Network.requestWillBeSent")
+        }
+        failed = []
+        with self._lock:
+            events = list(self.events)
+        for event in events:
+            params = event.params
+            if loader_id is not None and loaders.get(params.get("requestId"), params.get("loaderId")) != loader_id:
+                continue
+            if event.method == "Network.responseReceived":
+                response = params.get("response", {})
+                status = int(response.get("status") or 0)
+                if status >= 400:
+                    failed.append(FailedRequest(response.get("url"), status, None, params.get("type")))
+            elif event.method == "Network.loadingFailed":
+                if params.get("canceled") or is_blocked_failure(params):
+                    continue
+                failed.append(FailedRequest(urls.get(params.get("requestId")), None,
+                                            params.get("errorText"), params.get("type")))
+        return failed
+
+
+_buffers = weakref.WeakKeyDictionary()
+_buffers_lock = threading.Lock()
+
+
+def network_events(driver):
+    """
+    Buffer-ul de evenimente al unui driver (creat la primul apel)
+
+    Args:
+        driver: WebDriver instance
+
+    Returns:
+        NetworkEventBuffer: Buffer-ul comun pentru driver
+    """
+    with _buffers_lock:
+        buffer = _buffers.get(driver)
+        if buffer is None:
+            buffer = NetworkEventBuffer(driver)
+            _buffers[driver] = buffer
+        return buffer
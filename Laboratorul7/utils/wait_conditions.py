@@ -0,0 +1,361 @@
+"""
+Condiții de așteptare cu nume și bugetul de așteptare al rulării.
+Pauzele fixe (time.sleep) sunt înlocuite cu așteptări care se termină imediat
+ce condiția este îndeplinită: schimbarea URL-ului, document.readyState,
+prezența unui element, redimensionarea observată de pagină, oprirea scroll-ului.
+Timpul petrecut în pauze fixe și în așteptări pe condiții este contabilizat
+per proces, scris în JSONL (ca profilul de pornire) și raportat la final.
+"""
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utils.startup_profiler import current_run_id, load_records
+
+
+DEFAULT_POLL_FREQUENCY = 0.1
+DEFAULT_BUDGET_LOG = os.path.join("reports", "wait_budget.jsonl")
+
+
+# Sincronizare: 'explicit' = implicit wait 0, toate așteptările sunt explicite
+# (verificările de absență se întorc imediat); 'implicit' = vechiul implicit wait de 10s
+SYNC_EXPLICIT = "explicit"
+SYNC_IMPLICIT = "implicit"
+IMPLICIT_WAIT_SECONDS = 10
+
+
+def sync_mode():
+    """
+    Modul de sincronizare ales cu variabila SYNC_MODE
+
+    Returns:
+        str: 'explicit' (implicit) sau 'implicit'
+    """
+    mode = os.environ.get("SYNC_MODE", SYNC_EXPLICIT).strip().lower() or SYNC_EXPLICIT
+    if mode not in (SYNC_EXPLICIT, SYNC_IMPLICIT):
+        raise ValueError(f"Unknown SYNC_MODE '{mode}'. Available: {SYNC_EXPLICIT}, {SYNC_IMPLICIT}")
+    return mode
+
+
+def implicit_wait_seconds():
+    """
+    Implicit wait-ul setat pe driver pentru modul de sincronizare curent
+
+    Returns:
+        int: 0 în modul explicit, IMPLICIT_WAIT_SECONDS în modul implicit
+    """
+    return 0 if sync_mode() == SYNC_EXPLICIT else IMPLICIT_WAIT_SECONDS
+
+_write_lock = threading.Lock()
+
+
+class Condition:
+    """O condiție de așteptare cu nume, folosită cu WebDriverWait"""
+
+    def __init__(self, name, predicate):
+        """
+        Args:
+            name (str): Numele condiției în raport (ex: 'url_changed')
+            predicate: Funcție driver -> valoare (falsy = încă nu e îndeplinită)
+        """
+        self.name = name
+        self.predicate = predicate
+
+    def __call__(self, driver):
+        return self.predicate(driver)
+
+    def __repr__(self):
+        return f"Condition({self.name!r})"
+
+
+def as_locator(locator):
+    """Acceptă atât tupluri (By, value) cât și selectori CSS"""
+    if isinstance(locator, str):
+        return (By.CSS_SELECTOR, locator)
+    return locator
+
+
+def url_changed(old_url):
+    """
+    URL-ul curent diferă de cel dinainte de acțiune
+
+    Args:
+        old_url (str): URL-ul înainte de click / submit
+    """
+    return Condition("url_changed", lambda driver: driver.current_url != old_url)
+
+
+def url_contains(fragment):
+    """
+    URL-ul curent conține un fragment
+
+    Args:
+        fragment (str): Ex: 'search?'
+    """
+    return Condition("url_contains", lambda driver: fragment in driver.current_url)
+
+
+def document_ready():
+    """document.readyState este 'complete'"""
+    return Condition(
+        "document_ready",
+        lambda driver: driver.execute_script("return document.readyState") == "complete",
+    )
+
+
+def element_present(*locators):
+    """
+    Cel puțin un element corespunde unuia dintre locatori
+
+    Args:
+        *locators: Tupluri (By, value) sau selectori CSS, încercați în ordine
+
+    Returns:
+        Condition: Valoarea condiției este lista de elemente găsite
+    """
+    locators = [as_locator(locator) for locator in locators]
+
+    def predicate(driver):
+        for by, value in locators:
+            elements = driver.find_elements(by, value)
+            if elements:
+                return elements
+        return False
+    return Condition("element_present", predicate)
+
+
+def viewport_resized(previous_size):
+    """
+    Pagina a observat noua dimensiune a ferestrei (innerWidth/innerHeight s-au schimbat)
+
+    Args:
+        previous_size (list): [innerWidth, innerHeight] citite înainte de redimensionare
+    """
+    def predicate(driver):
+        size = driver.execute_script("return [window.innerWidth, window.innerHeight];")
+        return list(size) != list(previous_size)
+    return Condition("viewport_resized", predicate)
+
+
+def scroll_settled(element=None):
+    """
+    Poziția de scroll (sau a elementului) nu s-a mai schimbat între două citiri
+
+    Args:
+        element: WebElement urmărit (None = poziția ferestrei)
+    """
+    last = {}
+
+    def predicate(driver):
+        if element is None:
+            position = driver.execute_script("return [window.scrollX, window.scrollY];")
+        else:
+            position = driver.execute_script(
+                "var r = arguments[0].getBoundingClientRect(); return [r.left, r.top];", element)
+        settled = last.get("position") == position
+        last["position"] = position
+        return settled
+    return Condition("scroll_settled", predicate)
+
+
+class WaitBudget:
+    """Timpul petrecut de proces în pauze fixe și în așteptări pe condiții"""
+
+    def __init__(self):
+        self.sleeps = 0
+        self.sleep_seconds = 0.0
+        self.conditions = {}
+        self._lock = threading.Lock()
+
+    def record_sleep(self, seconds):
+        """
+        Contabilizează o pauză fixă
+
+        Args:
+            seconds (float): Durata pauzei
+        """
+        with self._lock:
+            self.sleeps += 1
+            self.sleep_seconds += seconds
+
+    def record_condition(self, name, seconds, satisfied):
+        """
+        Contabilizează o așteptare pe condiție
+
+        Args:
+            name (str): Numele condiției
+            seconds (float): Cât a durat așteptarea
+            satisfied (bool): False dacă a expirat timeout-ul
+        """
+        with self._lock:
+            stats = self.conditions.setdefault(name, {"count": 0, "seconds": 0.0, "timeouts": 0})
+            stats["count"] += 1
+            stats["seconds"] += seconds
+            if not satisfied:
+                stats["timeouts"] += 1
+
+    def to_record(self):
+        """
+        Înregistrarea JSON a bugetului (pentru fișierul JSONL)
+
+        Returns:
+            dict: Totalurile procesului
+        """
+        with self._lock:
+            return {
+                "run_id": current_run_id(),
+                "timestamp": datetime.now().isoformat(timespec="milliseconds"),
+                "worker": os.environ.get("BEHAVE_WORKER_ID", "main"),
+                "pid": os.getpid(),
+                "sleeps": self.sleeps,
+                "sleep_seconds": round(self.sleep_seconds, 4),
+                "conditions": {
+                    name: dict(stats, seconds=round(stats["seconds"], 4))
+                    for name, stats in self.conditions.items()
+                },
+            }
+
+    def save(self, path=None):
+        """
+        Adaugă bugetul procesului în fișierul JSONL
+
+        Args:
+            path (str): Fișierul JSONL (implicit budget_log_path())
+
+        Returns:
+            dict: Înregistrarea scrisă
+        """
+        record = self.to_record()
+        path = path or budget_log_path()
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with _write_lock, open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"[WARNING] Could not write wait budget: {e}")
+        return record
+
+
+_budget = WaitBudget()
+
+
+def get_budget():
+    """Bugetul de așteptare al procesului curent"""
+    return _budget
+
+
+def budget_log_path():
+    """Fișierul JSONL cu bugetele (variabila WAIT_BUDGET_LOG sau implicit)"""
+    return os.environ.get("WAIT_BUDGET_LOG", DEFAULT_BUDGET_LOG)
+
+
+def pause(seconds):
+    """
+    Pauză fixă contabilizată în buget (pentru cazurile fără o condiție observabilă)
+
+    Args:
+        seconds (float): Durata pauzei
+    """
+    time.sleep(seconds)
+    _budget.record_sleep(seconds)
+
+
+def wait_until(driver, condition, timeout=10, poll_frequency=DEFAULT_POLL_FREQUENCY):
+    """
+    Așteaptă o condiție și contabilizează durata în buget
+
+    Args:
+        driver: WebDriver instance
+        condition (Condition): Condiția așteptată
+        timeout (float): Timeout în secunde
+        poll_frequency (float): Intervalul dintre verificări
+
+    Returns:
+        Valoarea condiției sau False dacă a expirat timeout-ul
+
+    Raises:
+        WebDriverException: Sesiune / fereastră închisă sau eroare în condiție
+    """
+    start = time.perf_counter()
+    timed_out = False
+    try:
+        # Un element înlocuit în timpul verificării înseamnă doar că pagina încă se schimbă
+        return WebDriverWait(driver, timeout, poll_frequency=poll_frequency,
+                             ignored_exceptions=(StaleElementReferenceException,)).until(condition)
+    except TimeoutException:
+        timed_out = True
+        return False
+    finally:
+        # Sesiunea închisă, fereastra închisă sau o eroare de script se propagă - nu sunt timeout-uri
+        _budget.record_condition(condition.name, time.perf_counter() - start, not timed_out)
+
+
+def merge_budgets(records):
+    """
+    Însumează bugetele mai multor procese (worker-i)
+
+    Args:
+        records (list): Înregistrările JSONL
+
+    Returns:
+        dict: 'sleeps', 'sleep_seconds' și 'conditions' însumate
+    """
+    total = {"sleeps": 0, "sleep_seconds": 0.0, "conditions": {}}
+    for record in records:
+        total["sleeps"] += record.get("sleeps", 0)
+        total["sleep_seconds"] += record.get("sleep_seconds", 0.0)
+        for name, stats in record.get("conditions", {}).items():
+            merged = total["conditions"].setdefault(name, {"count": 0, "seconds": 0.0, "timeouts": 0})
+            for key in merged:
+                merged[key] += stats.get(key, 0)
+    return total
+
+
+def print_budget_report(records, title="WAIT BUDGET"):
+    """
+    Afișează timpul petrecut în pauze fixe vs. așteptări pe condiții
+
+    Args:
+        records (list): Înregistrările bugetelor
+        title (str): Titlul tabelului
+    """
+    if not records:
+        return
+    total = merge_budgets(records)
+    condition_seconds = sum(stats["seconds"] for stats in total["conditions"].values())
+    condition_count = sum(stats["count"] for stats in total["conditions"].values())
+
+    print(f"\n{'='*80}")
+    print(f"{title} ({len(records)} process(es))")
+    print(f"{'='*80}")
+    print(f"{'Wait':<28}{'Count':>8}{'Total (s)':>14}{'Avg (ms)':>14}{'Timeouts':>14}")
+    print("-"*80)
+    print(f"{'sleep (fixed)':<28}{total['sleeps']:>8}{total['sleep_seconds']:>14.2f}"
+          f"{total['sleep_seconds'] * 1000 / max(total['sleeps'], 1):>14.1f}{'-':>14}")
+    for name, stats in sorted(total["conditions"].items(), key=lambda item: -item[1]["seconds"]):
+        print(f"{name:<28}{stats['count']:>8}{stats['seconds']:>14.2f}"
+              f"{stats['seconds'] * 1000 / max(stats['count'], 1):>14.1f}{stats['timeouts']:>14}")
+    print("-"*80)
+    print(f"Sleeping: {total['sleep_seconds']:.2f}s | Waiting on conditions: {condition_seconds:.2f}s "
+          f"({condition_count} wait(s))")
+    print(f"{'='*80}\n")
+
+
+def load_budgets(path=None, run_id=None):
+    """
+    Citește bugetele din fișierul JSONL
+
+    Args:
+        path (str): Fișierul JSONL (implicit budget_log_path())
+        run_id (str): Doar bugetele unei rulări (None = toate)
+
+    Returns:
+        list: Înregistrările găsite
+    """
+    return load_records(path or budget_log_path(), run_id)